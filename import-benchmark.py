@@ -0,0 +1,53 @@
+#! /usr/bin/python
+
+from argparse import ArgumentParser
+import statistics
+import subprocess
+import sys
+
+IMPORT_SCRIPT = """
+import time
+begin = time.perf_counter()
+import ks_engine
+print(time.perf_counter() - begin)
+"""
+
+
+def measure_import_time(count):
+    output = []
+    for _ in range(count):
+        out = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        output.append(float(out.stdout))
+    return output
+
+
+def parse_args():
+    parser = ArgumentParser(description="Measure 'import ks_engine' time")
+    parser.add_argument("-n", "--count", type=int, default=10)
+    parser.add_argument(
+        "-m",
+        "--max-time",
+        type=float,
+        default=None,
+        help="Fail if the median import time, in seconds, is larger",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    times = measure_import_time(args.count)
+    median = statistics.median(times)
+    print(f"import ks_engine: median {median:.4f}s min {min(times):.4f}s")
+    if args.max_time is not None and median > args.max_time:
+        print(f"Import time regression: {median:.4f}s > {args.max_time}s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
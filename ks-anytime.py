@@ -0,0 +1,106 @@
+#! /usr/bin/python
+
+from argparse import ArgumentParser
+import math
+
+from ks_engine.anytime import (
+    AnytimeReport,
+    oriented,
+    performance_profile,
+    timeline_from_file,
+    timelines_from_store,
+)
+from ks_engine.results_store import ResultsStore
+
+DEF_GAPS = [0.01, 0.001]
+
+
+def parse_args():
+    parser = ArgumentParser(
+        description="Rank configurations by primal integral and time to target"
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="Progress streams or debug CSV files stored as <config>/<instance>.<ext>",
+    )
+    parser.add_argument("-d", "--database", help="SQLite results file (RESULTS_DB)")
+    parser.add_argument(
+        "-i", "--instance", default="%", help="Instance name, SQL LIKE pattern"
+    )
+    parser.add_argument(
+        "-g",
+        "--gap",
+        type=float,
+        action="append",
+        help=f"Relative gap of the time to target, repeatable, default {DEF_GAPS}",
+    )
+    parser.add_argument(
+        "-M",
+        "--maximize",
+        default=False,
+        action="store_true",
+        help="Maximization instances, for files only: stored runs keep their sense",
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        default=False,
+        action="store_true",
+        help="Plot the performance profiles",
+    )
+    parser.add_argument("-o", "--output-file", default=None)
+    return parser.parse_args()
+
+
+def load_timelines(args):
+    minimize = not args.maximize
+    output = [oriented(timeline_from_file(f, minimize), minimize) for f in args.files]
+    if args.database:
+        store = ResultsStore(args.database)
+        output += timelines_from_store(store, args.instance)
+        store.close()
+    return output
+
+
+def print_table(report, gaps):
+    print(",".join(report.table_header(gaps)))
+    for row in report.table(gaps):
+        print(",".join(str(field) for field in row))
+
+
+def plot_profiles(report, gaps, output_file):
+    # matplotlib is slow to import: load it only when required
+    from matplotlib import pyplot as plt
+
+    measures = [("primal integral", report.primal_integrals())]
+    measures += [(f"time to {gap} gap", report.times_to_target(gap)) for gap in gaps]
+    _, axes = plt.subplots(1, len(measures), squeeze=False)
+    for axis, (title, measure) in zip(axes[0], measures):
+        for conf, ratios in performance_profile(measure).items():
+            finite = [r for r in ratios if not math.isinf(r)]
+            fractions = [(i + 1) / len(ratios) for i in range(len(finite))]
+            axis.step([1.0, *finite], [0.0, *fractions], where="post", label=conf)
+        axis.set_xscale("log")
+        axis.set_title(title)
+        axis.set_xlabel("ratio to best")
+    axes[0][0].set_ylabel("fraction of instances")
+    axes[0][0].legend()
+
+    if output_file:
+        plt.savefig(output_file)
+    else:
+        plt.show()
+
+
+def main():
+    args = parse_args()
+    gaps = args.gap or DEF_GAPS
+    report = AnytimeReport(load_timelines(args))
+    print_table(report, gaps)
+    if args.profile:
+        plot_profiles(report, gaps, args.output_file)
+
+
+if __name__ == "__main__":
+    main()
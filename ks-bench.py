@@ -0,0 +1,79 @@
+#! /usr/bin/python
+
+from argparse import ArgumentParser
+import sys
+
+from ks_engine.benchmark import (
+    BENCHMARKS,
+    DEF_REPEAT,
+    DEF_SIZES,
+    DEF_THRESHOLD,
+    compare,
+    load_results,
+    machine_info,
+    run_benchmarks,
+    save_results,
+)
+
+
+def parse_args():
+    parser = ArgumentParser(
+        description="Time ks_engine internals and check them against a baseline"
+    )
+    parser.add_argument(
+        "-b",
+        "--benchmark",
+        action="append",
+        choices=list(BENCHMARKS),
+        help="Benchmark to run, repeatable, all by default",
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        action="append",
+        type=int,
+        help=f"Number of variables, repeatable, default {DEF_SIZES}",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=DEF_REPEAT)
+    parser.add_argument("-o", "--output", help="Save the results as JSON")
+    parser.add_argument(
+        "-c", "--compare", help="Fail on regressions against this baseline JSON"
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=DEF_THRESHOLD,
+        help="Relative slowdown reported as a regression",
+    )
+    return parser.parse_args()
+
+
+def print_result(name, size, elapsed):
+    print(f"{name:<24}{size:>10}{elapsed:>12.6f}s")
+
+
+def main():
+    args = parse_args()
+    results = run_benchmarks(
+        args.benchmark, args.size or DEF_SIZES, args.repeat, print_result
+    )
+    if args.output:
+        save_results(args.output, results)
+
+    if args.compare:
+        baseline, machine = load_results(args.compare)
+        if machine != machine_info():
+            print("Warning: the baseline was recorded on a different machine")
+        regressions = compare(results, baseline, args.threshold)
+        for reg in regressions:
+            print(
+                f"Regression: {reg.name} [{reg.size}] "
+                f"{reg.baseline:.6f}s -> {reg.current:.6f}s"
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#! /usr/bin/python
+
+from argparse import ArgumentParser
+import json
+
+from ks_engine.config_loader import build_config
+from ks_engine.distributed import names_fingerprint, solve_task
+from ks_engine.model import model_loarder
+from ks_engine.sub_problem_capture import (
+    list_captures,
+    load_capture,
+    parse_param,
+    replay_task,
+)
+
+
+def parse_args():
+    parser = ArgumentParser(
+        description="Re-solve bucket sub problems captured by a ks.py run (CAPTURE)"
+    )
+    parser.add_argument("capture", nargs="+", help="Capture JSON file or directory")
+    parser.add_argument("-m", "--mps", help="Instance file, instead of the captured")
+    parser.add_argument(
+        "-p",
+        "--param",
+        action="append",
+        type=parse_param,
+        default=[],
+        help="Gurobi parameter as Name=Value, repeatable",
+    )
+    parser.add_argument("-t", "--time-limit", type=float, default=None)
+    parser.add_argument("--no-start", action="store_true", help="Drop the MIP start")
+    parser.add_argument("--no-cutoff", action="store_true", help="Drop the cutoff")
+    return parser.parse_args()
+
+
+def load_instance(models, mps_file, captured_conf):
+    key = (mps_file, json.dumps(captured_conf, sort_keys=True))
+    if key not in models:
+        conf = build_config(captured_conf)
+        model = model_loarder(mps_file, conf)
+        names = [var.varName for var in model.getVars()]
+        models[key] = (model, names, conf)
+    return models[key]
+
+
+def main():
+    args = parse_args()
+    params = dict(args.param)
+    models = {}
+    print(
+        "file,status,time,nodes,value,replay_status,replay_time,replay_nodes,replay_value"
+    )
+    for path in args.capture:
+        for file_name in list_captures(path):
+            capture = load_capture(file_name)
+            model, names, conf = load_instance(
+                models, args.mps or capture["instance"], capture["config"]
+            )
+            if names_fingerprint(names) != capture["names"]:
+                print(f"{file_name}: variables do not match the captured instance")
+                continue
+
+            task = replay_task(
+                capture, args.time_limit, not args.no_start, not args.no_cutoff
+            )
+            result = solve_task(model, conf, names, task, params)
+            value = result["solution"]["value"] if result["solution"] else None
+            old = capture["captured"]
+            print(
+                f"{file_name},{old['status']},{old['time']},{old['nodes']},"
+                f"{old['value']},{result['status']},{result['time']},"
+                f"{result['nodes']},{value}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#! /usr/bin/python
+
+from argparse import ArgumentParser
+import json
+
+from ks_engine.results_store import ResultsStore
+
+
+def parse_args():
+    parser = ArgumentParser(description="Query a ks.py results database")
+    parser.add_argument("database", help="SQLite results file (RESULTS_DB)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compare = commands.add_parser("compare", help="Compare configs on each instance")
+    compare.add_argument(
+        "-i", "--instance", default="%", help="Instance name, SQL LIKE pattern"
+    )
+
+    commands.add_parser("runs", help="List stored runs")
+
+    config = commands.add_parser("config", help="Show a stored configuration")
+    config.add_argument("hash", help="Configuration hash, or a prefix of it")
+
+    return parser.parse_args()
+
+
+def print_compare(store, instance):
+    print("instance,config,runs,best,mean,mean_time")
+    for name, conf, count, best, mean, mean_time in store.compare(instance):
+        print(f"{name},{conf[:8]},{count},{best},{mean},{mean_time}")
+
+
+def print_runs(store):
+    print("id,instance,config,started,finished,best")
+    for run_id, name, conf, started, finished, best in store.runs():
+        print(f"{run_id},{name},{conf[:8]},{started},{finished},{best}")
+
+
+def main():
+    args = parse_args()
+    store = ResultsStore(args.database)
+    if args.command == "compare":
+        print_compare(store, args.instance)
+    elif args.command == "runs":
+        print_runs(store)
+    else:
+        config = store.get_config(args.hash)
+        if config is None:
+            print(f"No configuration matches {args.hash}")
+        else:
+            print(json.dumps(config, indent=2))
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
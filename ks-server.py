@@ -0,0 +1,57 @@
+#! /usr/bin/python
+
+from argparse import ArgumentParser
+import asyncio
+
+from ks import initialize_algorithm
+from ks_engine.job_server import (
+    DEF_CACHE_SIZE,
+    DEF_QUEUE_SIZE,
+    DEF_WORKERS,
+    JobServer,
+    KernelSearchRunner,
+    start_server,
+)
+
+
+def parse_args():
+    parser = ArgumentParser(
+        description="Serve Kernel Search jobs reusing Gurobi environments and loaded instances"
+    )
+    address = parser.add_mutually_exclusive_group(required=True)
+    address.add_argument("-u", "--unix", default=None, help="Unix socket path")
+    address.add_argument("-p", "--port", type=int, default=None, help="TCP port")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("-w", "--workers", type=int, default=DEF_WORKERS)
+    parser.add_argument("-q", "--queue-size", type=int, default=DEF_QUEUE_SIZE)
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEF_CACHE_SIZE,
+        help="Loaded instances kept by each worker",
+    )
+    return parser.parse_args()
+
+
+async def serve(args):
+    runner = KernelSearchRunner(initialize_algorithm, args.cache_size)
+    job_server = JobServer(runner, args.workers, args.queue_size)
+    server = await start_server(job_server, args.unix, args.host, args.port)
+    print("Listening on", server.sockets[0].getsockname())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        job_server.close()
+
+
+def main():
+    args = parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#! /usr/bin/python
+
+from argparse import ArgumentParser
+import csv
+import time
+
+import yaml
+
+from ks import initialize_algorithm, get_instance_file
+from ks_engine import load_config, race
+from ks_engine.feasibility import read_maximize
+from ks_engine.tuning import (
+    build_configs,
+    successive_halving,
+    quality_score,
+    time_to_target_score,
+)
+
+
+def parse_args():
+    parser = ArgumentParser(
+        description="Tune ks.py configuration with successive halving"
+    )
+    parser.add_argument(
+        "space",
+        help="YAML file with the BASE configuration file and the search SPACE",
+    )
+    parser.add_argument("mps", help="Instance MPS file", nargs="?")
+    parser.add_argument("-n", "--count", type=int, default=None)
+    parser.add_argument("--min-budget", type=float, default=10)
+    parser.add_argument("--max-budget", type=float, default=270)
+    parser.add_argument("--eta", type=int, default=3)
+    parser.add_argument(
+        "-t",
+        "--target",
+        type=float,
+        default=None,
+        help="Rank by time to reach this objective value instead of quality",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("-o", "--output", default=None, help="Best configuration")
+    parser.add_argument("-r", "--ranking", default=None, help="Ranking CSV file")
+    return parser.parse_args()
+
+
+def load_space(file_name):
+    with open(file_name) as file:
+        space = yaml.safe_load(file)
+    base = load_config(space.get("BASE"))
+    # tuning runs must not overwrite the outputs of the base configuration
+    base = {**base, "DEBUG": None, "SOLUTION_FILE": None}
+    return base, space["SPACE"]
+
+
+def build_evaluator(mps, target, minimize):
+    def evaluate(config, budget):
+        racers = [(config, initialize_algorithm(config))]
+        begin = time.time()
+        sol, _ = race(mps, racers, budget, target)
+        elapsed = time.time() - begin
+        value = sol.value if sol else None
+        print(f"budget: {budget} value: {value} time: {elapsed:.2f}")
+
+        if target is None:
+            return quality_score(value, minimize)
+        return time_to_target_score(value, elapsed, target, minimize)
+
+    return evaluate
+
+
+def save_ranking(file_name, ranking, configs):
+    names = list(configs[0][0])
+    with open(file_name, "w") as file:
+        writer = csv.writer(file)
+        writer.writerow(["rank", "config", "score", "budget", *names])
+        for rank, (index, score, budget) in enumerate(ranking):
+            params = configs[index][0]
+            row = [rank, index, score[0], budget]
+            writer.writerow(row + [params[name] for name in names])
+
+
+def print_ranking(ranking, configs):
+    for rank, (index, score, budget) in enumerate(ranking):
+        print(rank, score[0], budget, configs[index][0])
+
+
+def main():
+    args = parse_args()
+    base, space = load_space(args.space)
+    mps = get_instance_file(args.mps, base)
+    configs = build_configs(base, space, args.count, args.seed)
+
+    # the same objective sense used by race to compare incumbents
+    evaluate = build_evaluator(mps, args.target, not read_maximize(mps))
+    ranking = successive_halving(
+        [conf for _, conf in configs],
+        evaluate,
+        args.min_budget,
+        args.max_budget,
+        args.eta,
+    )
+
+    print_ranking(ranking, configs)
+    if args.ranking:
+        save_ranking(args.ranking, ranking, configs)
+
+    best_index = ranking[0][0]
+    best = yaml.safe_dump(configs[best_index][1])
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(best)
+    else:
+        print(best)
+
+
+if __name__ == "__main__":
+    main()
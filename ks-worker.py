@@ -0,0 +1,38 @@
+#! /usr/bin/python
+
+from argparse import ArgumentParser
+from functools import partial
+
+from ks_engine import load_config
+from ks_engine.distributed import Worker, solve_task
+from ks_engine.model import model_loarder
+
+
+def parse_args():
+    parser = ArgumentParser(
+        description="Solve the bucket sub problems sent by a ks.py coordinator"
+    )
+    parser.add_argument("host", help="Coordinator host")
+    parser.add_argument("port", type=int, help="Coordinator port")
+    parser.add_argument("mps", help="Instance MPS file", nargs="?")
+    parser.add_argument("-c", "--config", required=True, help="YAML Configuration File")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    conf = load_config(args.config)
+    mps = args.mps or conf.get("INSTANCE")
+    if not mps:
+        raise ValueError("instance file is required from CLI or from config file")
+
+    main_model = model_loarder(mps, conf)
+    names = [var.varName for var in main_model.getVars()]
+    solver = partial(solve_task, main_model, conf, names)
+
+    worker = Worker((args.host, args.port), names, solver)
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,11 @@
 # Copyright (c) 2019 Filippo Ranza <filipporanza@gmail.com>
 
 from argparse import ArgumentParser
+import os
+
 from ks_engine import *
+from ks_engine.feasibility import FeasibilityChecker, list_solution_files
+from ks_engine.solution import csv_field
 
 
 def parse_args():
@@ -16,11 +20,32 @@ def parse_args():
         "-e",
         "--eval",
         default=None,
-        help="Evaluate if given solution file is feasible for the given instance",
+        help="Evaluate if given solution file, or every .sol file in the given directory, is feasible for the given instance",
     )
     exclusive_group.add_argument(
         "-c", "--config", default=None, help="YAML Configuration File"
     )
+    exclusive_group.add_argument(
+        "-r",
+        "--race",
+        default=None,
+        nargs="+",
+        help="Run the given YAML Configuration Files at the same time, sharing the best solution",
+    )
+
+    parser.add_argument(
+        "-p",
+        "--progress",
+        default=None,
+        help="Write a newline delimited JSON progress stream into the given file, '-' for stdout",
+    )
+    parser.add_argument(
+        "-d",
+        "--deadline",
+        default=None,
+        type=float,
+        help="Race deadline, in seconds",
+    )
 
     return parser.parse_args()
 
@@ -41,8 +66,10 @@ def initialize_algorithm(conf):
     return algo
 
 
-def run_kernel_search(mps, config):
+def run_kernel_search(mps, config, progress=None):
     conf = load_config(config)
+    if progress:
+        conf["PROGRESS_STREAM"] = progress
     mps = get_instance_file(mps, conf)
 
     algo = initialize_algorithm(conf)
@@ -59,14 +86,57 @@ def run_kernel_search(mps, config):
             sol.debug.export_csv(debug_file, False)
 
 
+def run_race(mps, configs, deadline):
+    racers = []
+    for config in configs:
+        conf = load_config(config)
+        racers.append((conf, initialize_algorithm(conf)))
+
+    mps = get_instance_file(mps, racers[0][0])
+    sol, results = race(mps, racers, deadline)
+
+    for index, value in sorted(results.items()):
+        print(f"{configs[index]}: {value}")
+
+    if sol is None:
+        print("Cannot find a solution")
+    else:
+        print("Solution:", sol.value)
+        if sol_file := racers[0][0]["SOLUTION_FILE"]:
+            sol.save_as_sol_file(sol_file)
+
+
 def evaluate_solution(mps, solution):
-    if sol := eval_model(mps, solution):
+    checker = FeasibilityChecker.from_file(mps)
+    files = list_solution_files(solution)
+    results = checker.check_files(files)
+    print_check_results(files, results)
+    if os.path.isdir(solution):
+        return
+
+    (result,) = results
+    if result.feasible:
         print(f"Solution file {solution} is a valid solution for {mps}")
-        print(f"Objective value: {sol}")
+        print(f"Objective value: {result.objective}")
     else:
         print(f"Solution file {solution} is NOT a valid solution for {mps}")
 
 
+def print_check_results(files, results):
+    print("file,feasible,objective,row_violation,bound_violation,int_violation,error")
+    for file_name, result in zip(files, results):
+        print(
+            file_name,
+            result.feasible,
+            csv_field(result.objective),
+            result.max_row_violation,
+            result.max_bound_violation,
+            result.max_integrality_violation,
+            csv_field(result.error),
+            sep=",",
+        )
+
+
 def get_instance_file(mps, config):
     if mps:
         return mps
@@ -78,7 +148,10 @@ def get_instance_file(mps, config):
 
 def solve_instance(args):
     try:
-        run_kernel_search(args.mps, args.config)
+        if args.race:
+            run_race(args.mps, args.race, args.deadline)
+        else:
+            run_kernel_search(args.mps, args.config, args.progress)
     except ValueError as err:
         print("Fatal exception: Value Error")
         print("Error message:", err)
@@ -92,7 +165,7 @@ def solve_instance(args):
 
 def main():
     args = parse_args()
-    if args.config is not None:
+    if args.config is not None or args.race is not None:
         solve_instance(args)
     else:
         evaluate_solution(args.mps, args.eval)
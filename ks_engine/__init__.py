@@ -13,6 +13,14 @@ Available functions
 kernel_search
     run the Kernel Search Heuristic
 
+iter_kernel_search
+    run the Kernel Search Heuristic yielding each
+    improving solution, cancellable through SearchControl
+
+race
+    run several Kernel Search configurations at the same
+    time, sharing the best solution between them
+
 config_loader
     load ks_engine (and eventually client code) configuration
     from given YAML file
@@ -31,7 +39,9 @@ bucket_utils
 
 """
 
-from .kernel_search import kernel_search, KernelMethods
+from .kernel_search import kernel_search, iter_kernel_search, KernelMethods
+from .search_control import SearchControl
 from .config_loader import load_config
 from .kernel_algorithms import *
 from .model import eval_model
+from .racing import race
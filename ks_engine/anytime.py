@@ -0,0 +1,282 @@
+#! /usr/bin/python
+
+from collections import namedtuple
+import csv
+import math
+import os
+
+from .config_loader import get_base_name
+from .progress_stream import read_events
+
+# shift of the shifted geometric mean, in seconds
+DEF_SHIFT = 1.0
+
+Timeline = namedtuple("Timeline", ["instance", "config", "times", "values", "end"])
+
+
+def primal_gap(value, best):
+    """
+    Primal gap in [0, 1] of value with respect to the best known
+    solution: 1 without a solution or with a different sign.
+    """
+    if value is None:
+        return 1.0
+    if value == best:
+        return 0.0
+    if value * best < 0:
+        return 1.0
+    return abs(value - best) / max(abs(value), abs(best))
+
+
+def best_values(values):
+    """
+    Incumbent values as a step function: the best value
+    found until each incumbent time.
+    """
+    best = None
+    for value in values:
+        if best is None or value < best:
+            best = value
+        yield best
+
+
+def primal_integral(times, values, best, end):
+    """
+    Integral of the primal gap over [0, end]: the gap is 1 before
+    the first incumbent and changes at each incumbent time.
+    """
+    output = 0.0
+    prev_time, prev_gap = 0.0, 1.0
+    for time, value in zip(times, best_values(values)):
+        time = min(time, end)
+        output += (time - prev_time) * prev_gap
+        prev_time, prev_gap = time, primal_gap(value, best)
+    return output + (end - prev_time) * prev_gap
+
+
+def time_to_target(times, values, target):
+    """
+    First time an incumbent reaches target, inf if never.
+    """
+    for time, value in zip(times, values):
+        if value <= target:
+            return time
+    return math.inf
+
+
+def gap_target(best, gap):
+    """
+    Objective value within the given relative gap from best.
+    """
+    return best + gap * abs(best)
+
+
+def shifted_geometric_mean(values, shift=DEF_SHIFT):
+    logs = [math.log(value + shift) for value in values]
+    return math.exp(sum(logs) / len(logs)) - shift
+
+
+def performance_profile(measures):
+    """
+    Performance profile of the configurations: measures maps each
+    configuration to {instance: measure}, lower is better. Return,
+    for each configuration, its sorted performance ratios on the
+    instances measured by all of them; unsolved instances (inf
+    measure) have inf ratio.
+    """
+    if not measures:
+        return {}
+    instances = set.intersection(*(set(v) for v in measures.values()))
+    output = {conf: [] for conf in measures}
+    for instance in instances:
+        best = min(values[instance] for values in measures.values())
+        for conf, values in measures.items():
+            output[conf].append(profile_ratio(values[instance], best))
+    for ratios in output.values():
+        ratios.sort()
+    return output
+
+
+def profile_ratio(measure, best):
+    if math.isinf(measure):
+        return math.inf
+    if best <= 0:
+        return 1.0 if measure <= 0 else math.inf
+    return measure / best
+
+
+def profile_fraction(ratios, tau):
+    """
+    Fraction of instances solved within tau times the best.
+    """
+    return sum(ratio <= tau for ratio in ratios) / len(ratios)
+
+
+def oriented(timeline, minimize):
+    """
+    Return the timeline as a minimization one.
+    """
+    if minimize:
+        return timeline
+    return timeline._replace(values=[-value for value in timeline.values])
+
+
+class AnytimeReport:
+    """
+    Anytime performance of the runs of several configurations
+    on several instances. All the timelines are minimization
+    ones: use oriented for maximization runs. The reference of
+    each instance is the best value found by any run, unless
+    given in references.
+    """
+
+    def __init__(self, timelines, references=None):
+        self.timelines = list(timelines)
+        self.references = {}
+        for line in self.timelines:
+            if line.values:
+                best = min(line.values)
+                known = self.references.get(line.instance, best)
+                self.references[line.instance] = min(known, best)
+        self.references.update(references or {})
+
+    def configs(self):
+        return sorted({line.config for line in self.timelines})
+
+    def instances(self):
+        return sorted({line.instance for line in self.timelines})
+
+    def measure(self, function):
+        """
+        Mean of function(timeline, reference) over the runs of
+        each configuration on each instance: {config: {instance: mean}}.
+        """
+        groups = {}
+        for line in self.timelines:
+            reference = self.references.get(line.instance)
+            key = (line.config, line.instance)
+            groups.setdefault(key, []).append(function(line, reference))
+
+        output = {}
+        for (conf, instance), values in groups.items():
+            output.setdefault(conf, {})[instance] = sum(values) / len(values)
+        return output
+
+    def primal_integrals(self):
+        def function(line, reference):
+            if reference is None:
+                return line.end
+            return primal_integral(line.times, line.values, reference, line.end)
+
+        return self.measure(function)
+
+    def times_to_target(self, gap):
+        def function(line, reference):
+            if reference is None:
+                return math.inf
+            target = gap_target(reference, gap)
+            return time_to_target(line.times, line.values, target)
+
+        return self.measure(function)
+
+    def table(self, gaps=()):
+        """
+        One row for each configuration, ranked by mean primal
+        integral: configuration, runs, mean primal integral and,
+        for each gap, the solved fraction and the shifted geometric
+        mean of the time to target (unsolved instances count as
+        the run time).
+        """
+        integrals = self.primal_integrals()
+        targets = [self.times_to_target(gap) for gap in gaps]
+        ends = self.measure(lambda line, _: line.end)
+        runs = {}
+        for line in self.timelines:
+            runs[line.config] = runs.get(line.config, 0) + 1
+
+        output = []
+        for conf in self.configs():
+            values = integrals[conf].values()
+            row = [conf, runs[conf], sum(values) / len(values)]
+            for target in targets:
+                times = target[conf]
+                solved = [t for t in times.values() if not math.isinf(t)]
+                capped = [min(t, ends[conf][i]) for i, t in times.items()]
+                row.append(len(solved) / len(times))
+                row.append(shifted_geometric_mean(capped))
+            output.append(row)
+        output.sort(key=lambda row: row[2])
+        return output
+
+    def table_header(self, gaps=()):
+        output = ["config", "runs", "primal_integral"]
+        for gap in gaps:
+            output += [f"solved_{gap}", f"time_{gap}"]
+        return output
+
+
+def timelines_from_store(store, instance="%"):
+    """
+    Timelines of the stored runs, as minimization ones
+    according to the objective sense of each run.
+    """
+    for _, name, conf, duration, incumbents, minimize in store.timelines(instance):
+        times = [time for time, _ in incumbents]
+        values = [value for _, value in incumbents]
+        end = max([duration, *times])
+        line = Timeline(get_base_name(name), conf[:8], times, values, end)
+        yield oriented(line, minimize)
+
+
+def timeline_from_stream(file, instance, config):
+    """
+    Timeline of a progress stream (PROGRESS_STREAM): incumbent
+    events give the timeline, the last event gives the run time.
+    """
+    times, values = [], []
+    end = 0.0
+    for events in read_events(file):
+        for event in events:
+            if event["event"] == "incumbent":
+                times.append(event["time"])
+                values.append(event["value"])
+            end = max(end, event.get("elapsed", 0.0), event.get("time", 0.0))
+    return Timeline(instance, config, times, values, end)
+
+
+def timeline_from_debug(file, instance, config, minimize=True):
+    """
+    Timeline of a debug CSV file (DEBUG): the run time is
+    approximated by the total sub problem solver time and an
+    incumbent by each improving bucket value.
+    """
+    times, values = [], []
+    elapsed = 0.0
+    for row in csv.DictReader(file):
+        elapsed += float(row["time"])
+        if row["value"] == "":
+            continue
+        value = float(row["value"])
+        if not values or improves(value, values[-1], minimize):
+            times.append(elapsed)
+            values.append(value)
+    return Timeline(instance, config, times, values, elapsed)
+
+
+def improves(value, best, minimize):
+    return value < best if minimize else value > best
+
+
+def timeline_from_file(file_name, minimize=True):
+    """
+    Load a progress stream (.ndjson, .jsonl) or debug CSV file
+    stored as <config>/<instance>.<ext>.
+    """
+    instance = get_base_name(file_name)
+    config = os.path.basename(os.path.dirname(os.path.abspath(file_name)))
+    with open(file_name) as file:
+        if file_name.endswith((".ndjson", ".jsonl")):
+            output = timeline_from_stream(file, instance, config)
+        else:
+            output = timeline_from_debug(file, instance, config, minimize)
+    return output
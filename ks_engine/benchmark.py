@@ -0,0 +1,174 @@
+#! /usr/bin/python
+
+from collections import namedtuple
+import gc
+import json
+import platform
+import random
+import time
+
+from .kernel_algorithms.base_bucket import decresing_size_bucket, fixed_size_bucket
+from .kernel_algorithms.base_sort import bucket_sort, cheb_sort
+from .kernel_search import select_vars, update_kernel
+from .solution import DebugData, DebugIndex, DebugInfo, Solution
+
+DEF_SIZES = [10**4, 10**5, 10**6]
+DEF_REPEAT = 3
+DEF_THRESHOLD = 0.2
+# differences below this time, in seconds, are considered noise
+MIN_DELTA = 1e-3
+# share of the variables in the kernel
+KERNEL_RATIO = 0.1
+BUCKET_COUNT = 10
+
+Regression = namedtuple("Regression", ["name", "size", "baseline", "current"])
+
+
+def build_problem(size, seed=0):
+    """
+    Random kernel and LP values of given size,
+    with KERNEL_RATIO of the variables in the kernel.
+    """
+    rand = random.Random(seed)
+    names = [f"x{i}" for i in range(size)]
+    kernel = {name: rand.random() < KERNEL_RATIO for name in names}
+    values = Solution(0, ((name, rand.random()) for name in names))
+    return kernel, values
+
+
+def sort_bench(sorter):
+    def setup(size):
+        kernel, values = build_problem(size)
+        return lambda: sorter(kernel, values)
+
+    return setup
+
+
+def bucket_bench(builder, **conf):
+    def setup(size):
+        kernel, values = build_problem(size)
+        return lambda: list(builder(kernel, values, bucket_sort, {}, **conf))
+
+    return setup
+
+
+def kernel_update_bench(size):
+    kernel, values = build_problem(size)
+    bucket = [k for k, v in kernel.items() if not v][: size // BUCKET_COUNT]
+    solution = Solution(0, ((var, i % 2) for i, var in enumerate(bucket)))
+
+    def run():
+        select_vars(kernel, bucket)
+        update_kernel(kernel, bucket, solution, 0)
+
+    return run
+
+
+def solution_copy_bench(size):
+    _, values = build_problem(size)
+    return values.copy
+
+
+def solution_update_bench(size):
+    _, values = build_problem(size)
+    changes = [(f"x{i}", 1.0) for i in range(0, size, BUCKET_COUNT)]
+    return lambda: values.update(1, changes)
+
+
+def debug_csv_bench(size):
+    # a sub problem record each hundred variables
+    debug = DebugInfo()
+    for i in range(max(size // 100, 1)):
+        data = DebugData(i * 0.5, 1.25, 100, 1000, 100, "OPTIMAL")
+        debug.add_data(data, DebugIndex(i // BUCKET_COUNT, i % BUCKET_COUNT))
+    return debug.get_csv
+
+
+BENCHMARKS = {
+    "bucket_sort": sort_bench(bucket_sort),
+    "cheb_sort": sort_bench(cheb_sort),
+    "fixed_size_bucket": bucket_bench(fixed_size_bucket, count=BUCKET_COUNT),
+    "decresing_size_bucket": bucket_bench(decresing_size_bucket, count=6),
+    "update_kernel": kernel_update_bench,
+    "solution_copy": solution_copy_bench,
+    "solution_update": solution_update_bench,
+    "debug_csv": debug_csv_bench,
+}
+
+
+def measure(function, repeat):
+    """
+    Best time, in seconds, of repeat calls
+    with the garbage collector disabled, as timeit.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        times = []
+        for _ in range(repeat):
+            begin = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - begin)
+    finally:
+        if enabled:
+            gc.enable()
+    return min(times)
+
+
+def run_benchmarks(names=None, sizes=DEF_SIZES, repeat=DEF_REPEAT, report=None):
+    """
+    Time the given benchmarks, all by default, at each size.
+    Return {name: {size: seconds}}, sizes are strings as in JSON.
+    """
+    output = {}
+    for name in names or BENCHMARKS:
+        setup = BENCHMARKS[name]
+        results = output.setdefault(name, {})
+        for size in sizes:
+            elapsed = measure(setup(size), repeat)
+            results[str(size)] = elapsed
+            if report:
+                report(name, size, elapsed)
+    return output
+
+
+def compare(results, baseline, threshold=DEF_THRESHOLD, min_delta=MIN_DELTA):
+    """
+    Return the benchmarks slower than baseline by more than
+    threshold (relative) and min_delta seconds. Benchmarks
+    missing from the baseline are ignored.
+    """
+    output = []
+    for name, times in results.items():
+        reference = baseline.get(name, {})
+        for size, current in times.items():
+            if size not in reference:
+                continue
+            base = reference[size]
+            if current > base * (1 + threshold) and current - base > min_delta:
+                output.append(Regression(name, int(size), base, current))
+    return output
+
+
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def save_results(file_name, results):
+    with open(file_name, "w") as file:
+        json.dump({"machine": machine_info(), "results": results}, file, indent=2)
+
+
+def load_results(file_name):
+    """
+    Return the results and the machine information
+    stored in the given baseline file.
+    """
+    with open(file_name) as file:
+        data = json.load(file)
+    return data["results"], data.get("machine", {})
@@ -28,6 +28,9 @@ DEFAULT_CONF = {
     "INSTANCE": "",
 }
 
+# solver phases accepting a SOLVER_PROFILES entry of Gurobi parameters
+SOLVER_PHASES = ("LP", "KERNEL", "BUCKET", "SCREENING", "FEATURE_PROBE")
+
 
 def check_config(conf):
     for k, v in DEFAULT_CONF.items():
@@ -43,6 +46,48 @@ def check_config(conf):
         )
 
     check_file_parameters(conf)
+    check_solver_profiles(conf)
+    check_bucket_bandit(conf)
+
+
+def check_bucket_bandit(conf):
+    bandit = conf.get("BUCKET_BANDIT")
+    if not bandit:
+        return
+
+    arms = bandit.get("ARMS") if isinstance(bandit, dict) else None
+    if not isinstance(arms, list):
+        raise ValueError("BUCKET_BANDIT is expected to contain an ARMS list")
+    for arm in arms:
+        if not isinstance(arm, dict):
+            raise ValueError("BUCKET_BANDIT arms are expected to be dictionaries")
+        for key in ("BUCKET", "BUCKET_SORTER"):
+            if not isinstance(arm.get(key, ""), str):
+                raise ValueError(f"BUCKET_BANDIT arm {key} should be a string")
+        for key in ("BUCKET_CONF", "BUCKET_SORTER_CONF"):
+            if not isinstance(arm.get(key, {}), dict):
+                raise ValueError(f"BUCKET_BANDIT arm {key} should be a dictionary")
+        if arm.get("BUCKET", conf["BUCKET"]) != conf["BUCKET"]:
+            if "BUCKET_CONF" not in arm:
+                raise ValueError(
+                    f"BUCKET_BANDIT arm {arm['BUCKET']} requires a BUCKET_CONF"
+                )
+
+
+def check_solver_profiles(conf):
+    profiles = conf.get("SOLVER_PROFILES")
+    if profiles is None:
+        return
+
+    if not isinstance(profiles, dict):
+        raise ValueError("SOLVER_PROFILES is expected to map phases to parameters")
+    for phase, params in profiles.items():
+        if phase not in SOLVER_PHASES:
+            raise ValueError(
+                f"Unknown solver phase {phase}: expected one of {', '.join(SOLVER_PHASES)}"
+            )
+        if not isinstance(params, dict):
+            raise ValueError(f"SOLVER_PROFILES {phase} is expected to be a dictionary")
 
 
 def get_base_name(instance):
@@ -118,6 +163,14 @@ def load_config(file_name):
     with open(file_name) as file:
         conf = safe_load(file)
 
+    return build_config(conf)
+
+
+def build_config(conf):
+    """
+    Complete the given configuration with the default
+    values and check it, as load_config does.
+    """
     out = {**DEFAULT_CONF, **conf}
     check_config(out)
     return out
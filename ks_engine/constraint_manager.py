@@ -1,24 +1,100 @@
 #! /usr/bin/python
 
+from collections import OrderedDict
+import hashlib
+import os
+import pickle
 
-from numpy import random as rnd
-
+from .lazy_import import LazyModule
 from .model import Model
 
+rnd = LazyModule("numpy.random")
+
+# each entry holds a flag for every constraint of the model
+IIS_CACHE_SIZE = 8
+
+
+class IISCache:
+    """
+    Bounded LRU store of IIS membership of the original constraints,
+    indexed by a fingerprint of the model and of the disabled
+    variables. If a file name is given the cache is loaded from
+    and saved into that file.
+    """
+
+    def __init__(self, file_name=None, max_size=IIS_CACHE_SIZE):
+        self.file_name = file_name
+        self.max_size = max_size
+        self.store = OrderedDict()
+        if file_name and os.path.isfile(file_name):
+            with open(file_name, "rb") as file:
+                self.store = OrderedDict(pickle.load(file))
+            self.shrink()
+
+    def get(self, key):
+        output = self.store.get(key)
+        if output is not None:
+            self.store.move_to_end(key)
+        return output
+
+    def add(self, key, iis):
+        self.store[key] = iis
+        self.store.move_to_end(key)
+        self.shrink()
+        if self.file_name:
+            with open(self.file_name, "wb") as file:
+                pickle.dump(self.store, file)
+
+    def shrink(self):
+        while len(self.store) > self.max_size:
+            self.store.popitem(last=False)
+
+
+IIS_CACHE = IISCache()
+
+
+def iis_cache_factory(config):
+    if file_name := config.get("IIS_CACHE_FILE"):
+        return IISCache(file_name)
+    return IIS_CACHE
 
-def enable_lazy_constraints(model, current_kernel, config, presolve=False, lazy_type=3):
+
+def kernel_fingerprint(model, current_kernel):
+    digest = hashlib.sha256()
+    # Fingerprint hashes the model coefficients: models sharing name
+    # and size do not share the IIS, even in a persistent cache
+    header = f"{model.ModelName}:{model.NumVars}:{model.NumConstrs}"
+    header += f":{model.Fingerprint}"
+    digest.update(header.encode())
+    for name in sorted(k for k, v in current_kernel.items() if not v):
+        digest.update(b"\0")
+        digest.update(name.encode())
+    return digest.hexdigest()
+
+
+def compute_iis(model, current_kernel, config):
+    cache = iis_cache_factory(config)
+    key = kernel_fingerprint(model, current_kernel)
+    if (iis := cache.get(key)) is not None:
+        print("Using IIS cache")
+        return iis
 
     kernel_model = get_kernel_model(model, current_kernel, config)
     print("COMPUTE IIS")
     kernel_model.computeIIS()
     print("DONE")
-    for constr in model.getConstrs():
-        name = constr.getAttr("ConstrName")
-        kernel_constr = kernel_model.getConstrByName(name)
-        if kernel_constr.getAttr("IISConstr"):
-            constr.lazy = lazy_type
-        else:
-            constr.lazy = 0
+    # disable_variables appends new constraints: the original ones come first
+    constrs = kernel_model.getConstrs()[: model.NumConstrs]
+    iis = kernel_model.getAttr("IISConstr", constrs)
+    cache.add(key, iis)
+    return iis
+
+
+def enable_lazy_constraints(model, current_kernel, config, presolve=False, lazy_type=3):
+
+    iis = compute_iis(model, current_kernel, config)
+    lazy = [lazy_type if in_iis else 0 for in_iis in iis]
+    model.setAttr("Lazy", model.getConstrs(), lazy)
 
     model.update()
     if presolve:
@@ -64,11 +140,12 @@ class ConstrainManager:
         constrs = output.getConstrs()
         self.constraint_count += 1
         rnd.shuffle(self.constraints)
-        for index in self.constraints[: self.constraint_count]:
-            constr = constrs[index]
-            print("Remove constr:", constr)
-            output.remove(constr)
-            output.update()
+        removed = [
+            constrs[index] for index in self.constraints[: self.constraint_count]
+        ]
+        print("Remove constr:", removed)
+        output.remove(removed)
+        output.update()
 
         return output
 
@@ -82,16 +159,9 @@ class ConstrainManager:
         return len(self.constraints) == 0
 
     def __select_random_constraint__(self, gurobi_model):
-        constraints = enumerate(gurobi_model.getConstrs())
-        violated_original_constraints = filter(
-            lambda constr: constr[1].getAttr("IISConstr")
-            and constr[0] < self.original_constr_count,
-            constraints,
-        )
-        constraints_index_list = list(
-            map(lambda x: x[0], violated_original_constraints)
-        )
-        self.constraints = constraints_index_list
+        constraints = gurobi_model.getConstrs()[: self.original_constr_count]
+        iis = gurobi_model.getAttr("IISConstr", constraints)
+        self.constraints = [i for i, in_iis in enumerate(iis) if in_iis]
 
     def __get_gurobi_model__(self, main_model, config, current_kernel):
         model = Model(main_model, config)
@@ -0,0 +1,339 @@
+#! /usr/bin/python
+
+import base64
+import hashlib
+import json
+import queue
+import socket
+import struct
+import threading
+import time
+
+from .lazy_import import LazyModule
+from .model import Model
+from .solution import Solution
+
+np = LazyModule("numpy")
+
+HEADER = struct.Struct("!I")
+WORKER_WAIT_TIME = 60
+CONNECT_ATTEMPTS = 10
+TASK_RETRIES = 3
+# workers are trusted only on the local host unless HOST is given
+DEF_HOST = "127.0.0.1"
+OBJECTIVE_TOL = 1e-6
+
+
+def send_message(sock, message):
+    data = json.dumps(message).encode()
+    sock.sendall(HEADER.pack(len(data)) + data)
+
+
+def recv_message(sock):
+    (length,) = HEADER.unpack(recv_exactly(sock, HEADER.size))
+    return json.loads(recv_exactly(sock, length))
+
+
+def recv_exactly(sock, size):
+    buff = bytearray()
+    while len(buff) < size:
+        chunk = sock.recv(size - len(buff))
+        if not chunk:
+            raise ConnectionError("connection closed by peer")
+        buff += chunk
+    return bytes(buff)
+
+
+def names_fingerprint(names):
+    digest = hashlib.sha256()
+    for name in names:
+        digest.update(str(name).encode() + b"\0")
+    return digest.hexdigest()
+
+
+def encode_mask(mask):
+    packed = np.packbits(np.asarray(mask, dtype=bool))
+    return base64.b64encode(packed.tobytes()).decode()
+
+
+def decode_mask(data, size):
+    packed = np.frombuffer(base64.b64decode(data), dtype=np.uint8)
+    return np.unpackbits(packed, count=size).astype(bool)
+
+
+def encode_solution(solution, index_of):
+    if solution is None:
+        return None
+    variables = {index_of[k]: v for k, v in solution.nonzero_vars().items()}
+    return {"value": solution.value, "vars": variables}
+
+
+def decode_solution(data, names):
+    if data is None:
+        return None
+    variables = {int(k): v for k, v in data["vars"].items()}
+    gen = ((name, variables.get(i, 0.0)) for i, name in enumerate(names))
+    return Solution(data["value"], gen)
+
+
+class Coordinator:
+    """
+    Hand bucket sub problems out to remote workers over TCP.
+    Workers connect to the coordinator, tasks sent to a
+    worker that disconnects are queued again, up to retries
+    times: then the task fails, without a solution. If the
+    objective, as (coefficients, constant), is given, solutions
+    whose value does not match their recomputed objective are
+    rejected.
+    """
+
+    def __init__(
+        self,
+        address,
+        names,
+        wait_timeout=WORKER_WAIT_TIME,
+        retries=TASK_RETRIES,
+        objective=None,
+    ):
+        self.names = names
+        self.objective = objective
+        self.index_of = {name: i for i, name in enumerate(names)}
+        self.fingerprint = names_fingerprint(names)
+        self.wait_timeout = wait_timeout
+        self.retries = retries
+        self.attempts = {}
+
+        self.tasks = queue.Queue()
+        self.results = queue.Queue()
+        self.task_count = 0
+        self.workers = 0
+        self.lock = threading.Lock()
+
+        self.server = socket.create_server(address)
+        self.address = self.server.getsockname()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def worker_count(self):
+        with self.lock:
+            return self.workers
+
+    def capacity(self):
+        return max(1, self.worker_count())
+
+    def submit(self, kernel, bucket, cutoff, start, time_limit=None):
+        selected = set(bucket)
+        mask = [kernel[name] or name in selected for name in self.names]
+        with self.lock:
+            task_id = self.task_count
+            self.task_count += 1
+
+        task = {
+            "type": "task",
+            "id": task_id,
+            "kernel": encode_mask(mask),
+            "bucket": [self.index_of[var] for var in bucket],
+            "cutoff": cutoff,
+            "start": encode_solution(start, self.index_of),
+            "time_limit": time_limit,
+        }
+        self.tasks.put(task)
+        return task_id
+
+    def next_result(self):
+        waited = 0
+        while True:
+            try:
+                return self.results.get(timeout=1)
+            except queue.Empty:
+                pass
+
+            if self.worker_count():
+                waited = 0
+            else:
+                waited += 1
+                if waited > self.wait_timeout:
+                    raise RuntimeError(
+                        f"no worker connected in the last {self.wait_timeout} seconds"
+                    )
+
+    def decode_solution(self, result):
+        output = decode_solution(result["solution"], self.names)
+        if output and self.objective and not self.check_objective(output):
+            print("Reject worker solution: wrong objective value", output.value)
+            output = None
+        return output
+
+    def check_objective(self, solution):
+        coefficients, constant = self.objective
+        value = constant + sum(
+            coeff * solution.vars[name] for name, coeff in coefficients.items()
+        )
+        return abs(solution.value - value) <= OBJECTIVE_TOL * max(1.0, abs(value))
+
+    def close(self):
+        for _ in range(self.worker_count()):
+            self.tasks.put(None)
+        self.server.close()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        with conn:
+            try:
+                hello = recv_message(conn)
+            except (ConnectionError, OSError):
+                return
+
+            if hello.get("fingerprint") != self.fingerprint:
+                print("Reject worker: different instance")
+                send_message(conn, {"type": "stop"})
+                return
+
+            self._update_workers(1)
+            try:
+                self._serve_tasks(conn)
+            finally:
+                self._update_workers(-1)
+
+    def _serve_tasks(self, conn):
+        while True:
+            task = self.tasks.get()
+            if task is None:
+                send_message(conn, {"type": "stop"})
+                return
+
+            try:
+                send_message(conn, task)
+                result = recv_message(conn)
+            except (ConnectionError, OSError):
+                self._retry(task)
+                return
+
+            self.results.put(result)
+
+    def _retry(self, task):
+        task_id = task["id"]
+        with self.lock:
+            attempts = self.attempts.get(task_id, 0) + 1
+            self.attempts[task_id] = attempts
+
+        if attempts > self.retries:
+            print("Lost worker: task", task_id, "failed", attempts, "times")
+            self.results.put(failed_result(task_id))
+        else:
+            print("Lost worker: queue task", task_id, "again")
+            self.tasks.put(task)
+
+    def _update_workers(self, delta):
+        with self.lock:
+            self.workers += delta
+
+
+def failed_result(task_id):
+    return {
+        "id": task_id,
+        "status": "WORKER_FAILED",
+        "solution": None,
+        "time": 0.0,
+        "nodes": 0,
+    }
+
+
+class Worker:
+    """
+    Connect to a Coordinator and solve the received tasks
+    with the given solver function.
+    """
+
+    def __init__(self, address, names, solver):
+        self.address = address
+        self.names = names
+        self.solver = solver
+
+    def run(self):
+        with self.connect() as sock:
+            send_message(sock, {"fingerprint": names_fingerprint(self.names)})
+            while True:
+                try:
+                    task = recv_message(sock)
+                except ConnectionError:
+                    return
+
+                if task["type"] == "stop":
+                    return
+
+                result = self.solver(task)
+                result["id"] = task["id"]
+                send_message(sock, result)
+
+    def connect(self):
+        for _ in range(CONNECT_ATTEMPTS - 1):
+            try:
+                return socket.create_connection(self.address)
+            except ConnectionRefusedError:
+                time.sleep(1)
+        return socket.create_connection(self.address)
+
+
+def solve_task(main_model, config, names, task, params=None):
+    mask = decode_mask(task["kernel"], len(names))
+    kernel = dict(zip(names, mask))
+    bucket = [names[i] for i in task["bucket"]]
+    start = decode_solution(task["start"], names)
+
+    model = Model(main_model, config, phase="BUCKET")
+    model.disable_variables(kernel)
+    model.add_bucket_contraints(None, bucket)
+    if task["cutoff"] is not None:
+        model.set_cutoff(task["cutoff"])
+    if task["time_limit"] is not None:
+        model.set_time_limit(task["time_limit"])
+    for name, value in (params or {}).items():
+        model.model.setParam(name, value)
+    model.preload_solution(start)
+
+    stat = model.run()
+    status = model.get_status()
+    print(status)
+    if stat:
+        index_of = {name: i for i, name in enumerate(names)}
+        solution = encode_solution(model.build_solution(), index_of)
+    else:
+        solution = None
+
+    return {
+        "status": status,
+        "solution": solution,
+        "time": model.model.getAttr("Runtime"),
+        "nodes": model.model.getAttr("NodeCount"),
+    }
+
+
+def model_objective(model):
+    """
+    Objective of a gurobipy model as ({name: coefficient}, constant).
+    """
+    variables = model.getVars()
+    names = model.getAttr("VarName", variables)
+    coefficients = model.getAttr("Obj", variables)
+    output = {name: c for name, c in zip(names, coefficients) if c != 0}
+    return output, model.getAttr("ObjCon")
+
+
+def coordinator_factory(config, kernel, model):
+    if conf := config.get("DISTRIBUTED"):
+        address = (conf.get("HOST", DEF_HOST), conf.get("PORT", 0))
+        retries = conf.get("RETRIES", TASK_RETRIES)
+        output = Coordinator(
+            address, list(kernel), retries=retries, objective=model_objective(model)
+        )
+        print("Coordinator listening on", output.address)
+    else:
+        output = None
+    return output
@@ -0,0 +1,97 @@
+#! /usr/bin/python
+
+from .lazy_import import LazyModule
+
+gurobipy = LazyModule("gurobipy")
+
+# gurobipy reports missing incumbent and bound as +/- 1e100
+GRB_INFINITY = 1e100
+
+
+class StopPolicy:
+    """
+    Gurobi callback interrupting a bucket sub problem when:
+        - the best bound shows that the reference incumbent cannot be
+          improved by more than bound_margin (relative), as BestBdStop;
+        - the incumbent did not improve for stall_time seconds
+          or stall_nodes nodes;
+        - the incumbent improves the reference by target (relative).
+    The reason of the last interruption is kept in 'reason'.
+    """
+
+    def __init__(
+        self,
+        reference=None,
+        minimize=True,
+        stall_time=None,
+        stall_nodes=None,
+        target=None,
+        bound_margin=None,
+    ):
+        self.reference = reference
+        self.sense = 1 if minimize else -1
+        self.stall_time = stall_time
+        self.stall_nodes = stall_nodes
+        self.target = target
+        self.bound_margin = bound_margin
+        self.last_best = None
+        self.last_time = 0.0
+        self.last_nodes = 0.0
+        self.reason = None
+
+    def __call__(self, model, where):
+        if where != gurobipy.GRB.Callback.MIP:
+            return
+
+        what = gurobipy.GRB.Callback
+        reason = self.check(
+            model.cbGet(what.MIP_OBJBST),
+            model.cbGet(what.MIP_OBJBND),
+            model.cbGet(what.RUNTIME),
+            model.cbGet(what.MIP_NODCNT),
+        )
+        if reason:
+            self.reason = reason
+            model.terminate()
+
+    def improvement(self, value):
+        return self.sense * (self.reference - value)
+
+    def check(self, best, bound, runtime, nodes):
+        has_best = abs(best) < GRB_INFINITY
+        if has_best and best != self.last_best:
+            self.last_best = best
+            self.last_time = runtime
+            self.last_nodes = nodes
+
+        if self.reference is not None:
+            scale = max(abs(self.reference), 1.0)
+            if self.bound_margin is not None and abs(bound) < GRB_INFINITY:
+                if self.improvement(bound) <= self.bound_margin * scale:
+                    return "BOUND_STOP"
+            if self.target is not None and has_best:
+                if self.improvement(best) >= self.target * scale:
+                    return "TARGET_REACHED"
+
+        if self.stall_time is not None and runtime - self.last_time >= self.stall_time:
+            return "STALL_TIME"
+        if self.stall_nodes is not None and nodes - self.last_nodes >= self.stall_nodes:
+            return "STALL_NODES"
+        return None
+
+
+def stop_policy_factory(config, solution, cutoff, minimize):
+    conf = config.get("EARLY-STOP")
+    if not conf:
+        return None
+
+    reference = solution.value if solution else None
+    return StopPolicy(
+        reference,
+        minimize,
+        conf.get("STALL_TIME"),
+        conf.get("STALL_NODES"),
+        conf.get("TARGET_IMPROVEMENT"),
+        # worse solutions may be accepted without cutoff
+        conf.get("BOUND_MARGIN") if cutoff else None,
+    )
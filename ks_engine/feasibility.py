@@ -0,0 +1,423 @@
+#! /usr/bin/python
+
+from collections import namedtuple
+import gzip
+import math
+import os
+
+from .lazy_import import LazyModule
+
+np = LazyModule("numpy")
+sparse = LazyModule("scipy.sparse")
+
+FEASIBILITY_TOL = 1e-6
+INTEGRALITY_TOL = 1e-5
+
+MIPData = namedtuple(
+    "MIPData",
+    [
+        "var_names",
+        "objective",
+        "obj_constant",
+        "maximize",
+        "matrix",
+        "row_lower",
+        "row_upper",
+        "lower",
+        "upper",
+        "integer",
+    ],
+)
+
+CheckResult = namedtuple(
+    "CheckResult",
+    [
+        "objective",
+        "max_row_violation",
+        "max_bound_violation",
+        "max_integrality_violation",
+        "feasible",
+        "error",
+    ],
+    defaults=[None],
+)
+
+
+def open_mps(file_name):
+    if file_name.endswith(".gz"):
+        return gzip.open(file_name, "rt")
+    return open(file_name)
+
+
+class MPSReader:
+    """
+    Read a (free) MPS file into sparse matrix form.
+    """
+
+    def __init__(self):
+        self.section = None
+        self.maximize = False
+        self.obj_row = None
+        self.row_index = {}
+        self.row_sense = []
+        self.rhs = {}
+        self.ranges = {}
+        self.obj_constant = 0.0
+
+        self.var_index = {}
+        self.var_names = []
+        self.integer = []
+        self.objective = {}
+        self.lower = {}
+        self.upper = {}
+        self.in_integer = False
+        self.rows = []
+        self.cols = []
+        self.vals = []
+
+    def read(self, file_name):
+        with open_mps(file_name) as file:
+            for line in file:
+                if not line.strip() or line.startswith("*"):
+                    continue
+                tokens = line.split()
+                if line[0].isspace():
+                    self.read_data(tokens)
+                else:
+                    self.read_section(tokens)
+        return self.build()
+
+    def read_maximize(self, file_name):
+        """
+        Read only the objective sense: OBJSENSE comes before COLUMNS.
+        """
+        with open_mps(file_name) as file:
+            for line in file:
+                if not line.strip() or line.startswith("*"):
+                    continue
+                tokens = line.split()
+                if not line[0].isspace():
+                    self.read_section(tokens)
+                    if self.section == "COLUMNS":
+                        break
+                elif self.section == "OBJSENSE":
+                    self.read_obj_sense(tokens[0])
+        return self.maximize
+
+    def read_section(self, tokens):
+        self.section = tokens[0].upper()
+        if self.section == "OBJSENSE" and len(tokens) > 1:
+            self.read_obj_sense(tokens[1])
+        elif self.section in ("QUADOBJ", "QMATRIX", "QSECTION", "QCMATRIX", "SOS"):
+            raise ValueError(f"MPS section {self.section} is not supported")
+
+    def read_obj_sense(self, sense):
+        self.maximize = sense.upper() in ("MAX", "MAXIMIZE")
+
+    def read_data(self, tokens):
+        if self.section == "ROWS":
+            self.read_row(tokens)
+        elif self.section == "COLUMNS":
+            self.read_column(tokens)
+        elif self.section == "RHS":
+            self.read_rhs(tokens)
+        elif self.section == "RANGES":
+            self.read_ranges(tokens)
+        elif self.section == "BOUNDS":
+            self.read_bound(tokens)
+        elif self.section == "OBJSENSE":
+            self.read_obj_sense(tokens[0])
+
+    def read_row(self, tokens):
+        sense, name = tokens[0].upper(), tokens[1]
+        if sense == "N":
+            if self.obj_row is None:
+                self.obj_row = name
+            return
+        self.row_index[name] = len(self.row_sense)
+        self.row_sense.append(sense)
+
+    def read_column(self, tokens):
+        if len(tokens) >= 3 and tokens[1].strip("'\"").upper() == "MARKER":
+            marker = tokens[2].strip("'\"").upper()
+            self.in_integer = marker == "INTORG"
+            return
+
+        name = tokens[0]
+        col = self.var_index.get(name)
+        if col is None:
+            col = len(self.var_names)
+            self.var_index[name] = col
+            self.var_names.append(name)
+            self.integer.append(self.in_integer)
+
+        for row, value in pairs(tokens[1:]):
+            value = float(value)
+            if row == self.obj_row:
+                self.objective[col] = value
+            elif (index := self.row_index.get(row)) is not None:
+                self.rows.append(index)
+                self.cols.append(col)
+                self.vals.append(value)
+
+    def read_rhs(self, tokens):
+        if len(tokens) % 2:
+            tokens = tokens[1:]
+        for row, value in pairs(tokens):
+            if row == self.obj_row:
+                self.obj_constant = -float(value)
+            else:
+                self.rhs[row] = float(value)
+
+    def read_ranges(self, tokens):
+        if len(tokens) % 2:
+            tokens = tokens[1:]
+        for row, value in pairs(tokens):
+            self.ranges[row] = float(value)
+
+    def read_bound(self, tokens):
+        kind = tokens[0].upper()
+        if kind in ("FR", "MI", "PL", "BV"):
+            # the bound name is optional, a BV value may follow the column
+            name = tokens[2] if len(tokens) > 2 else tokens[1]
+            value = None
+        else:
+            name = tokens[-2]
+            value = float(tokens[-1])
+
+        col = self.var_index[name]
+        if kind == "UP":
+            self.upper[col] = value
+            if value < 0 and self.lower.get(col, 0.0) == 0.0:
+                self.lower[col] = -math.inf
+        elif kind == "LO":
+            self.lower[col] = value
+        elif kind == "FX":
+            self.lower[col] = value
+            self.upper[col] = value
+        elif kind == "FR":
+            self.lower[col] = -math.inf
+            self.upper[col] = math.inf
+        elif kind == "MI":
+            self.lower[col] = -math.inf
+        elif kind == "PL":
+            self.upper[col] = math.inf
+        elif kind == "BV":
+            self.integer[col] = True
+            self.lower[col] = 0.0
+            self.upper[col] = 1.0
+        elif kind in ("LI", "UI"):
+            self.integer[col] = True
+            if kind == "LI":
+                self.lower[col] = value
+            else:
+                self.upper[col] = value
+        else:
+            raise ValueError(f"MPS bound type {kind} is not supported")
+
+    def build(self):
+        row_count = len(self.row_sense)
+        var_count = len(self.var_names)
+        matrix = sparse.csr_matrix(
+            (self.vals, (self.rows, self.cols)), shape=(row_count, var_count)
+        )
+
+        row_lower = np.full(row_count, -math.inf)
+        row_upper = np.full(row_count, math.inf)
+        for name, index in self.row_index.items():
+            rhs = self.rhs.get(name, 0.0)
+            sense = self.row_sense[index]
+            width = self.ranges.get(name)
+            row_lower[index], row_upper[index] = row_bounds(sense, rhs, width)
+
+        return MIPData(
+            var_names=self.var_names,
+            objective=dict_to_array(self.objective, var_count, 0.0),
+            obj_constant=self.obj_constant,
+            maximize=self.maximize,
+            matrix=matrix,
+            row_lower=row_lower,
+            row_upper=row_upper,
+            lower=dict_to_array(self.lower, var_count, 0.0),
+            upper=dict_to_array(self.upper, var_count, math.inf),
+            integer=np.array(self.integer, dtype=bool),
+        )
+
+
+def row_bounds(sense, rhs, width):
+    if sense == "E":
+        if width is None:
+            return rhs, rhs
+        if width >= 0:
+            return rhs, rhs + width
+        return rhs + width, rhs
+
+    if sense == "L":
+        lower = -math.inf if width is None else rhs - abs(width)
+        return lower, rhs
+
+    upper = math.inf if width is None else rhs + abs(width)
+    return rhs, upper
+
+
+def pairs(tokens):
+    return zip(tokens[::2], tokens[1::2])
+
+
+def dict_to_array(values, size, default):
+    output = np.full(size, default, dtype=float)
+    for index, value in values.items():
+        output[index] = value
+    return output
+
+
+def read_mps(file_name):
+    return MPSReader().read(file_name)
+
+
+def read_maximize(file_name):
+    return MPSReader().read_maximize(file_name)
+
+
+def read_model(model):
+    """
+    Extract the MIPData of a loaded gurobipy model,
+    without solving it.
+    """
+    variables = model.getVars()
+    constraints = model.getConstrs()
+    rhs = np.array(model.getAttr("RHS", constraints), dtype=float)
+    sense = np.array(model.getAttr("Sense", constraints))
+    return MIPData(
+        var_names=model.getAttr("VarName", variables),
+        objective=np.array(model.getAttr("Obj", variables), dtype=float),
+        obj_constant=model.ObjCon,
+        maximize=model.ModelSense == -1,
+        matrix=model.getA().tocsr(),
+        row_lower=np.where(sense == "<", -math.inf, rhs),
+        row_upper=np.where(sense == ">", math.inf, rhs),
+        lower=gurobi_bound(model.getAttr("LB", variables)),
+        upper=gurobi_bound(model.getAttr("UB", variables)),
+        integer=np.array(model.getAttr("VType", variables)) != "C",
+    )
+
+
+def gurobi_bound(values):
+    # gurobipy uses 1e100 as infinity
+    values = np.array(values, dtype=float)
+    values[values >= 1e100] = math.inf
+    values[values <= -1e100] = -math.inf
+    return values
+
+
+def read_sol_file(file_name):
+    values = {}
+    with open(file_name) as file:
+        for line in file:
+            tokens = line.split()
+            if not tokens or tokens[0].startswith("#"):
+                continue
+            if len(tokens) < 2:
+                raise ValueError(f"missing value of {tokens[0]}")
+            values[tokens[0]] = float(tokens[1])
+    return values
+
+
+class FeasibilityChecker:
+    """
+    Check solutions against a MIP instance without a solver:
+    constraints, bounds and integrality are verified with
+    vectorized residuals over the sparse constraint matrix.
+    """
+
+    def __init__(self, mip, feas_tol=FEASIBILITY_TOL, int_tol=INTEGRALITY_TOL):
+        self.mip = mip
+        self.feas_tol = feas_tol
+        self.int_tol = int_tol
+        self.var_index = {name: i for i, name in enumerate(mip.var_names)}
+
+    @classmethod
+    def from_file(cls, mps_file, **kwargs):
+        return cls(read_mps(mps_file), **kwargs)
+
+    def solution_vector(self, values):
+        output = np.zeros(len(self.mip.var_names))
+        for name, value in values.items():
+            try:
+                output[self.var_index[name]] = value
+            except KeyError:
+                raise ValueError(f"variable {name} is not in the instance")
+        return output
+
+    def check_many(self, solutions):
+        """
+        Check the solutions stored as columns of the given
+        (variables x solutions) matrix.
+        """
+        mip = self.mip
+        solutions = np.asarray(solutions, dtype=float)
+        activity = mip.matrix @ solutions
+
+        row_lower = mip.row_lower[:, None]
+        row_upper = mip.row_upper[:, None]
+        row_violation = np.maximum(row_lower - activity, activity - row_upper)
+        bound_violation = np.maximum(
+            mip.lower[:, None] - solutions, solutions - mip.upper[:, None]
+        )
+        int_values = solutions[mip.integer]
+        int_violation = np.abs(int_values - np.round(int_values))
+        objective = mip.objective @ solutions + mip.obj_constant
+
+        output = []
+        for i in range(solutions.shape[1]):
+            row = column_max(row_violation, i)
+            bound = column_max(bound_violation, i)
+            integrality = column_max(int_violation, i)
+            feasible = (
+                row <= self.feas_tol
+                and bound <= self.feas_tol
+                and integrality <= self.int_tol
+            )
+            output.append(CheckResult(objective[i], row, bound, integrality, feasible))
+        return output
+
+    def check(self, values):
+        vector = self.solution_vector(values)
+        return self.check_many(vector[:, None])[0]
+
+    def check_files(self, file_names):
+        """
+        Check the given solution files: those that cannot be read,
+        or name variables not in the instance, are infeasible with
+        the error message.
+        """
+        output = [None] * len(file_names)
+        vectors = []
+        for index, file_name in enumerate(file_names):
+            try:
+                vectors.append((index, self.solution_vector(read_sol_file(file_name))))
+            except (ValueError, OSError) as err:
+                output[index] = error_result(str(err))
+
+        if vectors:
+            results = self.check_many(np.column_stack([v for _, v in vectors]))
+            for (index, _), result in zip(vectors, results):
+                output[index] = result
+        return output
+
+
+def error_result(message):
+    return CheckResult(None, math.nan, math.nan, math.nan, False, message)
+
+
+def column_max(matrix, index):
+    if matrix.shape[0] == 0:
+        return 0.0
+    return max(float(matrix[:, index].max()), 0.0)
+
+
+def list_solution_files(path):
+    if not os.path.isdir(path):
+        return [path]
+    names = sorted(f for f in os.listdir(path) if f.endswith(".sol"))
+    return [os.path.join(path, f) for f in names]
@@ -19,6 +19,7 @@ FEASIBLE = 1
 TIME_OUT = 2
 
 DEF_REL_SIZE = 0.01
+DEF_REL_TOLERANCE = 0.005
 
 
 def init_feature_kernel(model, config):
@@ -98,6 +99,11 @@ def build_initial_kernel(var_name_table, kernel_var_names):
 
 def generate_model_solutions(model, config, var_names, count, size, min_time, max_time):
 
+    if config["FEATURE_KERNEL"].get("SIZE_SEARCH") == "bisection":
+        return generate_bisection_solutions(
+            model, config, var_names, count, size, min_time, max_time
+        )
+
     time_limit = min_time
     logger = feature_logger_factory(config["FEATURE_KERNEL"].get("LOG_FILE"))
     solution_set = {}
@@ -136,6 +142,90 @@ def generate_model_solutions(model, config, var_names, count, size, min_time, ma
     return solution_set
 
 
+def generate_bisection_solutions(
+    model, config, var_names, count, size, min_time, max_time
+):
+
+    time_limit = min_time
+    logger = feature_logger_factory(config["FEATURE_KERNEL"].get("LOG_FILE"))
+    tolerance = config["FEATURE_KERNEL"].get("SIZE_TOLERANCE", DEF_REL_TOLERANCE)
+    size_search = BisectionSizeSearch(size, len(var_names), tolerance)
+    solution_set = {}
+    for k in range(count):
+        size = size_search.next_size()
+        print("iter", k, "size", size)
+        if time_limit:
+            config["TIME_LIMIT"] = time_limit
+
+        selected = generate_random_sub_model(var_names, size)
+        result = solve_sub_model(model, config, selected)
+        logger.log_data(k, size, result)
+        if result:
+            sol, stat = result
+            if stat == TIME_OUT:
+                if time_limit and time_limit < max_time:
+                    time_limit += 1
+                else:
+                    # no more time to give: too small to find a solution
+                    # within the budget, look at larger sizes
+                    size_search.update(size, INFEASIBLE)
+            else:
+                solution_set[k] = SubProblem(sol, stat, size)
+                size_search.update(size, stat)
+        else:
+            # no LP solution: the sub model is surely infeasible
+            size_search.update(size, INFEASIBLE)
+
+    logger.save()
+    return solution_set
+
+
+class BisectionSizeSearch:
+    """
+    Locate the boundary between feasible and infeasible
+    sub models size by bisection. Once the boundary is
+    found, sizes are sampled around it.
+    """
+
+    def __init__(self, size, model_size, rel_tolerance):
+        self.size = size
+        self.model_size = model_size
+        self.tolerance = max(1, int(model_size * rel_tolerance))
+        # largest infeasible size and smallest feasible size found so far
+        self.infeasible = 0
+        self.feasible = model_size
+        self.first = True
+
+    def next_size(self):
+        if self.first:
+            self.first = False
+        elif self.converged():
+            self.size = self.sample_near_boundary()
+        else:
+            self.size = (self.infeasible + self.feasible) // 2
+
+        self.size = min(max(self.size, 1), self.model_size)
+        return self.size
+
+    def update(self, size, stat):
+        if stat == FEASIBLE:
+            self.feasible = min(self.feasible, size)
+        elif stat == INFEASIBLE:
+            self.infeasible = max(self.infeasible, size)
+
+    def converged(self):
+        return self.feasible - self.infeasible <= self.tolerance
+
+    def boundary(self):
+        return (self.infeasible + self.feasible) // 2
+
+    def sample_near_boundary(self):
+        # sampling is noisy, so the bounds may cross each other
+        width = max(self.tolerance, abs(self.feasible - self.infeasible))
+        low = self.boundary() - width // 2
+        return low + secrets.randbelow(width + 1)
+
+
 def split_kernel_vars(var_couple, count):
     var_couple.sort(key=lambda x: -x[1])
     head = var_couple[:count]
@@ -155,12 +245,12 @@ def build_sklean_instance(solutions, var_count):
 
 
 def solve_sub_model(model, config, selected_vars):
-    lin_model = Model(model, config, True)
+    lin_model = Model(model, config, True, phase="FEATURE_PROBE")
     lin_model.disable_variables(selected_vars)
     stat = lin_model.run()
     if stat:
         base_sol = lin_model.build_solution()
-        model = Model(model, config, False, True)
+        model = Model(model, config, False, True, phase="FEATURE_PROBE")
         model.preload_solution(base_sol)
         model.disable_variables(selected_vars)
 
@@ -180,9 +270,9 @@ def solve_sub_model(model, config, selected_vars):
 
 def load_model(model, config, relax):
     if relax:
-        output = Model(model, config, True, False)
+        output = Model(model, config, True, False, phase="FEATURE_PROBE")
     else:
-        output = Model(model, config, False, True)
+        output = Model(model, config, False, True, phase="FEATURE_PROBE")
 
     if config["FEATURE_KERNEL"].get("PRELOAD_FILE"):
         output.preload_from_file()
@@ -206,7 +296,7 @@ def random_select(var_names, count):
         var_names[k] = False
     rng = secrets.SystemRandom()
 
-    selected = rng.sample(var_names.keys(), count)
+    selected = rng.sample(list(var_names), count)
 
     for sel in selected:
         var_names[sel] = True
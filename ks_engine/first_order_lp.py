@@ -0,0 +1,241 @@
+#! /usr/bin/python
+
+from collections import namedtuple
+import time
+
+from .lazy_import import LazyModule
+from .solution import Solution
+
+np = LazyModule("numpy")
+sparse = LazyModule("scipy.sparse")
+
+DEF_TOLERANCE = 1e-4
+DEF_ITERATIONS = 100000
+DEF_ZERO_TOL = 1e-6
+CHECK_PERIOD = 64
+RUIZ_ITERATIONS = 10
+POWER_ITERATIONS = 30
+RESTART_FACTOR = 0.2
+STEP_FACTOR = 0.9
+
+LPResult = namedtuple(
+    "LPResult",
+    ["primal", "reduced_costs", "objective", "dual_bound", "error", "iterations"],
+)
+
+
+class ScaledLP:
+    """
+    LP relaxation of a MIPData, as a minimization problem,
+    with Ruiz equilibration of the constraint matrix.
+    """
+
+    def __init__(self, mip, ruiz_iterations=RUIZ_ITERATIONS):
+        matrix = sparse.csr_matrix(mip.matrix, dtype=float)
+        row_count, col_count = matrix.shape
+        self.row_scale = np.ones(row_count)
+        self.col_scale = np.ones(col_count)
+        for _ in range(ruiz_iterations if matrix.nnz else 0):
+            abs_matrix = abs(matrix)
+            row_scale = inv_sqrt(abs_matrix.max(axis=1).toarray().ravel())
+            col_scale = inv_sqrt(abs_matrix.max(axis=0).toarray().ravel())
+            matrix = sparse.diags(row_scale) @ matrix @ sparse.diags(col_scale)
+            self.row_scale *= row_scale
+            self.col_scale *= col_scale
+
+        self.sign = -1.0 if mip.maximize else 1.0
+        self.obj_constant = mip.obj_constant
+        self.matrix = matrix.tocsr()
+        self.matrix_t = matrix.T.tocsr()
+        self.cost = self.sign * mip.objective * self.col_scale
+        self.lower = mip.lower / self.col_scale
+        self.upper = mip.upper / self.col_scale
+        self.row_lower = mip.row_lower * self.row_scale
+        self.row_upper = mip.row_upper * self.row_scale
+
+        self.rhs_norm = 1 + np.linalg.norm(
+            np.concatenate([finite(self.row_lower), finite(self.row_upper)])
+        )
+        self.cost_norm = 1 + np.linalg.norm(self.cost)
+
+    def primal_step(self, x, y, tau):
+        return np.clip(
+            x - tau * (self.cost - self.matrix_t @ y), self.lower, self.upper
+        )
+
+    def dual_step(self, y, x_bar, sigma):
+        v = y - sigma * (self.matrix @ x_bar)
+        return v + sigma * np.clip(-v / sigma, self.row_lower, self.row_upper)
+
+    def kkt_error(self, x, y):
+        """
+        Return the relative KKT error of the given point,
+        the largest among primal residual, dual residual
+        and duality gap, and the point Lagrangian bound.
+        """
+        activity = self.matrix @ x
+        primal_res = np.maximum(self.row_lower - activity, 0) + np.maximum(
+            activity - self.row_upper, 0
+        )
+
+        reduced_costs = self.cost - self.matrix_t @ y
+        dual_res = np.where(np.isinf(self.lower), np.maximum(reduced_costs, 0), 0)
+        dual_res += np.where(np.isinf(self.upper), np.minimum(reduced_costs, 0), 0)
+
+        primal_obj = self.cost @ x
+        dual_obj = (
+            np.where(
+                y > 0, y * finite(self.row_lower), y * finite(self.row_upper)
+            ).sum()
+            + np.where(
+                reduced_costs > 0,
+                reduced_costs * finite(self.lower),
+                reduced_costs * finite(self.upper),
+            ).sum()
+        )
+        gap = abs(primal_obj - dual_obj) / (1 + abs(primal_obj) + abs(dual_obj))
+        error = max(
+            np.linalg.norm(primal_res) / self.rhs_norm,
+            np.linalg.norm(dual_res) / self.cost_norm,
+            gap,
+        )
+        # the bound holds only if no reduced cost pushes toward an infinite bound
+        bound = dual_obj if not dual_res.any() else None
+        return error, bound
+
+    def operator_norm(self, iterations=POWER_ITERATIONS):
+        vector = np.ones(self.matrix.shape[1])
+        norm = 0.0
+        for _ in range(iterations):
+            size = np.linalg.norm(vector)
+            if size == 0:
+                break
+            vector = self.matrix_t @ (self.matrix @ (vector / size))
+            norm = np.linalg.norm(vector) ** 0.5
+        return norm
+
+    def primal_weight(self):
+        rhs_norm = self.rhs_norm - 1
+        cost_norm = self.cost_norm - 1
+        if rhs_norm > 0 and cost_norm > 0:
+            return cost_norm / rhs_norm
+        return 1.0
+
+
+def inv_sqrt(values):
+    output = np.ones_like(values)
+    mask = values > 0
+    output[mask] = 1 / np.sqrt(values[mask])
+    return output
+
+
+def finite(values):
+    return np.where(np.isfinite(values), values, 0.0)
+
+
+def solve_lp(mip, time_limit=None, tolerance=DEF_TOLERANCE, iterations=DEF_ITERATIONS):
+    """
+    Approximate the LP relaxation of the given MIPData with a
+    restarted primal-dual hybrid gradient method (as in PDLP).
+    The iterate, or the average since the last restart, with the
+    lowest KKT error becomes the new starting point once its error
+    drops below RESTART_FACTOR times the one of the previous restart.
+    Stop when the relative KKT error is below tolerance, after
+    time_limit seconds or after the given iterations.
+    """
+    begin = time.time()
+    lp = ScaledLP(mip)
+    x = np.clip(np.zeros(len(lp.cost)), lp.lower, lp.upper)
+    y = np.zeros(len(lp.row_lower))
+
+    step = STEP_FACTOR / max(lp.operator_norm(), 1e-10)
+    weight = lp.primal_weight()
+    tau = step / weight
+    sigma = step * weight
+
+    x_sum, y_sum, count = np.zeros_like(x), np.zeros_like(y), 0
+    restart_error, _ = lp.kkt_error(x, y)
+    error, bound = restart_error, None
+
+    iteration = 0
+    while iteration < iterations:
+        iteration += 1
+        x_new = lp.primal_step(x, y, tau)
+        y = lp.dual_step(y, 2 * x_new - x, sigma)
+        x = x_new
+        x_sum += x
+        y_sum += y
+        count += 1
+
+        if iteration % CHECK_PERIOD:
+            continue
+
+        x_avg, y_avg = x_sum / count, y_sum / count
+        error, bound = lp.kkt_error(x, y)
+        avg_error, avg_bound = lp.kkt_error(x_avg, y_avg)
+        if avg_error < error:
+            candidate = x_avg, y_avg
+            error, bound = avg_error, avg_bound
+        else:
+            candidate = x, y
+
+        timeout = time_limit is not None and time.time() - begin >= time_limit
+        if error <= tolerance or timeout:
+            x, y = candidate
+            break
+        if error <= RESTART_FACTOR * restart_error:
+            x, y = candidate
+            restart_error = error
+            x_sum, y_sum, count = np.zeros_like(x), np.zeros_like(y), 0
+    else:
+        error, bound = lp.kkt_error(x, y)
+
+    reduced_costs = lp.cost - lp.matrix_t @ y
+    objective = lp.sign * (lp.cost @ x) + lp.obj_constant
+    if bound is not None:
+        bound = lp.sign * bound + lp.obj_constant
+
+    return LPResult(
+        primal=x * lp.col_scale,
+        reduced_costs=lp.sign * reduced_costs / lp.col_scale,
+        objective=objective,
+        dual_bound=bound,
+        error=error,
+        iterations=iteration,
+    )
+
+
+def approximate_lp_solution(mip, conf):
+    """
+    Build, from the approximate LP relaxation, the same
+    base kernel, values and MIP start computed from the
+    exact LP solution by init_kernel. values.value holds
+    the Lagrangian bound, None when it is not valid.
+    """
+    result = solve_lp(
+        mip,
+        conf.get("TIME_LIMIT"),
+        conf.get("TOLERANCE", DEF_TOLERANCE),
+        conf.get("ITERATIONS", DEF_ITERATIONS),
+    )
+    print(
+        f"Approximate LP: {result.objective} error {result.error:.2e}"
+        f" after {result.iterations} iterations"
+    )
+
+    zero_tol = conf.get("ZERO_TOL", DEF_ZERO_TOL)
+    names = mip.var_names
+    primal = result.primal.tolist()
+    nonzero = (np.abs(result.primal) > zero_tol).tolist()
+    reduced_costs = result.reduced_costs.tolist()
+
+    base = dict(zip(names, nonzero))
+    values = Solution(
+        result.dual_bound,
+        (
+            (name, x if used else rc)
+            for name, x, used, rc in zip(names, primal, nonzero, reduced_costs)
+        ),
+    )
+    start = Solution(result.objective, zip(names, primal))
+    return base, values, start
@@ -0,0 +1,232 @@
+#! /usr/bin/python
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import json
+import socket
+import threading
+import time
+
+from .config_loader import build_config, load_config
+from .kernel_search import iter_kernel_search
+from .model import ModelCache
+from .search_control import SearchControl
+
+DEF_WORKERS = 2
+DEF_QUEUE_SIZE = 64
+DEF_CACHE_SIZE = 4
+END_EVENTS = ("finish", "error")
+
+
+class Job:
+    """
+    A Kernel Search request: instance file, configuration (file
+    name or dictionary) and an optional deadline, in seconds from
+    the submission.
+    """
+
+    def __init__(self, job_id, request):
+        self.id = job_id
+        self.instance = request["instance"]
+        self.config = request.get("config")
+        self.send_solution = request.get("solution", False)
+        self.control = SearchControl(request.get("deadline"))
+
+
+def job_config(config):
+    if isinstance(config, str):
+        output = load_config(config)
+    else:
+        output = build_config(config or {})
+    return output
+
+
+class KernelSearchRunner:
+    """
+    Run jobs with iter_kernel_search. Each worker thread keeps
+    its own Gurobi environments and loaded instances.
+    """
+
+    def __init__(self, methods_factory, cache_size=DEF_CACHE_SIZE):
+        self.methods_factory = methods_factory
+        self.cache_size = cache_size
+        self.local = threading.local()
+
+    def get_cache(self):
+        if not hasattr(self.local, "cache"):
+            self.local.cache = ModelCache(self.cache_size)
+        return self.local.cache
+
+    def __call__(self, job, emit):
+        if job.control.cancelled():
+            return None
+
+        config = job_config(job.config)
+        model = self.get_cache().load(job.instance, config)
+        methods = self.methods_factory(config)
+        search = iter_kernel_search(
+            job.instance, config, methods, control=job.control, model=model
+        )
+        while True:
+            try:
+                improvement = next(search)
+            except StopIteration as stop:
+                return stop.value
+            emit(
+                {
+                    "event": "incumbent",
+                    "value": improvement.value,
+                    "time": improvement.time,
+                    "iteration": improvement.iteration,
+                    "bucket": improvement.bucket,
+                }
+            )
+
+
+class JobServer:
+    """
+    Accept jobs as a JSON line and stream back, as JSON lines,
+    the 'queued', 'started', 'incumbent' and finally the 'finish'
+    or 'error' events. At most 'workers' jobs run at the same time,
+    the others wait in a queue of at most queue_size jobs.
+    Closing the connection, or sending {"event": "cancel"},
+    cancels the job.
+    """
+
+    def __init__(self, runner, workers=DEF_WORKERS, queue_size=DEF_QUEUE_SIZE):
+        self.runner = runner
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(workers)
+        # created in the server loop: before Python 3.10 asyncio
+        # primitives bind to the loop current at their creation
+        self.slots = None
+        self.futures = set()
+        self.queue_size = queue_size
+        self.pending = 0
+        self.ids = itertools.count()
+
+    async def handle(self, reader, writer):
+        try:
+            job = Job(next(self.ids), json.loads(await reader.readline()))
+        except (ValueError, KeyError, TypeError) as err:
+            await send_event(writer, {"event": "error", "message": f"bad job: {err}"})
+            writer.close()
+            return
+
+        if self.pending >= self.queue_size:
+            await send_event(writer, {"event": "error", "message": "queue full"})
+            writer.close()
+            job.control.close()
+            return
+
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.workers)
+        self.pending += 1
+        watcher = asyncio.create_task(watch_client(reader, job))
+        try:
+            await self.send(writer, job, {"event": "queued", "job": job.id})
+            async with self.slots:
+                await self.send(writer, job, {"event": "started", "job": job.id})
+                begin = time.time()
+                best = await self.run(job, writer)
+            event = {
+                "event": "finish",
+                "job": job.id,
+                "value": best.value if best else None,
+                "time": time.time() - begin,
+                "cancelled": job.control.cancelled(),
+            }
+            if best and job.send_solution:
+                event["solution"] = best.vars
+            await self.send(writer, job, event)
+        except Exception as err:
+            await self.send(writer, job, {"event": "error", "message": str(err)})
+        finally:
+            self.pending -= 1
+            watcher.cancel()
+            job.control.close()
+            writer.close()
+
+    async def run(self, job, writer):
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+
+        def emit(event):
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+        task = self.executor.submit(self.runner, job, emit)
+        self.futures.add(task)
+        task.add_done_callback(self.futures.discard)
+        future = asyncio.wrap_future(task, loop=loop)
+        # events emitted by the runner are queued before its completion
+        while not future.done() or not events.empty():
+            getter = asyncio.ensure_future(events.get())
+            done, _ = await asyncio.wait(
+                {getter, future}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if getter in done:
+                await self.send(writer, job, getter.result())
+            else:
+                getter.cancel()
+        return await future
+
+    async def send(self, writer, job, event):
+        try:
+            await send_event(writer, event)
+        except ConnectionError:
+            job.control.cancel()
+
+    def close(self):
+        # shutdown cancel_futures needs Python 3.9
+        for future in list(self.futures):
+            future.cancel()
+        self.executor.shutdown(wait=False)
+
+
+async def send_event(writer, event):
+    writer.write((json.dumps(event) + "\n").encode())
+    await writer.drain()
+
+
+async def watch_client(reader, job):
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict) and event.get("event") == "cancel":
+            break
+    job.control.cancel()
+
+
+async def start_server(server, path=None, host="127.0.0.1", port=0):
+    """
+    Listen on the given Unix socket path or, when
+    not given, on TCP host and port.
+    """
+    if path:
+        output = await asyncio.start_unix_server(server.handle, path)
+    else:
+        output = await asyncio.start_server(server.handle, host, port)
+    return output
+
+
+def submit(address, request):
+    """
+    Send a job to the server at address, a Unix socket path
+    or a (host, port) pair, and yield the streamed events.
+    """
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.connect(address)
+        sock.sendall((json.dumps(request) + "\n").encode())
+        with sock.makefile() as file:
+            for line in file:
+                event = json.loads(line)
+                yield event
+                if event["event"] in END_EVENTS:
+                    return
@@ -11,10 +11,12 @@ class Selector:
 
     """
     Selector allows client code to safely choose between available
-    algorithms.
+    algorithms. Algorithms can also be provided by third party
+    packages through entry points: they are loaded only when
+    requested.
     """
 
-    def __init__(self, base_store, default):
+    def __init__(self, base_store, default, group=None):
         """
         Parameters
         ----------
@@ -24,9 +26,14 @@ class Selector:
         default: function
             the default function between the available ones
 
+        group: str
+            entry point group searched for algorithms
+            missing from the store
+
         """
         self.store = base_store
         self.default = default
+        self.group = group
 
     def add_algorithm(self, name, function):
         """
@@ -67,11 +74,42 @@ class Selector:
             the function associated to the given name if
             it is available, None otherwise.
         """
-        return self.store.get(name)
+        try:
+            return self.store[name]
+        except KeyError:
+            pass
+
+        if function := self.load_entry_point(name):
+            self.store[name] = function
+        return function
+
+    def load_entry_point(self, name):
+        if self.group is None:
+            return None
+
+        for entry_point in find_entry_points(self.group):
+            if entry_point.name == name:
+                return entry_point.load()
+        return None
+
+
+def find_entry_points(group):
+    # importlib.metadata is slow to import: load it only when required
+    from importlib.metadata import entry_points
+
+    available = entry_points()
+    if hasattr(available, "select"):
+        return available.select(group=group)
+    # Python < 3.10
+    return available.get(group, [])
 
 
-bucket_builders = Selector(BUCKET_BUILDERS, fixed_size_bucket)
-kernel_builders = Selector(KERNEL_BUILDERS, base_kernel_builder)
+bucket_builders = Selector(
+    BUCKET_BUILDERS, fixed_size_bucket, "ks_engine.bucket_builders"
+)
+kernel_builders = Selector(
+    KERNEL_BUILDERS, base_kernel_builder, "ks_engine.kernel_builders"
+)
 
-kernel_sorters = Selector(KERNEL_SORTERS, kernel_sort)
-bucket_sorters = Selector(BUCKET_SORT, bucket_sort)
+kernel_sorters = Selector(KERNEL_SORTERS, kernel_sort, "ks_engine.kernel_sorters")
+bucket_sorters = Selector(BUCKET_SORT, bucket_sort, "ks_engine.bucket_sorters")
@@ -4,6 +4,8 @@
 
 import math
 
+from .graph_bucket import graph_bucket
+
 
 def fixed_size_bucket(base, values, sorter, sorter_conf, size=1, count=0):
     variables = sorter(base, values, **sorter_conf)
@@ -53,4 +55,72 @@ def __decreasing_size_buckets_builder__(variables, count, size):
         blocks >>= 1
 
 
-BUCKET_BUILDERS = {"fixed": fixed_size_bucket, "decrease": decresing_size_bucket}
+def adaptive_size_bucket(
+    base,
+    values,
+    sorter,
+    sorter_conf,
+    target_time,
+    size=1,
+    count=0,
+    min_size=1,
+    max_size=0,
+):
+    variables = sorter(base, values, **sorter_conf)
+    length = len(variables)
+    if count:
+        size = length // count
+    if size == 0:
+        raise ValueError(
+            f"Variable outside kernel [{length}] are not enough for {count} buckets"
+        )
+    return AdaptiveBuckets(variables, size, target_time, min_size, max_size)
+
+
+class AdaptiveBuckets:
+    """
+    Lazily split variables into buckets whose size is updated,
+    after each bucket solution, to meet the target solve time.
+    """
+
+    MIN_FACTOR = 0.5
+    MAX_FACTOR = 2.0
+
+    def __init__(self, variables, size, target_time, min_size=1, max_size=0):
+        self.variables = variables
+        self.target_time = target_time
+        self.min_size = max(1, min_size)
+        self.max_size = max_size or len(variables)
+        self.size = self.__clamp__(size)
+
+    def __iter__(self):
+        start = 0
+        length = len(self.variables)
+        while start < length:
+            end = start + self.size
+            yield self.variables[start:end]
+            start = end
+
+    def update_size(self, time, status):
+        if status == "TIME_LIMIT":
+            factor = self.MIN_FACTOR
+        else:
+            # sub problems hardness does not grow linearly with size
+            ratio = self.target_time / max(time, 1e-3)
+            factor = min(max(ratio**0.5, self.MIN_FACTOR), self.MAX_FACTOR)
+        self.size = self.__clamp__(int(self.size * factor))
+
+    def carry_size(self, other):
+        if isinstance(other, AdaptiveBuckets):
+            self.size = self.__clamp__(other.size)
+
+    def __clamp__(self, size):
+        return min(max(size, self.min_size), self.max_size)
+
+
+BUCKET_BUILDERS = {
+    "fixed": fixed_size_bucket,
+    "decrease": decresing_size_bucket,
+    "adaptive": adaptive_size_bucket,
+    "graph": graph_bucket,
+}
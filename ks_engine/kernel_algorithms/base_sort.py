@@ -4,7 +4,9 @@
 # Copyright (c) 2019 Filippo Ranza <filipporanza@gmail.com>
 # Modified in 2020 by Marco De Ramundo
 
-import numpy as np
+from ..lazy_import import LazyModule
+
+np = LazyModule("numpy")
 
 # support function for cheb sort
 
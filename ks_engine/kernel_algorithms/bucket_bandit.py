@@ -0,0 +1,124 @@
+#! /usr/bin/python
+
+import math
+
+from .algorithm_selection import bucket_builders, bucket_sorters
+
+DEF_EXPLORATION = 1.0
+
+
+class BucketArm:
+    """
+    A bucket strategy: builder and sorter with their configuration.
+    """
+
+    def __init__(self, builder, sorter, builder_conf, sorter_conf):
+        self.builder = get_algorithm(bucket_builders, builder)
+        self.sorter = get_algorithm(bucket_sorters, sorter)
+        self.name = f"{builder}/{sorter}"
+        self.builder_conf = builder_conf
+        self.sorter_conf = sorter_conf
+
+    @classmethod
+    def from_config(cls, conf, default):
+        """
+        Build the arm from a BUCKET_BANDIT.ARMS entry: missing
+        values come from the base configuration default. The
+        algorithm configurations are inherited only by arms
+        using the same algorithm.
+        """
+        builder = conf.get("BUCKET", default["BUCKET"])
+        sorter = conf.get("BUCKET_SORTER", default["BUCKET_SORTER"])
+        if builder == default["BUCKET"]:
+            builder_conf = conf.get("BUCKET_CONF", default["BUCKET_CONF"])
+        elif "BUCKET_CONF" in conf:
+            builder_conf = conf["BUCKET_CONF"]
+        else:
+            raise ValueError(f"Bucket bandit arm {builder} requires a BUCKET_CONF")
+        if sorter == default["BUCKET_SORTER"]:
+            sorter_conf = conf.get("BUCKET_SORTER_CONF", default["BUCKET_SORTER_CONF"])
+        else:
+            sorter_conf = conf.get("BUCKET_SORTER_CONF", {})
+        return cls(builder, sorter, builder_conf, sorter_conf)
+
+    def apply(self, methods, config):
+        methods = methods._replace(bucket_builder=self.builder, bucket_sort=self.sorter)
+        config = {
+            **config,
+            "BUCKET_CONF": self.builder_conf,
+            "BUCKET_SORTER_CONF": self.sorter_conf,
+        }
+        return methods, config
+
+
+def get_algorithm(selector, name):
+    output = selector.get_algorithm(name)
+    if output is None:
+        raise ValueError(f"Unknown bucket algorithm: {name}")
+    return output
+
+
+class BucketBandit:
+    """
+    UCB1 selection between bucket strategies. The reward of an
+    arm is the relative objective improvement per second of solver
+    time of the iteration run with its buckets; rewards are scaled
+    by the largest one seen so far.
+    """
+
+    def __init__(self, arms, exploration=DEF_EXPLORATION):
+        self.arms = arms
+        self.exploration = exploration
+        self.counts = [0] * len(arms)
+        self.totals = [0.0] * len(arms)
+        self.max_reward = 0.0
+        # the initial buckets come from the base configuration
+        self.current = 0
+
+    def score(self, index):
+        count = self.counts[index]
+        mean = self.totals[index] / count
+        if self.max_reward > 0:
+            mean /= self.max_reward
+        steps = sum(self.counts)
+        return mean + self.exploration * math.sqrt(2 * math.log(steps) / count)
+
+    def select(self):
+        for index, count in enumerate(self.counts):
+            if count == 0:
+                break
+        else:
+            index = max(range(len(self.arms)), key=self.score)
+        self.current = index
+        return self.arms[index]
+
+    def update(self, reward):
+        self.counts[self.current] += 1
+        self.totals[self.current] += reward
+        self.max_reward = max(self.max_reward, reward)
+
+    def builders(self):
+        return [arm.builder for arm in self.arms]
+
+    def report(self):
+        return ", ".join(
+            f"{arm.name}: {count}" for arm, count in zip(self.arms, self.counts)
+        )
+
+
+def improvement_reward(before, after, solver_time, minimize):
+    if before is None or after is None:
+        return 0.0
+    sense = 1 if minimize else -1
+    improvement = sense * (before - after) / max(abs(before), 1.0)
+    return max(improvement, 0.0) / max(solver_time, 1e-3)
+
+
+def bucket_bandit_factory(config):
+    conf = config.get("BUCKET_BANDIT")
+    if not conf:
+        return None
+
+    arms = [BucketArm.from_config(config, config)]
+    arms += [BucketArm.from_config(arm, config) for arm in conf["ARMS"]]
+    return BucketBandit(arms, conf.get("EXPLORATION", DEF_EXPLORATION))
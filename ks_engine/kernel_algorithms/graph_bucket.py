@@ -0,0 +1,115 @@
+#! /usr/bin/python
+
+import heapq
+
+from ..lazy_import import LazyModule
+
+sparse = LazyModule("scipy.sparse")
+
+DEF_MAX_ROW_SIZE = 1000
+
+
+class ConstraintGraph:
+    """
+    Variable-constraint incidence of a model, used to group
+    into the same bucket variables that share constraints.
+    """
+
+    def __init__(self, var_names, matrix):
+        self.var_names = list(var_names)
+        self.index = {name: i for i, name in enumerate(self.var_names)}
+        self.by_row = sparse.csr_matrix(matrix)
+        self.by_col = self.by_row.tocsc()
+        self.row_size = self.by_row.getnnz(axis=1)
+
+    @classmethod
+    def from_model(cls, model):
+        names = model.getAttr("VarName", model.getVars())
+        return cls(names, model.getA())
+
+    def rows(self, col):
+        start, end = self.by_col.indptr[col], self.by_col.indptr[col + 1]
+        return self.by_col.indices[start:end].tolist()
+
+    def row_vars(self, row):
+        start, end = self.by_row.indptr[row], self.by_row.indptr[row + 1]
+        return self.by_row.indices[start:end].tolist()
+
+
+def graph_bucket(
+    base,
+    values,
+    sorter,
+    sorter_conf,
+    graph,
+    size=1,
+    count=0,
+    max_row_size=DEF_MAX_ROW_SIZE,
+):
+    variables = sorter(base, values, **sorter_conf)
+    length = len(variables)
+    if count:
+        size = length // count
+    if size == 0:
+        raise ValueError(
+            f"Variable outside kernel [{length}] are not enough for {count} buckets"
+        )
+    return _graph_bucket_builder__(variables, graph, size, max_row_size)
+
+
+# the graph is built once by kernel_search and passed as 'graph'
+graph_bucket.requires_graph = True
+
+
+def _graph_bucket_builder__(variables, graph, size, max_row_size):
+    """
+    Grow each bucket from the best ranked free variable, adding
+    the variables with the strongest connection to the bucket:
+    each shared constraint weights 1 / (row size - 1). Ties,
+    and new seeds when the bucket has no neighbours left, follow
+    the sorter rank. Rows larger than max_row_size link nearly
+    every variable and are ignored.
+    """
+    order = [graph.index[var] for var in variables]
+    rank = {col: i for i, col in enumerate(order)}
+    free = set(order)
+    next_seed = 0
+
+    while free:
+        bucket = []
+        gain = {}
+        frontier = []
+        while len(bucket) < size and free:
+            col = pop_best(frontier, gain, free)
+            if col is None:
+                while order[next_seed] not in free:
+                    next_seed += 1
+                col = order[next_seed]
+
+            free.remove(col)
+            gain.pop(col, None)
+            bucket.append(graph.var_names[col])
+            add_neighbours(graph, col, free, gain, frontier, rank, max_row_size)
+
+        yield bucket
+
+
+def pop_best(frontier, gain, free):
+    while frontier:
+        weight, _, col = heapq.heappop(frontier)
+        # skip stale entries, pushed before a gain update
+        if col in free and gain.get(col) == -weight:
+            return col
+    return None
+
+
+def add_neighbours(graph, col, free, gain, frontier, rank, max_row_size):
+    for row in graph.rows(col):
+        row_size = graph.row_size[row]
+        if row_size < 2 or row_size > max_row_size:
+            continue
+        weight = 1 / (row_size - 1)
+        for other in graph.row_vars(row):
+            if other in free:
+                gain[other] = gain.get(other, 0) + weight
+                heapq.heappush(frontier, (-gain[other], rank[other], other))
@@ -1,24 +1,45 @@
 #! /usr/bin/python
 
 # Copyright (c) 2019 Filippo Ranza <filipporanza@gmail.com>
-from collections import namedtuple
+from collections import deque, namedtuple, OrderedDict
+import hashlib
 import time
-from numpy import random
-import numpy as np
 
+from .lazy_import import LazyModule
 from .model import Model, model_loarder
-from .solution import DebugIndex, DebugInfo
+from .solution import DebugData, DebugIndex, DebugInfo, Solution
 from .worsen_score import WorsenScore, MockWorsenScore
-from .feature_kernel import init_feature_kernel
 from .constraint_manager import enable_lazy_constraints
 from .variable_scoring import variable_score_factory, callback_factory
-
+from .distributed import coordinator_factory
+from .feasibility import read_model
+from .first_order_lp import approximate_lp_solution
+from .reduced_cost_fixing import reduced_cost_fixing_factory
+from .sub_problem_capture import sub_problem_capture_factory
+from .solver_trace import solver_trace_factory
+from .kernel_algorithms.base_bucket import AdaptiveBuckets
+from .kernel_algorithms.graph_bucket import ConstraintGraph
+from .kernel_algorithms.bucket_bandit import bucket_bandit_factory, improvement_reward
+from .results_store import run_recorder_factory
+from .metrics import metrics_factory
+from .progress_stream import progress_stream_factory
+from .search_control import SearchControl
+from .early_stop import stop_policy_factory
+
+
+random = LazyModule("numpy.random")
+
+OPTIMALITY_TOL = 1e-6
 
 KernelMethods = namedtuple(
     "KernelMethods",
     ["kernel_sort", "kernel_builder", "bucket_sort", "bucket_builder"],
 )
 
+Improvement = namedtuple(
+    "Improvement", ["value", "solution", "time", "iteration", "bucket"]
+)
+
 
 class KernelSearchInstance:
     def __init__(
@@ -33,6 +54,14 @@ class KernelSearchInstance:
         worsen_score,
         callback,
         var_score,
+        result_cache=None,
+        incumbent_store=None,
+        lp_bound=None,
+        coordinator=None,
+        fixing=None,
+        control=None,
+        capture=None,
+        trace=None,
     ):
         self.preload_model = preload_model
         self.kernel_methods = kernel_methods
@@ -44,9 +73,92 @@ class KernelSearchInstance:
         self.worsen_score = worsen_score
         self.callback = callback
         self.var_score = var_score
+        self.result_cache = result_cache
+        self.incumbent_store = incumbent_store
+        self.lp_bound = lp_bound
+        self.coordinator = coordinator
+        self.fixing = fixing
+        self.control = control or SearchControl()
+        self.capture = capture
+        self.trace = trace
+        self.last_debug = None
+        self.solver_time = 0.0
+
+
+SubProblemResult = namedtuple("SubProblemResult", ["status", "value", "variables"])
+
+
+class SubProblemCache:
+    """
+    Bounded LRU store of bucket sub problem outcomes.
+    """
+
+    def __init__(self, max_size):
+        self.store = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        try:
+            result = self.store[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.store.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def add(self, key, result):
+        self.store[key] = result
+        self.store.move_to_end(key)
+        while len(self.store) > self.max_size:
+            self.store.popitem(last=False)
+
+
+def sub_problem_cache_factory(config):
+    if size := config.get("BUCKET_CACHE"):
+        output = SubProblemCache(size)
+    else:
+        output = None
+    return output
+
+
+def sub_problem_key(kernel, bucket, cutoff, solution):
+    digest = hashlib.sha256()
+    for name in sorted(str(k) for k, v in kernel.items() if v):
+        digest.update(name.encode() + b"\0")
+    digest.update(b"\1")
+    for name in sorted(str(var) for var in bucket):
+        digest.update(name.encode() + b"\0")
+
+    value = solution.value if solution else None
+    digest.update(f"\1{cutoff}\1{value}".encode())
+    return digest.hexdigest()
+
+
+def build_sub_problem_result(status, solution):
+    if solution is None:
+        return SubProblemResult(status, None, None)
+
+    return SubProblemResult(status, solution.value, solution.nonzero_vars())
 
 
-def run_solution(model, config):
+def restore_sub_problem_result(result, kernel, prev_sol=None):
+    gen = ((name, result.variables.get(name, 0.0)) for name in kernel)
+    if prev_sol:
+        prev_sol.update(result.value, gen)
+    else:
+        prev_sol = Solution(result.value, gen)
+    return prev_sol
+
+
+def run_solution(model, config, control=None):
+    if control:
+        with control.running(model.model):
+            return run_solution(model, config)
+
     if config["GLOBAL_TIME_LIMIT"] == -1:
         stat = model.run()
     else:
@@ -58,7 +170,12 @@ def run_solution(model, config):
 
 
 def run_with_global_time_limit(model, time_limit):
-    model.set_time_limit(time_limit)
+    # a shorter phase time limit from SOLVER_PROFILES is kept,
+    # TIME_LIMIT is not: each solve may use the remaining time
+    if model.phase_time_limit is not None:
+        model.set_time_limit(min(time_limit, model.phase_time_limit))
+    else:
+        model.set_time_limit(time_limit)
     timer = Timer()
 
     stat = model.run()
@@ -83,34 +200,67 @@ class Timer:
         return elapsed
 
 
-def init_kernel(model, config, kernel_builder, kernel_sort, mps_file):
-    lp_model = Model(model, config, True)
-    stat = run_solution(lp_model, config)
+def init_kernel(model, config, kernel_builder, kernel_sort, mps_file, control=None):
+    if lp_conf := config.get("APPROX_LP"):
+        base, values, tmp_sol = init_approximate_lp(model, config, lp_conf)
+    else:
+        lp_model = Model(model, config, True, phase="LP")
+        stat = run_solution(lp_model, config, control)
 
-    if not stat:
-        raise ValueError(f"Given Problem: {mps_file} has no LP solution")
+        if not stat:
+            raise ValueError(f"Given Problem: {mps_file} has no LP solution")
 
-    base = lp_model.get_base_variables()
-    values = lp_model.build_lp_solution()
-    tmp_sol = lp_model.build_solution()
+        base = lp_model.get_base_variables()
+        values = lp_model.build_lp_solution()
+        values.value = proven_lp_bound(lp_model)
+        tmp_sol = lp_model.build_solution()
 
+    # values of variables at zero in the LP are their reduced costs
+    reduced_costs = {k: values.vars[k] for k, v in base.items() if not v}
     kernel = kernel_builder(
         base, values, kernel_sort, config["KERNEL_SORTER_CONF"], **config["KERNEL_CONF"]
     )
 
-    int_model = Model(model, config, False)
+    int_model = Model(model, config, False, phase="KERNEL")
     if config.get("PRELOAD_FILE"):
         int_model.preload_from_file()
 
     int_model.preload_solution(tmp_sol)
     int_model.disable_variables(kernel)
-    stat = run_solution(int_model, config)
+    stat = run_solution(int_model, config, control)
     if stat:
         out = int_model.build_solution()
     else:
         out = None
 
-    return out, kernel, values
+    return out, kernel, values, reduced_costs
+
+
+def proven_lp_bound(lp_model):
+    """
+    LP relaxation objective, a valid bound for the MIP only
+    when the LP was solved to optimality: None otherwise, as
+    after a time limit.
+    """
+    if lp_model.is_optimal():
+        return lp_model.model.objVal
+    print("LP relaxation not solved to optimality: no valid LP bound")
+    return None
+
+
+def init_approximate_lp(model, config, lp_conf):
+    if not isinstance(lp_conf, dict):
+        lp_conf = {}
+    time_limit = config["GLOBAL_TIME_LIMIT"]
+    if time_limit != -1:
+        limit = min(lp_conf.get("TIME_LIMIT", time_limit), time_limit)
+        lp_conf = {**lp_conf, "TIME_LIMIT": limit}
+
+    timer = Timer()
+    output = approximate_lp_solution(read_model(model), lp_conf)
+    if time_limit != -1:
+        config["GLOBAL_TIME_LIMIT"] = max(time_limit - timer.get_elapsed_time(), 0)
+    return output
 
 
 def add_remove_vars(base_kernel, bucket, add):
@@ -132,44 +282,169 @@ def update_kernel(base_kernel, bucket, solution, null):
             base_kernel[var] = False
 
 
+def screen_bucket(instance, bucket, cutoff):
+    lp_model = Model(instance.preload_model, instance.config, True, phase="SCREENING")
+    lp_model.disable_variables(instance.kernel)
+    lp_model.add_bucket_contraints(None, bucket)
+    stat = run_solution(lp_model, instance.config, instance.control)
+
+    if lp_model.is_infeasible():
+        status = "LP_INFEASIBLE"
+    elif stat and cutoff and instance.current_solution:
+        margin = instance.config.get("LP-SCREENING-MARGIN", 0.0)
+        value = instance.current_solution.value
+        status = None if lp_model.bound_improves(value, margin) else "LP_CUTOFF"
+    else:
+        status = None
+
+    return status, lp_model
+
+
+def use_cutoff(instance):
+    prob = instance.worsen_score.get_probability()
+    cutoff = random.random() >= prob
+    if not cutoff:
+        print(
+            "Accept worst: ", instance.worsen_score.score, instance.worsen_score.total
+        )
+    return cutoff
+
+
 def run_extension(
     instance,
     bucket,
     bucket_index,
     iteration_index,
 ):
-    model = Model(instance.preload_model, instance.config, callback=instance.callback)
-    model.disable_variables(instance.kernel)
-    prob = instance.worsen_score.get_probability()
-    cutoff = random.random() >= prob
-    if not cutoff:
-        print(
-            "Accept worst: ", instance.worsen_score.score, instance.worsen_score.total
+    cutoff = use_cutoff(instance)
+    cache = instance.result_cache
+    if cache is None:
+        _, solution = solve_extension(
+            instance, bucket, bucket_index, iteration_index, cutoff
+        )
+        return solution
+
+    key = sub_problem_key(instance.kernel, bucket, cutoff, instance.current_solution)
+    if result := cache.get(key):
+        print("Cached:", result.status)
+        return load_cached_extension(
+            instance, result, bucket, bucket_index, iteration_index
+        )
+
+    status, solution = solve_extension(
+        instance, bucket, bucket_index, iteration_index, cutoff
+    )
+    cache.add(key, build_sub_problem_result(status, solution))
+    return solution
+
+
+def load_cached_extension(instance, result, bucket, bucket_index, iteration_index):
+    if result.value is None:
+        return None
+
+    solution = restore_sub_problem_result(
+        result, instance.kernel, instance.current_solution
+    )
+    if instance.logger:
+        debug_index = DebugIndex(iteration_index, bucket_index)
+        debug_data = DebugData(
+            value=result.value,
+            time=0,
+            nodes=0,
+            kernel_size=sum(instance.kernel.values()),
+            bucket_size=len(bucket),
+            status="CACHED",
         )
+        instance.logger.add_data(debug_data, debug_index)
+
+    return solution
+
+
+def solve_extension(instance, bucket, bucket_index, iteration_index, cutoff):
+    if instance.config.get("LP-SCREENING"):
+        skip, lp_model = screen_bucket(instance, bucket, cutoff)
+        if skip:
+            print("Skip bucket:", skip)
+            if instance.logger:
+                debug_index = DebugIndex(iteration_index, bucket_index)
+                debug_data = lp_model.build_skip_debug(
+                    sum(instance.kernel.values()), len(bucket), skip
+                )
+                instance.logger.add_data(debug_data, debug_index)
+            return skip, None
+
+    model = Model(
+        instance.preload_model,
+        instance.config,
+        callback=instance.callback,
+        phase="BUCKET",
+    )
+    model.set_stop_policy(
+        stop_policy_factory(
+            instance.config,
+            instance.current_solution,
+            cutoff,
+            is_minimize(instance.preload_model),
+        )
+    )
+    model.disable_variables(instance.kernel)
 
     model.add_bucket_contraints(instance.current_solution, bucket, cutoff)
     model.preload_solution(instance.current_solution)
-
-    stat = run_solution(model, instance.config)
-    print(model.get_status())
+    if instance.trace:
+        model.set_trace(instance.trace.recorder())
+
+    stat = run_solution(model, instance.config, instance.control)
+    status = model.get_status()
+    print(status)
+    debug_data = model.build_debug(sum(instance.kernel.values()), len(bucket))
+    instance.last_debug = debug_data
+    if instance.trace:
+        debug_index = DebugIndex(iteration_index, bucket_index)
+        instance.trace.add(debug_index, model.trace, debug_data, model.get_bound())
+    if instance.capture:
+        capture_extension(
+            instance, model, bucket, bucket_index, iteration_index, cutoff
+        )
     if not stat:
-        return None
+        return status, None
 
     solution = model.build_solution(instance.current_solution)
-    if instance.config["DEBUG"]:
+    if instance.logger:
         debug_index = DebugIndex(iteration_index, bucket_index)
-        debug_data = model.build_debug(sum(instance.kernel.values()), len(bucket))
         instance.logger.add_data(debug_data, debug_index)
 
-    return solution
+    return status, solution
 
 
-def initialize(model, conf, methods, mps_file):
+def capture_extension(instance, model, bucket, bucket_index, iteration_index, cutoff):
+    current = instance.current_solution
+    instance.capture.capture(
+        model,
+        DebugIndex(iteration_index, bucket_index),
+        instance.kernel,
+        bucket,
+        current.value if current and cutoff else None,
+        current,
+        instance.last_debug,
+    )
+
+
+def initialize(model, conf, methods, mps_file, graph=None, control=None):
     if conf.get("FEATURE_KERNEL"):
+        # scikit-learn is slow to import: load it only when required
+        from .feature_kernel import init_feature_kernel
+
         curr_sol, base_kernel, values = init_feature_kernel(model, conf)
+        reduced_costs = None
     else:
-        curr_sol, base_kernel, values = init_kernel(
-            model, conf, methods.kernel_builder, methods.kernel_sort, mps_file
+        curr_sol, base_kernel, values, reduced_costs = init_kernel(
+            model,
+            conf,
+            methods.kernel_builder,
+            methods.kernel_sort,
+            mps_file,
+            control,
         )
 
     if ill_kernel(base_kernel):
@@ -182,10 +457,10 @@ def initialize(model, conf, methods, mps_file):
         var_score,
         methods.bucket_sort,
         conf["BUCKET_SORTER_CONF"],
-        **conf["BUCKET_CONF"],
+        **bucket_conf(conf, graph, methods.bucket_builder),
     )
 
-    return curr_sol, base_kernel, buckets, var_score
+    return curr_sol, base_kernel, buckets, var_score, values.value, reduced_costs
 
 
 def ill_kernel(base_kernel):
@@ -201,7 +476,83 @@ def check_time_out(instance: KernelSearchInstance):
     else:
         output = False
 
-    return output
+    if store := instance.incumbent_store:
+        output = output or store.stopped()
+
+    return output or instance.control.cancelled()
+
+
+def is_minimize(model):
+    return model.getAttr("ModelSense") == 1
+
+
+def sync_incumbent(instance):
+    store = instance.incumbent_store
+    if store is None:
+        return
+
+    value = store.get_value()
+    curr = instance.current_solution
+    minimize = is_minimize(instance.preload_model)
+    if value is None or (curr and not is_better(value, curr.value, minimize)):
+        return
+
+    if best := store.best():
+        print("Use shared incumbent:", best.value)
+        instance.current_solution = best
+
+
+def publish_incumbent(instance, solution):
+    store = instance.incumbent_store
+    if store is None or solution is None:
+        return
+
+    minimize = is_minimize(instance.preload_model)
+    if store.offer(solution.value, solution.vars.items(), minimize):
+        if is_proven_optimal(solution.value, instance.lp_bound):
+            print("Incumbent matches the LP bound: stop now!")
+            store.stop()
+
+
+def is_better(value, reference, minimize):
+    if minimize:
+        return value < reference
+    return value > reference
+
+
+def is_proven_optimal(value, lp_bound):
+    """
+    Whether value matches the LP bound. lp_bound comes from
+    proven_lp_bound: None when the LP relaxation was not solved
+    to optimality; then nothing is proven.
+    """
+    if lp_bound is None:
+        return False
+    return abs(value - lp_bound) <= OPTIMALITY_TOL * max(1.0, abs(value))
+
+
+def fix_variables(instance):
+    fixing = instance.fixing
+    curr = instance.current_solution
+    if fixing is None or curr is None:
+        return
+
+    fixed = fixing.update(curr.value)
+    if fixed:
+        unselect_vars(instance.kernel, fixed)
+        print(fixing.report())
+
+
+def filter_bucket(instance, bucket):
+    if instance.fixing is None:
+        return bucket
+    return instance.fixing.filter_bucket(bucket)
+
+
+def unfixed_vars(instance, bucket):
+    if instance.fixing is None:
+        return bucket
+    return instance.fixing.unfixed(bucket)
 
 
 def print_kernel_size(kernel):
@@ -210,15 +561,36 @@ def print_kernel_size(kernel):
 
 
 def solve_buckets(instance, iteration):
+    """
+    Solve the instance buckets, yielding an Improvement
+    for each better incumbent. Return the current
+    and the best solution.
+    """
+    if instance.coordinator:
+        return (yield from solve_buckets_distributed(instance, iteration))
+
     local_best = instance.current_solution
     # best_kernel = base_kernel.copy()
     for index, buck in enumerate(instance.buckets):
+        if instance.control.cancelled():
+            break
+        sync_incumbent(instance)
+        fix_variables(instance)
+        buck = filter_bucket(instance, buck)
+        if not buck:
+            continue
         select_vars(instance.kernel, buck)
+        instance.last_debug = None
         sol = run_extension(instance, buck, index, iteration)
+        update_bucket_size(instance.buckets, instance.last_debug)
+        if instance.last_debug:
+            instance.solver_time += instance.last_debug.time
         print_kernel_size(instance.kernel)
         if sol:
             print(sol.value)
             instance.current_solution = sol
+            publish_incumbent(instance, sol)
+            yield from report_incumbent(instance, sol, DebugIndex(iteration, index))
             local_best = get_best_solution(
                 instance.current_solution, local_best, instance.preload_model
             )
@@ -241,6 +613,127 @@ def solve_buckets(instance, iteration):
     return instance.current_solution, local_best
 
 
+def record_incumbent(instance, solution, index):
+    logger = instance.logger
+    if logger is None or solution is None:
+        return
+
+    last = logger.last_incumbent()
+    minimize = is_minimize(instance.preload_model)
+    if last is None or is_better(solution.value, last, minimize):
+        logger.add_incumbent(solution.value, index)
+
+
+def report_incumbent(instance, solution, index):
+    record_incumbent(instance, solution, index)
+    control = instance.control
+    if solution is None:
+        return
+
+    minimize = is_minimize(instance.preload_model)
+    if control.best is None or is_better(solution.value, control.best, minimize):
+        control.best = solution.value
+        yield Improvement(
+            solution.value,
+            solution.copy(),
+            control.elapsed(),
+            index.iteration,
+            index.bucket,
+        )
+
+
+def update_bucket_size(buckets, debug):
+    if debug and isinstance(buckets, AdaptiveBuckets):
+        buckets.update_size(debug.time, debug.status)
+
+
+def solve_buckets_distributed(instance, iteration):
+    coordinator = instance.coordinator
+    minimize = is_minimize(instance.preload_model)
+    local_best = instance.current_solution
+    pending = deque(enumerate(instance.buckets))
+    in_flight = {}
+    timer = Timer()
+    while pending or in_flight:
+        while pending and len(in_flight) < coordinator.capacity():
+            index, buck = pending.popleft()
+            fix_variables(instance)
+            buck = filter_bucket(instance, buck)
+            if not buck:
+                continue
+            curr = instance.current_solution
+            cutoff = curr.value if curr and use_cutoff(instance) else None
+            time_limit = get_global_time_limit(instance.config)
+            task_id = coordinator.submit(
+                instance.kernel, buck, cutoff, curr, time_limit
+            )
+            kernel_size = sum(instance.kernel.values()) + len(buck)
+            in_flight[task_id] = (index, buck, kernel_size)
+
+        if not in_flight:
+            # every pending bucket was emptied by reduced cost fixing
+            continue
+
+        result = coordinator.next_result()
+        index, buck, kernel_size = in_flight.pop(result["id"])
+        instance.solver_time += result["time"]
+        update_global_time_limit(instance.config, timer.get_elapsed_time())
+        print(result["status"])
+
+        sol = coordinator.decode_solution(result)
+        if sol:
+            print(sol.value)
+            curr = instance.current_solution
+            if curr is None or is_better(sol.value, curr.value, minimize):
+                instance.current_solution = sol
+                local_best = get_best_solution(
+                    instance.current_solution, local_best, instance.preload_model
+                )
+                yield from report_incumbent(instance, sol, DebugIndex(iteration, index))
+            # variables may have been fixed after the bucket submission
+            fix_variables(instance)
+            select_vars(instance.kernel, unfixed_vars(instance, buck))
+            if instance.config.get("REMOVE-UNSET"):
+                update_kernel(instance.kernel, buck, sol, 0)
+            instance.var_score.success_update_score(instance.kernel, buck)
+            if instance.logger:
+                debug_index = DebugIndex(iteration, index)
+                debug_data = DebugData(
+                    value=sol.value,
+                    time=result["time"],
+                    nodes=result["nodes"],
+                    kernel_size=kernel_size,
+                    bucket_size=len(buck),
+                    status=result["status"],
+                )
+                instance.logger.add_data(debug_data, debug_index)
+        else:
+            print("No sol")
+            allow_kernel_growth = (
+                instance.current_solution is None
+                and instance.config.get("KERNEL-GROWTH")
+            )
+            if allow_kernel_growth:
+                select_vars(instance.kernel, unfixed_vars(instance, buck))
+            instance.var_score.failure_update_score(instance.kernel, buck)
+
+        if check_time_out(instance):
+            pending.clear()
+
+    return instance.current_solution, local_best
+
+
+def get_global_time_limit(config):
+    if config["GLOBAL_TIME_LIMIT"] == -1:
+        return None
+    return config["GLOBAL_TIME_LIMIT"]
+
+
+def update_global_time_limit(config, elapsed):
+    if config["GLOBAL_TIME_LIMIT"] != -1:
+        config["GLOBAL_TIME_LIMIT"] = max(0, config["GLOBAL_TIME_LIMIT"] - elapsed)
+
+
 def get_best_solution(sol_a, sol_b, model):
     if sol_a is None:
         if sol_b is None:
@@ -270,14 +763,30 @@ def distill_kernel(kernel, sol, null=0):
             kernel[k] = False
 
 
-def new_buckets(kernel, score, methods, config):
+def constraint_graph_factory(model, methods, bandit=None):
+    builders = bandit.builders() if bandit else [methods.bucket_builder]
+    if any(getattr(builder, "requires_graph", False) for builder in builders):
+        output = ConstraintGraph.from_model(model)
+    else:
+        output = None
+    return output
+
+
+def bucket_conf(config, graph, builder):
+    output = config["BUCKET_CONF"]
+    if graph is not None and getattr(builder, "requires_graph", False):
+        output = {**output, "graph": graph}
+    return output
+
+
+def new_buckets(kernel, score, methods, config, graph=None):
     try:
         buckets = methods.bucket_builder(
             kernel,
             score,
             methods.bucket_sort,
             config["BUCKET_SORTER_CONF"],
-            **config["BUCKET_CONF"],
+            **bucket_conf(config, graph, methods.bucket_builder),
         )
     except ValueError as err:
         print("Error while computing new buckets:")
@@ -288,7 +797,7 @@ def new_buckets(kernel, score, methods, config):
     return buckets
 
 
-def kernel_search(mps_file, config, kernel_methods):
+def kernel_search(mps_file, config, kernel_methods, incumbent_store=None, control=None):
     """
     Run Kernel Search Heuristic
 
@@ -307,6 +816,15 @@ def kernel_search(mps_file, config, kernel_methods):
             - Bucket Builder
             - Bucket Sorter
 
+    incumbent_store: IncumbentStore
+        Optional store shared with other Kernel Search
+        instances running on the same problem. Its best
+        solution is used as Cutoff and MIP start.
+
+    control: SearchControl
+        Optional handle to cancel the search
+        from another thread.
+
     Raises
     ------
     ValueError
@@ -325,20 +843,61 @@ def kernel_search(mps_file, config, kernel_methods):
 
     """
 
-    # init_feature_kernel(mps_file, config, None, None)
-    # exit()
+    search = iter_kernel_search(
+        mps_file, config, kernel_methods, incumbent_store, control
+    )
+    while True:
+        try:
+            next(search)
+        except StopIteration as stop:
+            return stop.value
 
-    main_model = model_loarder(mps_file, config)
 
-    curr_sol, base_kernel, buckets, var_score = initialize(
-        main_model, config, kernel_methods, mps_file
+def iter_kernel_search(
+    mps_file, config, kernel_methods, incumbent_store=None, control=None, model=None
+):
+    """
+    Run Kernel Search Heuristic as a generator: an Improvement,
+    holding the solution, the elapsed time and the bucket index,
+    is yielded for each better incumbent. The generator return
+    value is the best solution, as from kernel_search.
+
+    The search stops at the next bucket when the generator is
+    closed, and as soon as possible, terminating the running
+    solve, when control.cancel() is called, even from another
+    thread. Parameters are the same of kernel_search, model is
+    an optional gurobipy model of mps_file already loaded.
+    """
+    if control is None:
+        control = SearchControl()
+
+    # before initialize: it changes the time limits in config
+    recorder = run_recorder_factory(config, mps_file)
+    if model is None:
+        main_model = model_loarder(mps_file, config)
+    else:
+        main_model = model
+    bandit = bucket_bandit_factory(config)
+    graph = constraint_graph_factory(main_model, kernel_methods, bandit)
+
+    curr_sol, base_kernel, buckets, var_score, lp_bound, reduced_costs = initialize(
+        main_model, config, kernel_methods, mps_file, graph, control
     )
-    buckets = list(buckets)
+    fixing = reduced_cost_fixing_factory(config, main_model, reduced_costs, lp_bound)
+    if not isinstance(buckets, AdaptiveBuckets):
+        buckets = list(buckets)
     iters = config["ITERATIONS"]
 
     worst_sol = setup_worsen_solution(config)
-    if config.get("DEBUG"):
-        logger = DebugInfo()
+    metrics = metrics_factory(config, lp_bound)
+    stream = progress_stream_factory(config)
+    listeners = [listener for listener in (recorder, metrics, stream) if listener]
+    if recorder:
+        recorder.set_minimize(is_minimize(main_model))
+        # incumbent times measured from the recorded run start
+        logger = DebugInfo(listeners, recorder.started)
+    elif listeners or config.get("DEBUG"):
+        logger = DebugInfo(listeners)
     else:
         logger = None
 
@@ -352,50 +911,106 @@ def kernel_search(mps_file, config, kernel_methods):
         )
 
     callback = callback_factory(var_score)
+    result_cache = sub_problem_cache_factory(config)
+    coordinator = coordinator_factory(config, base_kernel, main_model)
+    capture = sub_problem_capture_factory(config, mps_file, base_kernel)
+    trace = solver_trace_factory(config)
 
-    for i in range(iters):
-        print("Iteration:", i)
-        tmp_model = main_model.copy()
-        instance = KernelSearchInstance(
-            tmp_model,
-            kernel_methods,
-            base_kernel,
-            buckets,
-            curr_sol,
-            logger,
-            config,
-            worst_sol,
-            callback,
-            var_score,
-        )
-        curr_sol, curr_best = solve_buckets(instance, i)
-
-        best_sol = get_best_solution(curr_best, best_sol, main_model)
-        print(f"{best_sol=} {curr_sol=} {prev=}")
-        if curr_sol is None:
-            break
-        else:
-            if prev is None:
-                prev = curr_sol
-                instance.worsen_score.increase_total()
-            elif prev.value == curr_sol.value:
-                worst_sol.increase_score()
-                print(f"FIXED POINT FOUND: {prev.value}")
+    try:
+        for i in range(iters):
+            print("Iteration:", i)
+            tmp_model = main_model.copy()
+            instance = KernelSearchInstance(
+                tmp_model,
+                kernel_methods,
+                base_kernel,
+                buckets,
+                curr_sol,
+                logger,
+                config,
+                worst_sol,
+                callback,
+                var_score,
+                result_cache,
+                incumbent_store,
+                lp_bound,
+                coordinator,
+                fixing,
+                control,
+                capture,
+                trace,
+            )
+            if i == 0:
+                publish_incumbent(instance, curr_sol)
+                # the initial kernel solution
+                yield from report_incumbent(instance, curr_sol, DebugIndex(-1, -1))
+            before = best_sol.value if best_sol else None
+            solver_time = instance.solver_time
+            curr_sol, curr_best = yield from solve_buckets(instance, i)
+
+            best_sol = get_best_solution(curr_best, best_sol, main_model)
+            if bandit:
+                after = best_sol.value if best_sol else None
+                solver_time = instance.solver_time - solver_time
+                minimize = is_minimize(main_model)
+                bandit.update(improvement_reward(before, after, solver_time, minimize))
+            print(f"{best_sol=} {curr_sol=} {prev=}")
+            if curr_sol is None:
+                break
             else:
-                instance.worsen_score.increase_total()
+                if prev is None:
+                    prev = curr_sol
+                    instance.worsen_score.increase_total()
+                elif prev.value == curr_sol.value:
+                    worst_sol.increase_score()
+                    print(f"FIXED POINT FOUND: {prev.value}")
+                else:
+                    instance.worsen_score.increase_total()
+
+            prev = curr_sol
+
+            if config.get("DISTILL") and curr_sol is not None:
+                distill_kernel(base_kernel, curr_sol)
+
+            if curr_sol:
+                prev_buckets = buckets
+                candidates = fixing.free_kernel(base_kernel) if fixing else base_kernel
+                methods, bucket_config = kernel_methods, config
+                if bandit:
+                    arm = bandit.select()
+                    print("Bucket strategy:", arm.name)
+                    methods, bucket_config = arm.apply(kernel_methods, config)
+                buckets = new_buckets(
+                    candidates, var_score, methods, bucket_config, graph
+                )
+                if buckets is None:
+                    break
+                if isinstance(buckets, AdaptiveBuckets):
+                    buckets.carry_size(prev_buckets)
+
+            if check_time_out(instance):
+                break
+    finally:
+        control.close()
+        if coordinator:
+            coordinator.close()
+
+        if result_cache:
+            print(
+                f"Bucket cache: {result_cache.hits} hits {result_cache.misses} misses"
+            )
 
-        prev = curr_sol
+        if fixing:
+            print(fixing.report())
 
-        if config.get("DISTILL") and curr_sol is not None:
-            distill_kernel(base_kernel, curr_sol)
+        if bandit:
+            print("Bucket strategies:", bandit.report())
 
-        if curr_sol:
-            buckets = new_buckets(base_kernel, var_score, kernel_methods, config)
-            if buckets is None:
-                break
+        if trace:
+            trace.save()
 
-        if check_time_out(instance):
-            break
+        for listener in listeners:
+            listener.finish(best_sol.value if best_sol else None)
 
     if best_sol:
         best_sol.set_debug_info(logger)
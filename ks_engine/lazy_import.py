@@ -0,0 +1,22 @@
+#! /usr/bin/python
+
+import importlib
+
+
+class LazyModule:
+    """
+    Stand in for a module that is actually imported
+    the first time one of its attributes is accessed.
+    """
+
+    def __init__(self, name):
+        self.__name = name
+        self.__module = None
+
+    def __getattr__(self, attr):
+        if attr.startswith("_LazyModule__"):
+            # not initialized yet, e.g. while copying
+            raise AttributeError(attr)
+        if self.__module is None:
+            self.__module = importlib.import_module(self.__name)
+        return getattr(self.__module, attr)
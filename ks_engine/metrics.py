@@ -0,0 +1,179 @@
+#! /usr/bin/python
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import threading
+import time
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+DEF_INTERVAL = 5
+
+
+class RunMetrics:
+    """
+    DebugInfo listener exposing live run telemetry
+    in OpenMetrics text format.
+    """
+
+    def __init__(self, config, lp_bound=None):
+        self.config = config
+        self.lp_bound = lp_bound
+        self.begin = time.time()
+        self.incumbent = None
+        self.kernel_size = 0
+        self.solver_time = 0.0
+        self.buckets = Counter()
+        self.listeners = []
+
+    def add_bucket(self, index, data):
+        self.buckets[data.status] += 1
+        self.solver_time += data.time
+        self.kernel_size = data.kernel_size
+        self.notify()
+
+    def add_incumbent(self, incumbent):
+        self.incumbent = incumbent.value
+        self.notify()
+
+    def finish(self, best_value):
+        if best_value is not None:
+            self.incumbent = best_value
+        for listener in self.listeners:
+            listener.close()
+
+    def notify(self):
+        for listener in self.listeners:
+            listener.update()
+
+    def gap(self):
+        if self.incumbent is None or self.lp_bound is None:
+            return None
+        return abs(self.incumbent - self.lp_bound) / max(abs(self.incumbent), 1e-10)
+
+    def time_left(self):
+        time_limit = self.config["GLOBAL_TIME_LIMIT"]
+        if time_limit == -1:
+            return None
+        return time_limit
+
+    def render(self):
+        elapsed = time.time() - self.begin
+        lines = []
+        gauge(lines, "ks_incumbent", "Current incumbent objective", self.incumbent)
+        gauge(lines, "ks_lp_bound", "Root LP relaxation bound", self.lp_bound)
+        gauge(lines, "ks_gap_ratio", "Incumbent gap to the LP bound", self.gap())
+        gauge(lines, "ks_time_left_seconds", "Global time left", self.time_left())
+        gauge(lines, "ks_kernel_size", "Kernel size", self.kernel_size)
+        gauge(lines, "ks_elapsed_seconds", "Wall clock time since start", elapsed)
+
+        lines.append("# TYPE ks_buckets counter")
+        lines.append("# HELP ks_buckets Buckets processed, by final status")
+        # copy: buckets are updated by the search thread while serving
+        buckets = dict(self.buckets)
+        for status, count in sorted(buckets.items(), key=str):
+            lines.append(f'ks_buckets_total{{status="{status}"}} {count}')
+
+        overhead = max(elapsed - self.solver_time, 0.0)
+        counter(
+            lines, "ks_solver_seconds", "Time spent in the solver", self.solver_time
+        )
+        counter(lines, "ks_overhead_seconds", "Time spent out of the solver", overhead)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def gauge(lines, name, help_text, value):
+    lines.append(f"# TYPE {name} gauge")
+    lines.append(f"# HELP {name} {help_text}")
+    if value is not None:
+        lines.append(f"{name} {value}")
+
+
+def counter(lines, name, help_text, value):
+    lines.append(f"# TYPE {name} counter")
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"{name}_total {value}")
+
+
+class MetricsServer:
+    """
+    Serve the metrics on http://host:port/metrics from a daemon thread.
+    """
+
+    def __init__(self, metrics, host="127.0.0.1", port=0):
+        handler = build_handler(metrics)
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.address = self.server.server_address
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+
+    def update(self):
+        pass
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def build_handler(metrics):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return MetricsHandler
+
+
+class TextfileWriter:
+    """
+    Write the metrics into a file, for textfile collectors,
+    at most once every interval seconds.
+    """
+
+    def __init__(self, metrics, file_name, interval=DEF_INTERVAL):
+        self.metrics = metrics
+        self.file_name = file_name
+        self.interval = interval
+        self.last = None
+
+    def update(self):
+        now = time.time()
+        if self.last is None or now - self.last >= self.interval:
+            self.write()
+            self.last = now
+
+    def close(self):
+        self.write()
+
+    def write(self):
+        tmp_file = self.file_name + ".tmp"
+        with open(tmp_file, "w") as file:
+            file.write(self.metrics.render())
+        os.replace(tmp_file, self.file_name)
+
+
+def metrics_factory(config, lp_bound):
+    conf = config.get("METRICS")
+    if not conf:
+        return None
+
+    output = RunMetrics(config, lp_bound)
+    if "PORT" in conf:
+        server = MetricsServer(output, conf.get("HOST", "127.0.0.1"), conf["PORT"])
+        print("Metrics available on", server.address)
+        output.listeners.append(server)
+    if file_name := conf.get("TEXTFILE"):
+        interval = conf.get("INTERVAL", DEF_INTERVAL)
+        output.listeners.append(TextfileWriter(output, file_name, interval))
+    return output
@@ -2,17 +2,15 @@
 
 # Copyright (c) 2019 Filippo Ranza <filipporanza@gmail.com>
 
+from collections import OrderedDict
 import os
 
-
-try:
-    import gurobipy
-except ImportError:
-    # for test purposes
-    pass
-
+from .lazy_import import LazyModule
 from .solution import Solution, DebugData, get_solution_file_name
 from .config_loader import DEFAULT_CONF
+from .feasibility import FeasibilityChecker
+
+gurobipy = LazyModule("gurobipy")
 
 GUROBI_PARAMS = {
     "TIME_LIMIT": "TimeLimit",
@@ -21,6 +19,14 @@ GUROBI_PARAMS = {
 }
 
 
+def solver_profile(config, phase):
+    """
+    Gurobi parameters of the given phase in SOLVER_PROFILES.
+    """
+    profiles = config.get("SOLVER_PROFILES") or {}
+    return profiles.get(phase) or {}
+
+
 def reset_time_limit(config):
     if config["TIME_LIMIT"] != DEFAULT_CONF["TIME_LIMIT"]:
         output = config["TIME_LIMIT"]
@@ -44,11 +50,14 @@ def create_env(config):
     return env
 
 
-def model_loarder(mps_file, config):
+def model_loarder(mps_file, config, env=None):
+    if env is None:
+        env = create_env(config)
+
     presolve = config["PRESOLVE"]
     if presolve:
         tl = reset_time_limit(config)
-        model = gurobipy.read(mps_file, env=create_env(config))
+        model = gurobipy.read(mps_file, env=env)
         model.setParam("Presolve", 2)
         model.update()
         output = model.presolve()
@@ -57,25 +66,78 @@ def model_loarder(mps_file, config):
         output.setParam("Presolve", -1)
         output.update()
     else:
-        output = gurobipy.read(mps_file, env=create_env(config))
+        output = gurobipy.read(mps_file, env=env)
 
     return output
 
 
+def env_key(config):
+    return (config["LOG"], *(config[k] for k in GUROBI_PARAMS))
+
+
+class ModelCache:
+    """
+    Keep Gurobi environments and loaded instances to reuse
+    them between runs: load returns a copy of the cached model.
+    Gurobi objects must not be shared between threads: use
+    one cache per thread.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.envs = {}
+        self.models = OrderedDict()
+
+    def get_env(self, config):
+        key = env_key(config)
+        if key not in self.envs:
+            self.envs[key] = create_env(config)
+        return self.envs[key]
+
+    def load(self, mps_file, config):
+        key = (
+            os.path.abspath(mps_file),
+            os.path.getmtime(mps_file),
+            config["PRESOLVE"],
+            env_key(config),
+        )
+        model = self.models.get(key)
+        if model is not None:
+            self.models.move_to_end(key)
+            if config["PRESOLVE"]:
+                # same config update of model_loarder
+                reset_time_limit(config)
+        else:
+            model = model_loarder(mps_file, config, self.get_env(config))
+            self.models[key] = model
+            if len(self.models) > self.size:
+                _, old = self.models.popitem(last=False)
+                old.dispose()
+        return model.copy()
+
+
 def eval_model(mps_file, solution):
-    model = gurobipy.read(mps_file)
-    model.read(solution)
-    model.setParam("SolutionLimit", 1)
-    model.setParam("TimeLimit", 1)
-    model.optimize()
-
-    if model.NodeCount == 0 and model.SolCount == 1:
-        output = model.getObjective().getValue()
+    checker = FeasibilityChecker.from_file(mps_file)
+    (result,) = checker.check_files([solution])
+    if result.feasible:
+        output = result.objective
     else:
         output = None
     return output
 
 
+def combine_callbacks(*callbacks):
+    callbacks = [c for c in callbacks if c]
+    if len(callbacks) < 2:
+        return callbacks[0] if callbacks else None
+
+    def callback(model, where):
+        for function in callbacks:
+            function(model, where)
+
+    return callback
+
+
 def model_has_solution(model):
     obj = model.getObjective()
     try:
@@ -89,7 +151,13 @@ def model_has_solution(model):
 
 class Model:
     def __init__(
-        self, model, config, linear_relax=False, one_solution=False, callback=None
+        self,
+        model,
+        config,
+        linear_relax=False,
+        one_solution=False,
+        callback=None,
+        phase=None,
     ):
 
         self.preload = config["PRELOAD"]
@@ -99,11 +167,17 @@ class Model:
             self.model.setParam("SolutionLimit", 1)
 
         self.callback = callback
+        self.stop_policy = None
+        self.trace = None
 
         self.relax = linear_relax
         self.stat = None
         if linear_relax:
             self.model = self.model.relax()
+        profile = solver_profile(config, phase) if phase else {}
+        self.set_params(profile)
+        # kept by run_with_global_time_limit when shorter than the global one
+        self.phase_time_limit = profile.get("TimeLimit")
 
     def preload_from_file(self):
         if self.sol_file and os.path.isfile(self.sol_file):
@@ -116,12 +190,26 @@ class Model:
         for name, value in sol.vars.items():
             self.model.getVarByName(name).start = value
 
+    def set_params(self, params):
+        for name, value in params.items():
+            self.model.setParam(name, value)
+
     def set_time_limit(self, time_limit):
         self.model.setParam("TimeLimit", time_limit)
 
+    def set_cutoff(self, value):
+        self.model.setParam("Cutoff", value)
+
+    def set_stop_policy(self, policy):
+        self.stop_policy = policy
+
+    def set_trace(self, recorder):
+        self.trace = recorder
+
     def run(self):
-        if self.callback:
-            self.model.optimize(self.callback)
+        callback = combine_callbacks(self.callback, self.stop_policy, self.trace)
+        if callback:
+            self.model.optimize(callback)
         else:
             self.model.optimize()
 
@@ -166,14 +254,45 @@ class Model:
                 yield var.varName, var.x
 
     def build_debug(self, kernel_size, bucket_size):
+        if model_has_solution(self.model):
+            value = self.model.objVal
+        else:
+            value = None
         return DebugData(
-            value=self.model.objVal,
+            value=value,
             time=self.model.getAttr("Runtime"),
             nodes=self.model.getAttr("NodeCount"),
             kernel_size=kernel_size,
             bucket_size=bucket_size,
+            status=self.get_status(),
+        )
+
+    def get_bound(self):
+        try:
+            output = self.model.objBound
+        except AttributeError:
+            output = None
+        return output
+
+    def build_skip_debug(self, kernel_size, bucket_size, status):
+        return DebugData(
+            value=None,
+            time=self.model.getAttr("Runtime"),
+            nodes=0,
+            kernel_size=kernel_size,
+            bucket_size=bucket_size,
+            status=status,
         )
 
+    def bound_improves(self, value, margin=0.0):
+        bound = self.model.objVal
+        tolerance = abs(value) * margin
+        if self.model.getAttr("ModelSense") == 1:
+            output = bound < value - tolerance
+        else:
+            output = bound > value + tolerance
+        return output
+
     def model_size(self):
         tmp = self.model.getVars()
         output = len(tmp)
@@ -184,9 +303,15 @@ class Model:
         optimal = self.stat == gurobipy.GRB.status.OPTIMAL
         return time_limit or optimal
 
+    def is_optimal(self):
+        return self.stat == gurobipy.GRB.status.OPTIMAL
+
     def reach_time_limit(self):
         return self.stat == gurobipy.GRB.status.TIME_LIMIT
 
+    def is_infeasible(self):
+        return self.stat == gurobipy.GRB.status.INFEASIBLE
+
     def get_status(self):
         status_messages = [
             "LOADED",
@@ -206,4 +331,7 @@ class Model:
             "USER_OBJ_LIMIT",
         ]
         stat = self.stat - 1
+        interrupted = self.stat == gurobipy.GRB.status.INTERRUPTED
+        if interrupted and self.stop_policy and self.stop_policy.reason:
+            return self.stop_policy.reason
         return status_messages[stat]
@@ -0,0 +1,116 @@
+#! /usr/bin/python
+
+import json
+import sys
+import time
+
+DEF_MAX_POINTS = 2000
+
+
+class ProgressStream:
+    """
+    DebugInfo listener writing a newline delimited JSON
+    event for each bucket result and incumbent change.
+    """
+
+    def __init__(self, file_name):
+        if file_name == "-":
+            self.file = sys.stdout
+            self.close_file = False
+        else:
+            self.file = open(file_name, "w")
+            self.close_file = True
+        self.begin = time.time()
+
+    def add_bucket(self, index, data):
+        event = {
+            "event": "bucket",
+            "elapsed": time.time() - self.begin,
+            "iteration": index.iteration,
+            "bucket": index.bucket,
+            **data._asdict(),
+        }
+        self.write(event)
+
+    def add_incumbent(self, incumbent):
+        self.write({"event": "incumbent", **incumbent._asdict()})
+
+    def finish(self, best_value):
+        self.write({"event": "finish", "value": best_value})
+        if self.close_file:
+            self.file.close()
+
+    def write(self, event):
+        print(json.dumps(event), file=self.file, flush=True)
+
+
+def progress_stream_factory(config):
+    if file_name := config.get("PROGRESS_STREAM"):
+        return ProgressStream(file_name)
+    return None
+
+
+def parse_event(line):
+    try:
+        event = json.loads(line)
+    except ValueError:
+        # ks.py output mixed with the stream on stdout
+        return None
+    if isinstance(event, dict) and "event" in event:
+        return event
+    return None
+
+
+def read_events(file, follow=False, interval=0.5):
+    """
+    Yield lists of events read from the given stream. In follow
+    mode wait for new events until the 'finish' event.
+    """
+    partial = ""
+    while True:
+        events = []
+        finished = False
+        while line := file.readline():
+            partial += line
+            if not partial.endswith("\n"):
+                # the writer is in the middle of a line
+                break
+            event = parse_event(partial)
+            partial = ""
+            if event:
+                events.append(event)
+                finished = finished or event["event"] == "finish"
+
+        if events:
+            yield events
+        if finished or not follow:
+            return
+        time.sleep(interval)
+
+
+class Downsampler:
+    """
+    Keep at most max_points samples of a growing series: once
+    the limit is reached every other point is dropped and only
+    one point every 'stride' new samples is kept.
+    """
+
+    def __init__(self, max_points=DEF_MAX_POINTS):
+        self.max_points = max(2, max_points)
+        self.stride = 1
+        self.count = 0
+        self.index = []
+        self.values = []
+
+    def add(self, value):
+        if self.count % self.stride == 0:
+            self.index.append(self.count)
+            self.values.append(value)
+            if len(self.values) > self.max_points:
+                self.index = self.index[::2]
+                self.values = self.values[::2]
+                self.stride *= 2
+        self.count += 1
+
+    def points(self):
+        return self.index, self.values
@@ -0,0 +1,149 @@
+#! /usr/bin/python
+
+import multiprocessing as mp
+import time
+
+from .kernel_search import kernel_search, is_better
+from .solution import Solution
+
+STOP_GRACE_TIME = 5
+
+
+class IncumbentStore:
+    """
+    Best solution shared between the racers of a portfolio.
+    All the methods are process safe. If a target value is given
+    the race stops as soon as it is reached.
+    """
+
+    def __init__(self, manager, target=None):
+        self.lock = manager.Lock()
+        self.data = manager.dict()
+        self.stop_event = manager.Event()
+        self.target = target
+
+    def get_value(self):
+        return self.data.get("value")
+
+    def best(self):
+        with self.lock:
+            value = self.data.get("value")
+            if value is None:
+                return None
+            return Solution(value, self.data["vars"].items())
+
+    def offer(self, value, variables, minimize):
+        with self.lock:
+            curr = self.data.get("value")
+            if curr is None or is_better(value, curr, minimize):
+                self.data.update(value=value, vars=dict(variables))
+                if self.reach_target(value, minimize):
+                    self.stop()
+                return True
+        return False
+
+    def reach_target(self, value, minimize):
+        if self.target is None:
+            return False
+        return value == self.target or is_better(value, self.target, minimize)
+
+    def stop(self):
+        self.stop_event.set()
+
+    def stopped(self):
+        return self.stop_event.is_set()
+
+
+def check_racers(racers):
+    presolve = {conf["PRESOLVE"] for conf, _ in racers}
+    if len(presolve) > 1:
+        raise ValueError(
+            "racing configurations must share the same PRESOLVE value: solutions are exchanged between racers"
+        )
+
+
+def run_racer(index, mps_file, config, kernel_methods, store, results):
+    sol = kernel_search(mps_file, config, kernel_methods, store)
+    if sol is None:
+        results[index] = None
+    else:
+        results[index] = sol.value
+        if debug_file := config.get("DEBUG"):
+            sol.debug.export_csv(debug_file, False)
+
+
+def race(mps_file, racers, deadline=None, target=None):
+    """
+    Run several Kernel Search configurations on the same instance
+    at the same time. Racers share the best solution found so far
+    and use it as Cutoff and MIP start.
+
+    Parameters
+    ----------
+    mps_file : str
+        The MIP problem instance file.
+
+    racers : list
+        list of (config, kernel_methods) couples
+
+    deadline : float
+        maximal wall clock time, in seconds, for the whole
+        race. None means no deadline.
+
+    target : float
+        stop the race once a solution at least as good
+        as target is found. None means no target.
+
+    Raises
+    ------
+    ValueError
+        When racers use different PRESOLVE values
+
+    Returns
+    -------
+    solution: Solution
+        the best solution found by any racer, or None
+
+    results: dict
+        map racer index into the value of its own best solution
+    """
+    check_racers(racers)
+    with mp.Manager() as manager:
+        store = IncumbentStore(manager, target)
+        results = manager.dict()
+        procs = [
+            mp.Process(
+                target=run_racer,
+                args=(i, mps_file, conf, methods, store, results),
+            )
+            for i, (conf, methods) in enumerate(racers)
+        ]
+        for proc in procs:
+            proc.start()
+
+        wait_racers(procs, store, deadline)
+        store.stop()
+        for proc in procs:
+            proc.join(STOP_GRACE_TIME)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join()
+
+        return store.best(), dict(results)
+
+
+def wait_racers(procs, store, deadline):
+    begin = time.time()
+    while any(proc.is_alive() for proc in procs):
+        if deadline is None:
+            timeout = 1
+        else:
+            remaining = deadline - (time.time() - begin)
+            if remaining <= 0:
+                print("Reached race deadline: stop now!")
+                return
+            timeout = min(1, remaining)
+
+        if store.stop_event.wait(timeout):
+            print("Optimal or target solution found: stop now!")
+            return
@@ -0,0 +1,92 @@
+#! /usr/bin/python
+
+FIXING_TOL = 1e-6
+
+
+class ReducedCostFixing:
+    """
+    Permanently fix to zero the integer variables, at zero in the LP
+    relaxation, whose reduced cost exceeds the gap between the incumbent
+    and the LP bound: setting them to one or more cannot lead to a better
+    solution. As the gap only shrinks, candidates are kept sorted by
+    reduced cost and only the largest ones are checked.
+    """
+
+    def __init__(self, reduced_costs, lp_bound, minimize, model_size):
+        sense = 1 if minimize else -1
+        # reduced costs with the wrong sign never allow fixing
+        self.candidates = sorted(
+            (sense * rc, name) for name, rc in reduced_costs.items() if sense * rc > 0
+        )
+        self.lp_bound = lp_bound
+        self.sense = sense
+        self.model_size = model_size
+        self.fixed = set()
+        self.skipped_buckets = 0
+        self.removed_vars = 0
+
+    def gap(self, incumbent):
+        return self.sense * (incumbent - self.lp_bound)
+
+    def update(self, incumbent):
+        """
+        Fix the variables allowed by the given incumbent value.
+        Return the newly fixed variables.
+        """
+        # keep a margin against LP round off
+        gap = self.gap(incumbent) + FIXING_TOL * max(1.0, abs(incumbent))
+        output = []
+        while self.candidates and self.candidates[-1][0] > gap:
+            _, name = self.candidates.pop()
+            self.fixed.add(name)
+            output.append(name)
+        return output
+
+    def unfixed(self, bucket):
+        if not self.fixed:
+            return bucket
+        return [var for var in bucket if var not in self.fixed]
+
+    def filter_bucket(self, bucket):
+        if not self.fixed:
+            return bucket
+        output = self.unfixed(bucket)
+        self.removed_vars += len(bucket) - len(output)
+        if not output:
+            self.skipped_buckets += 1
+        return output
+
+    def free_kernel(self, kernel):
+        """
+        Kernel view, for bucket builders, without fixed variables.
+        """
+        if not self.fixed:
+            return kernel
+        return {k: v for k, v in kernel.items() if k not in self.fixed}
+
+    def report(self):
+        ratio = 100 * len(self.fixed) / max(self.model_size, 1)
+        return (
+            f"Reduced cost fixing: {len(self.fixed)} variables fixed ({ratio:.1f}%),"
+            f" {self.removed_vars} removed from buckets,"
+            f" {self.skipped_buckets} empty buckets skipped"
+        )
+
+
+def reduced_cost_fixing_factory(config, model, reduced_costs, lp_bound):
+    if not config.get("REDUCED-COST-FIXING") or reduced_costs is None:
+        return None
+    if lp_bound is None:
+        print("Reduced cost fixing disabled: no valid LP bound")
+        return None
+
+    variables = model.getVars()
+    names = model.getAttr("VarName", variables)
+    types = model.getAttr("VType", variables)
+    lower = model.getAttr("LB", variables)
+    # only integer variables at their zero lower bound move at least by one
+    integer = {n for n, t, lb in zip(names, types, lower) if t != "C" and lb == 0}
+    reduced_costs = {k: v for k, v in reduced_costs.items() if k in integer}
+
+    minimize = model.getAttr("ModelSense") == 1
+    return ReducedCostFixing(reduced_costs, lp_bound, minimize, len(names))
@@ -0,0 +1,260 @@
+#! /usr/bin/python
+
+import hashlib
+import json
+import platform
+import sqlite3
+import time
+
+BATCH_SIZE = 512
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    instance TEXT,
+    instance_hash TEXT,
+    config TEXT,
+    config_hash TEXT,
+    versions TEXT,
+    started REAL,
+    finished REAL,
+    best_value REAL,
+    minimize INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_instance ON runs (instance_hash);
+CREATE INDEX IF NOT EXISTS runs_config ON runs (config_hash);
+
+CREATE TABLE IF NOT EXISTS buckets (
+    run_id INTEGER REFERENCES runs (id),
+    iteration INTEGER,
+    bucket INTEGER,
+    value REAL,
+    time REAL,
+    nodes REAL,
+    kernel_size INTEGER,
+    bucket_size INTEGER,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS buckets_run ON buckets (run_id);
+
+CREATE TABLE IF NOT EXISTS incumbents (
+    run_id INTEGER REFERENCES runs (id),
+    time REAL,
+    value REAL,
+    iteration INTEGER,
+    bucket INTEGER
+);
+CREATE INDEX IF NOT EXISTS incumbents_run ON incumbents (run_id);
+"""
+
+COMPARE_QUERY = """
+SELECT instance, config_hash, COUNT(*), MIN(best_value), MAX(best_value),
+    AVG(best_value), AVG(finished - started), MIN(minimize)
+FROM runs
+WHERE instance LIKE ?
+GROUP BY instance_hash, config_hash
+"""
+
+
+def file_hash(file_name):
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_hash(config):
+    data = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def get_versions():
+    versions = {"python": platform.python_version()}
+    for name in ["numpy", "gurobipy"]:
+        try:
+            module = __import__(name)
+        except ImportError:
+            continue
+        if name == "gurobipy":
+            versions[name] = ".".join(map(str, module.gurobi.version()))
+        else:
+            versions[name] = module.__version__
+    return versions
+
+
+class ResultsStore:
+    """
+    SQLite store of runs metadata, bucket debug data
+    and incumbent timelines. Bucket and incumbent rows
+    are written in batches.
+    """
+
+    def __init__(self, file_name, batch_size=BATCH_SIZE):
+        self.conn = sqlite3.connect(file_name)
+        self.conn.executescript(SCHEMA)
+        self.upgrade_schema()
+        self.batch_size = batch_size
+        self.buckets = []
+        self.incumbents = []
+
+    def upgrade_schema(self):
+        # databases written before the objective sense was stored
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(runs)")]
+        if "minimize" not in columns:
+            self.conn.execute("ALTER TABLE runs ADD COLUMN minimize INTEGER")
+            self.conn.commit()
+
+    def start_run(
+        self, instance, config, instance_hash=None, versions=None, started=None
+    ):
+        if instance_hash is None:
+            instance_hash = file_hash(instance)
+        if versions is None:
+            versions = get_versions()
+        if started is None:
+            started = time.time()
+
+        cursor = self.conn.execute(
+            "INSERT INTO runs (instance, instance_hash, config, config_hash, versions, started) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                instance,
+                instance_hash,
+                json.dumps(config, sort_keys=True, default=str),
+                config_hash(config),
+                json.dumps(versions),
+                started,
+            ),
+        )
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def add_bucket(self, run_id, index, data):
+        self.buckets.append((run_id, index.iteration, index.bucket, *data))
+        if len(self.buckets) >= self.batch_size:
+            self.flush()
+
+    def add_incumbent(self, run_id, incumbent):
+        self.incumbents.append((run_id, *incumbent))
+        if len(self.incumbents) >= self.batch_size:
+            self.flush()
+
+    def finish_run(self, run_id, best_value, minimize=True):
+        self.flush()
+        self.conn.execute(
+            "UPDATE runs SET finished = ?, best_value = ?, minimize = ? WHERE id = ?",
+            (time.time(), best_value, minimize, run_id),
+        )
+        self.conn.commit()
+
+    def flush(self):
+        self.conn.executemany(
+            "INSERT INTO buckets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self.buckets
+        )
+        self.conn.executemany(
+            "INSERT INTO incumbents VALUES (?, ?, ?, ?, ?)", self.incumbents
+        )
+        self.conn.commit()
+        self.buckets = []
+        self.incumbents = []
+
+    def compare(self, instance="%"):
+        """
+        Return (instance, config hash, runs, best, mean, mean time)
+        for each configuration run on each instance, best first
+        according to the objective sense. Runs stored without the
+        sense are minimization ones.
+        """
+        output = []
+        rows = self.conn.execute(COMPARE_QUERY, (instance,)).fetchall()
+        for name, conf, count, low, high, mean, mean_time, minimize in rows:
+            minimize = minimize is None or bool(minimize)
+            best = low if minimize else high
+            output.append((name, conf, count, best, mean, mean_time, minimize))
+
+        output.sort(key=compare_key)
+        return [row[:-1] for row in output]
+
+    def runs(self):
+        return self.conn.execute(
+            "SELECT id, instance, config_hash, started, finished, best_value FROM runs ORDER BY id"
+        ).fetchall()
+
+    def timelines(self, instance="%"):
+        """
+        Yield (run id, instance, config hash, duration, incumbents,
+        minimize) for each finished run, incumbents as (time, value)
+        pairs. Runs stored without the sense are minimization ones.
+        """
+        runs = self.conn.execute(
+            "SELECT id, instance, config_hash, finished - started, minimize FROM runs WHERE instance LIKE ? AND finished IS NOT NULL ORDER BY id",
+            (instance,),
+        ).fetchall()
+        for run_id, name, conf, duration, minimize in runs:
+            incumbents = self.conn.execute(
+                "SELECT time, value FROM incumbents WHERE run_id = ? ORDER BY time",
+                (run_id,),
+            ).fetchall()
+            minimize = minimize is None or bool(minimize)
+            yield run_id, name, conf, duration, incumbents, minimize
+
+    def get_config(self, hash_prefix):
+        row = self.conn.execute(
+            "SELECT config FROM runs WHERE config_hash LIKE ? LIMIT 1",
+            (hash_prefix + "%",),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+def compare_key(row):
+    name, *_, mean, _, minimize = row
+    if mean is None:
+        return name, True, 0.0
+    return name, False, mean if minimize else -mean
+
+
+class RunRecorder:
+    """
+    DebugInfo listener writing a single run into a ResultsStore.
+    The run starts when the recorder is built: call set_minimize
+    once the model objective sense is known.
+    """
+
+    def __init__(self, store, run_id, started=None):
+        self.store = store
+        self.run_id = run_id
+        self.started = started
+        self.minimize = True
+
+    def set_minimize(self, minimize):
+        self.minimize = minimize
+
+    def add_bucket(self, index, data):
+        self.store.add_bucket(self.run_id, index, data)
+
+    def add_incumbent(self, incumbent):
+        self.store.add_incumbent(self.run_id, incumbent)
+
+    def finish(self, best_value):
+        self.store.finish_run(self.run_id, best_value, self.minimize)
+        self.store.close()
+
+
+def run_recorder_factory(config, mps_file):
+    """
+    Start recording a run: call it before loading and initializing
+    the model, so that the stored configuration is the given one
+    and the run time includes the initialization.
+    """
+    if file_name := config.get("RESULTS_DB"):
+        store = ResultsStore(file_name)
+        started = time.time()
+        run_id = store.start_run(mps_file, config, started=started)
+        output = RunRecorder(store, run_id, started)
+    else:
+        output = None
+    return output
@@ -0,0 +1,70 @@
+#! /usr/bin/python
+
+from contextlib import contextmanager
+import threading
+import time
+
+
+class SearchControl:
+    """
+    Stop a running Kernel Search from any thread: the search
+    checks for cancellation between buckets, while the solve
+    in progress is interrupted with the Gurobi terminate call.
+    """
+
+    def __init__(self, deadline=None):
+        self.lock = threading.Lock()
+        self.begin = time.time()
+        self.stop = False
+        self.model = None
+        self.timer = None
+        # best objective value reported to the caller
+        self.best = None
+        if deadline is not None:
+            self.set_deadline(deadline)
+
+    def cancel(self):
+        with self.lock:
+            self.stop = True
+            if self.model is not None:
+                self.model.terminate()
+
+    def cancelled(self):
+        return self.stop
+
+    def set_deadline(self, seconds):
+        """
+        Cancel the search the given seconds from now,
+        replacing the previous deadline.
+        """
+        with self.lock:
+            if self.timer:
+                self.timer.cancel()
+            self.timer = threading.Timer(max(seconds, 0), self.cancel)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def elapsed(self):
+        return time.time() - self.begin
+
+    @contextmanager
+    def running(self, model):
+        """
+        Register the gurobipy model being optimized,
+        so that cancel can terminate it.
+        """
+        with self.lock:
+            self.model = model
+            if self.stop:
+                model.terminate()
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.model = None
+
+    def close(self):
+        with self.lock:
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
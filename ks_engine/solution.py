@@ -4,20 +4,29 @@
 
 from collections import namedtuple
 import gzip
+import time
 
-import numpy as np
+from .lazy_import import LazyModule
+
+np = LazyModule("numpy")
 
 DebugData = namedtuple(
-    "DebugData", ["value", "time", "nodes", "kernel_size", "bucket_size"]
+    "DebugData",
+    ["value", "time", "nodes", "kernel_size", "bucket_size", "status"],
+    defaults=[None],
 )
 DebugIndex = namedtuple("DebugIndex", ["iteration", "bucket"])
+Incumbent = namedtuple("Incumbent", ["time", "value", "iteration", "bucket"])
 
 
 class DebugInfo:
-    def __init__(self):
+    def __init__(self, listeners=(), begin=None):
         self.store = {}
         self.max_bucket = 0
         self.max_iter = 0
+        self.incumbents = []
+        self.listeners = list(listeners)
+        self.begin = time.time() if begin is None else begin
 
     def add_data(self, data, index):
         self.store[index] = data
@@ -28,6 +37,22 @@ class DebugInfo:
         if self.max_iter < index.iteration:
             self.max_iter = index.iteration
 
+        for listener in self.listeners:
+            listener.add_bucket(index, data)
+
+    def add_incumbent(self, value, index):
+        elapsed = time.time() - self.begin
+        incumbent = Incumbent(elapsed, value, index.iteration, index.bucket)
+        self.incumbents.append(incumbent)
+
+        for listener in self.listeners:
+            listener.add_incumbent(incumbent)
+
+    def last_incumbent(self):
+        if self.incumbents:
+            return self.incumbents[-1].value
+        return None
+
     def export_csv(self, file_name, compress):
         if file_name is None:
             return
@@ -42,9 +67,11 @@ class DebugInfo:
                 file.write(csv)
 
     def get_csv(self):
-        out = "bucket,iteration,value,time,nodes,kernel_size,bucket_size"
+        out = "bucket,iteration,value,time,nodes,kernel_size,bucket_size,status"
         for k, v in self.store.items():
-            tmp = f"{k.bucket},{k.iteration},{v.value},{v.time},{v.nodes},{v.kernel_size},{v.bucket_size}"
+            value = csv_field(v.value)
+            status = csv_field(v.status)
+            tmp = f"{k.bucket},{k.iteration},{value},{v.time},{v.nodes},{v.kernel_size},{v.bucket_size},{status}"
             out += "\n" + tmp
         return out
 
@@ -75,6 +102,11 @@ class Solution:
     def get_value(self, name):
         return self.vars[name]
 
+    def nonzero_vars(self):
+        # variables outside the kernel are fixed to zero: sub problem
+        # solutions are stored and sent as their non zero values only
+        return {k: v for k, v in self.vars.items() if v != 0}
+
     def update(self, value, var_iter):
         self.value = value
         for k, v in var_iter:
@@ -102,6 +134,12 @@ class Solution:
                 print(k, v, file=file)
 
 
+def csv_field(value):
+    if value is None:
+        return ""
+    return value
+
+
 def get_solution_file_name(file_name):
     if file_name is None:
         return None
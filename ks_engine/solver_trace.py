@@ -0,0 +1,132 @@
+#! /usr/bin/python
+
+from array import array
+from collections import namedtuple
+
+from .lazy_import import LazyModule
+from .solution import DebugIndex
+
+gurobipy = LazyModule("gurobipy")
+np = LazyModule("numpy")
+
+DEF_INTERVAL = 1.0
+# gurobipy reports missing incumbent and bound as +/- 1e100
+GRB_INFINITY = 1e100
+# columns of each series
+COLUMNS = ("time", "incumbent", "bound", "nodes")
+
+TraceSummary = namedtuple(
+    "TraceSummary", ["index", "time", "best_time", "samples", "value"]
+)
+
+
+def finite(value):
+    if value is None or abs(value) >= GRB_INFINITY:
+        return float("nan")
+    return value
+
+
+class SeriesRecorder:
+    """
+    Gurobi callback sampling (time, incumbent, best bound, nodes)
+    at most once each interval seconds, and at the first MIP
+    callback after each new incumbent. Samples are kept in a flat
+    array of doubles.
+    """
+
+    def __init__(self, interval=DEF_INTERVAL):
+        self.interval = interval
+        self.next_sample = 0.0
+        self.new_incumbent = False
+        self.samples = array("d")
+
+    def __call__(self, model, where):
+        what = gurobipy.GRB.Callback
+        if where == what.MIPSOL:
+            self.new_incumbent = True
+        elif where == what.MIP:
+            runtime = model.cbGet(what.RUNTIME)
+            if self.new_incumbent or runtime >= self.next_sample:
+                self.add(
+                    runtime,
+                    model.cbGet(what.MIP_OBJBST),
+                    model.cbGet(what.MIP_OBJBND),
+                    model.cbGet(what.MIP_NODCNT),
+                )
+
+    def add(self, runtime, incumbent, bound, nodes):
+        self.samples.extend((runtime, finite(incumbent), finite(bound), nodes))
+        self.next_sample = runtime + self.interval
+        self.new_incumbent = False
+
+    def series(self):
+        return np.array(self.samples, dtype=float).reshape(-1, len(COLUMNS))
+
+
+class SolverTrace:
+    """
+    Store the progress series of each bucket sub problem,
+    by DebugIndex, and save them as a compressed numpy archive.
+    """
+
+    def __init__(self, file_name, interval=DEF_INTERVAL):
+        self.file_name = file_name
+        self.interval = interval
+        self.store = {}
+
+    def recorder(self):
+        return SeriesRecorder(self.interval)
+
+    def add(self, index, recorder, debug, bound=None):
+        """
+        Complete the series with the final state of
+        the sub problem and store it.
+        """
+        recorder.add(debug.time, debug.value, bound, debug.nodes)
+        self.store[index] = recorder.series()
+
+    def save(self):
+        arrays = {f"{k.iteration}_{k.bucket}": v for k, v in self.store.items()}
+        np.savez_compressed(self.file_name, **arrays)
+
+    def summary(self):
+        return [summarize(index, series) for index, series in self.store.items()]
+
+
+def load_trace(file_name):
+    """
+    Load a saved trace as a dictionary DebugIndex -> series,
+    each series is an array with a row for each sample.
+    """
+    output = {}
+    with np.load(file_name) as data:
+        for key in data.files:
+            iteration, bucket = key.split("_")
+            output[DebugIndex(int(iteration), int(bucket))] = data[key]
+    return output
+
+
+def summarize(index, series):
+    """
+    Sub problem time, time of its last incumbent
+    improvement, number of samples and final value.
+    """
+    times, values = series[:, 0], series[:, 1]
+    total = times[-1]
+    value = values[-1]
+    if np.isnan(value):
+        best_time = total
+    else:
+        best_time = times[np.argmax(values == value)]
+    return TraceSummary(index, total, best_time, len(series), value)
+
+
+def solver_trace_factory(config):
+    conf = config.get("SOLVER_TRACE")
+    if not conf:
+        return None
+    if not isinstance(conf, dict):
+        conf = {}
+    return SolverTrace(
+        conf.get("FILE", "solver-trace.npz"), conf.get("INTERVAL", DEF_INTERVAL)
+    )
@@ -0,0 +1,165 @@
+#! /usr/bin/python
+
+import json
+import os
+
+from .distributed import encode_mask, encode_solution, names_fingerprint
+from .model import GUROBI_PARAMS, solver_profile
+
+# configuration entries needed to load the instance as in the captured run
+CAPTURED_CONF = ("PRESOLVE", "PRELOAD", "LOG", *GUROBI_PARAMS)
+# gurobipy reports an unlimited time limit as 1e100
+GRB_INFINITY = 1e100
+
+
+class SubProblemCapture:
+    """
+    Save bucket sub problems to replay them on their own with
+    ks-replay.py: those that took at least min_time seconds and
+    those listed in selected as (iteration, bucket) pairs; all
+    of them when neither is given. Each sub problem is a JSON
+    file holding the kernel mask, bucket, cutoff, MIP start and
+    time limit, in the distributed worker task format, with the
+    solver configuration and the captured outcome. With
+    write_model the sub problem is also written as an MPS file,
+    with its non default parameters in a PRM file.
+    """
+
+    def __init__(
+        self,
+        directory,
+        instance,
+        names,
+        config,
+        min_time=None,
+        selected=(),
+        write_model=False,
+    ):
+        self.directory = directory
+        self.instance = os.path.abspath(instance)
+        self.names = names
+        self.index_of = {name: i for i, name in enumerate(names)}
+        self.fingerprint = names_fingerprint(names)
+        self.config = {k: config[k] for k in CAPTURED_CONF}
+        if profile := solver_profile(config, "BUCKET"):
+            self.config["SOLVER_PROFILES"] = {"BUCKET": profile}
+        self.min_time = min_time
+        self.selected = {tuple(index) for index in selected}
+        self.write_model = write_model
+        os.makedirs(directory, exist_ok=True)
+
+    def is_selected(self, index, debug):
+        if self.min_time is None and not self.selected:
+            return True
+        if tuple(index) in self.selected:
+            return True
+        return self.min_time is not None and debug.time >= self.min_time
+
+    def file_name(self, index, ext):
+        return os.path.join(
+            self.directory, f"sub-{index.iteration:03d}-{index.bucket:03d}.{ext}"
+        )
+
+    def save(self, index, kernel, bucket, cutoff, start, time_limit, debug):
+        """
+        Write the sub problem JSON file and return its name.
+        """
+        task = {
+            "instance": self.instance,
+            "names": self.fingerprint,
+            "iteration": index.iteration,
+            "bucket_index": index.bucket,
+            "config": self.config,
+            "kernel": encode_mask([kernel[name] for name in self.names]),
+            "bucket": [self.index_of[var] for var in bucket],
+            "cutoff": cutoff,
+            "start": encode_solution(start, self.index_of),
+            "time_limit": time_limit,
+            "captured": debug._asdict(),
+        }
+        file_name = self.file_name(index, "json")
+        with open(file_name, "w") as file:
+            json.dump(task, file)
+        return file_name
+
+    def capture(self, model, index, kernel, bucket, cutoff, start, debug):
+        """
+        Save the sub problem solved by given Model, if selected. Call
+        it before building the solution: that updates the MIP start.
+        """
+        if not self.is_selected(index, debug):
+            return None
+
+        time_limit = model.model.getParamInfo("TimeLimit")[2]
+        if time_limit >= GRB_INFINITY:
+            time_limit = None
+        start = start if model.preload else None
+        output = self.save(index, kernel, bucket, cutoff, start, time_limit, debug)
+        if self.write_model:
+            model.model.write(self.file_name(index, "mps"))
+            model.model.write(self.file_name(index, "prm"))
+        print("Captured sub problem:", output)
+        return output
+
+
+def load_capture(file_name):
+    with open(file_name) as file:
+        return json.load(file)
+
+
+def list_captures(path):
+    if os.path.isdir(path):
+        output = sorted(
+            os.path.join(path, name)
+            for name in os.listdir(path)
+            if name.endswith(".json")
+        )
+    else:
+        output = [path]
+    return output
+
+
+def replay_task(capture, time_limit=None, start=True, cutoff=True):
+    """
+    Return the worker task re-solving the captured sub problem
+    with the given time limit, with or without MIP start and cutoff.
+    """
+    output = dict(capture)
+    if time_limit is not None:
+        output["time_limit"] = time_limit
+    if not start:
+        output["start"] = None
+    if not cutoff:
+        output["cutoff"] = None
+    return output
+
+
+def parse_param(text):
+    """
+    Parse a 'Name=Value' Gurobi parameter.
+    """
+    name, sep, value = text.partition("=")
+    if not sep or not name:
+        raise ValueError(f"expected Name=Value, found '{text}'")
+    for kind in (int, float):
+        try:
+            return name, kind(value)
+        except ValueError:
+            pass
+    return name, value
+
+
+def sub_problem_capture_factory(config, mps_file, kernel):
+    conf = config.get("CAPTURE")
+    if not conf:
+        return None
+
+    return SubProblemCapture(
+        conf.get("DIR", "captures"),
+        mps_file,
+        list(kernel),
+        config,
+        conf.get("MIN_TIME"),
+        conf.get("BUCKETS", ()),
+        conf.get("MODEL", False),
+    )
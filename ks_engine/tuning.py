@@ -0,0 +1,119 @@
+#! /usr/bin/python
+
+import copy
+import itertools
+import math
+import random
+
+from .config_loader import check_config
+
+
+def set_parameter(config, name, value):
+    """
+    Set a configuration parameter. Dotted names,
+    like 'BUCKET_CONF.count', refer to nested values.
+    """
+    *path, key = name.split(".")
+    curr = config
+    for step in path:
+        curr = curr.setdefault(step, {})
+    curr[key] = value
+
+
+def build_configs(base, space, count=None, seed=None):
+    """
+    Build configurations from the given base configuration
+    and search space. The search space maps parameter names
+    into the list of their values. If count is given and smaller
+    than the grid size, count configurations are sampled from
+    the grid.
+
+    Raises
+    ------
+    ValueError
+        if a generated configuration is not valid
+    """
+    names = list(space)
+    grid = list(itertools.product(*(space[name] for name in names)))
+    if count is not None and count < len(grid):
+        grid = random.Random(seed).sample(grid, count)
+
+    output = []
+    for values in grid:
+        params = dict(zip(names, values))
+        config = copy.deepcopy(base)
+        for name, value in params.items():
+            set_parameter(config, name, value)
+        check_config(config)
+        output.append((params, config))
+    return output
+
+
+def successive_halving(configs, evaluate, min_budget, max_budget, eta=3):
+    """
+    Run successive halving on the given configurations.
+
+    Parameters
+    ----------
+    configs : list
+        configurations to compare
+
+    evaluate : callable
+        evaluate(config, budget) returns a score,
+        lower scores are better
+
+    min_budget : float
+        budget given to each configuration in the first round
+
+    max_budget : float
+        largest budget given to a configuration
+
+    eta : int
+        at each round only 1/eta configurations are promoted
+        and their budget is multiplied by eta
+
+    Returns
+    -------
+    ranking: list
+        (index, score, budget) tuples, sorted from the best
+        configuration. Configurations dropped in an earlier round
+        follow those that reached a later one.
+    """
+    alive = list(range(len(configs)))
+    budget = min_budget
+    ranking = []
+    while True:
+        scores = {i: evaluate(configs[i], budget) for i in alive}
+        alive.sort(key=lambda i: scores[i])
+
+        if budget >= max_budget:
+            keep = len(alive)
+        else:
+            keep = max(1, len(alive) // eta)
+
+        ranking = [(i, scores[i], budget) for i in alive[keep:]] + ranking
+        alive = alive[:keep]
+        if budget >= max_budget or keep == 1:
+            return [(i, scores[i], budget) for i in alive] + ranking
+
+        budget = min(budget * eta, max_budget)
+
+
+def quality_score(value, minimize):
+    if value is None:
+        return (math.inf,)
+    return (value if minimize else -value,)
+
+
+def time_to_target_score(value, elapsed, target, minimize):
+    quality = quality_score(value, minimize)
+    if value is None:
+        reached = False
+    elif minimize:
+        reached = value <= target
+    else:
+        reached = value >= target
+
+    if reached:
+        return (elapsed,) + quality
+    return (math.inf,) + quality
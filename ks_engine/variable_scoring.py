@@ -1,11 +1,9 @@
 #! /usr/bin/python
 
+from .lazy_import import LazyModule
 from .solution import Solution
 
-try:
-    import gurobipy
-except ImportError:
-    print("Gurobi not found: error ignored to allow tests")
+gurobipy = LazyModule("gurobipy")
 
 
 def variable_score_factory(sol: Solution, base_kernel: dict, config: dict):
@@ -1,17 +1,37 @@
 #! /usr/bin/python
 
 from argparse import ArgumentParser
+import sys
 
 import pandas as pd
 from matplotlib import pyplot as plt
 
+from ks_engine.progress_stream import read_events, Downsampler, DEF_MAX_POINTS
+
 
 def get_values(file):
     csv = pd.read_csv(file)
-    values = csv["value"]
+    # buckets skipped by LP screening have no value
+    values = csv["value"].dropna()
     return values.array.to_numpy()
 
 
+def bucket_values(events):
+    for event in events:
+        if event["event"] == "bucket" and event["value"] is not None:
+            yield event["value"]
+
+
+def get_stream_values(file, max_points):
+    sampler = Downsampler(max_points)
+    best = None
+    for events in read_events(file):
+        for value in bucket_values(events):
+            sampler.add(value)
+            best = value if best is None else min(best, value)
+    return sampler.points(), best
+
+
 def plot_values(values, log):
     if log:
         plt.semilogy(values)
@@ -19,19 +39,80 @@ def plot_values(values, log):
         plt.plot(values)
 
 
+def follow_values(file, log, max_points, interval):
+    plt.ion()
+    _, axes = plt.subplots()
+    if log:
+        axes.set_yscale("log")
+    (line,) = axes.plot([], [])
+    sampler = Downsampler(max_points)
+    best = None
+    for events in read_events(file, True, interval):
+        for value in bucket_values(events):
+            sampler.add(value)
+            best = value if best is None else min(best, value)
+
+        line.set_data(*sampler.points())
+        axes.relim()
+        axes.autoscale_view()
+        plt.pause(0.01)
+
+    print("Result:", best)
+    plt.ioff()
+
+
+def is_stream(file_name):
+    return file_name == "-" or file_name.endswith((".ndjson", ".jsonl"))
+
+
 def parse_args():
     parser = ArgumentParser()
-    parser.add_argument("file", help="ks.py log file")
+    parser.add_argument(
+        "file", help="ks.py log file or progress stream ('-' for stdin)"
+    )
     parser.add_argument("-l", "--log-scale", default=False, action="store_true")
     parser.add_argument("-o", "--output-file", default=None)
+    parser.add_argument(
+        "-f",
+        "--follow",
+        default=False,
+        action="store_true",
+        help="Update the plot while the progress stream grows",
+    )
+    parser.add_argument(
+        "-m",
+        "--max-points",
+        type=int,
+        default=DEF_MAX_POINTS,
+        help="Maximal number of plotted points for progress streams",
+    )
+    parser.add_argument("-i", "--interval", type=float, default=0.5)
     return parser.parse_args()
 
 
+def open_stream(file_name):
+    if file_name == "-":
+        return sys.stdin
+    return open(file_name)
+
+
 def main():
     args = parse_args()
-    values = get_values(args.file)
-    print("Result:", min(values))
-    plot_values(values, args.log_scale)
+    if args.follow:
+        with open_stream(args.file) as file:
+            follow_values(file, args.log_scale, args.max_points, args.interval)
+    elif is_stream(args.file):
+        with open_stream(args.file) as file:
+            (index, values), best = get_stream_values(file, args.max_points)
+        print("Result:", best)
+        plt.plot(index, values)
+        if args.log_scale:
+            plt.yscale("log")
+    else:
+        values = get_values(args.file)
+        print("Result:", min(values))
+        plot_values(values, args.log_scale)
+
     if args.output_file:
         plt.savefig(args.output_file)
     else:
@@ -0,0 +1,147 @@
+#! /usr/bin/python
+
+import io
+import json
+import math
+import os
+import unittest
+from os import path
+from tempfile import TemporaryDirectory
+
+from ks_engine.anytime import (
+    AnytimeReport,
+    Timeline,
+    oriented,
+    performance_profile,
+    primal_gap,
+    primal_integral,
+    profile_fraction,
+    time_to_target,
+    timeline_from_debug,
+    timeline_from_file,
+    timeline_from_stream,
+    timelines_from_store,
+)
+from ks_engine.results_store import ResultsStore
+
+
+class TestMetrics(unittest.TestCase):
+    def test_primal_gap(self):
+        self.assertEqual(primal_gap(None, 10), 1)
+        self.assertEqual(primal_gap(10, 10), 0)
+        self.assertEqual(primal_gap(-1, 10), 1)
+        self.assertAlmostEqual(primal_gap(12.5, 10), 0.2)
+
+    def test_primal_integral(self):
+        # gap 1 on [0, 2], 0.5 on [2, 4], 0 on [4, 10]
+        self.assertAlmostEqual(primal_integral([2, 4], [20, 10], 10, 10), 3)
+        self.assertAlmostEqual(primal_integral([], [], 10, 10), 10)
+        # worse incumbents do not change the step function
+        self.assertAlmostEqual(primal_integral([2, 3, 4], [20, 30, 10], 10, 10), 3)
+
+    def test_time_to_target(self):
+        self.assertEqual(time_to_target([1, 5, 9], [30, 11, 10], 11), 5)
+        self.assertTrue(math.isinf(time_to_target([1], [30], 11)))
+
+    def test_performance_profile(self):
+        measures = {
+            "a": {"x": 10, "y": 4, "z": 1},
+            "b": {"x": 20, "y": 2, "z": math.inf},
+        }
+        profile = performance_profile(measures)
+        self.assertEqual(profile["a"], [1, 1, 2])
+        self.assertEqual(profile["b"][:2], [1, 2])
+        self.assertTrue(math.isinf(profile["b"][2]))
+        self.assertAlmostEqual(profile_fraction(profile["b"], 1.5), 1 / 3)
+        self.assertEqual(performance_profile({}), {})
+
+    def test_oriented(self):
+        line = Timeline("x", "a", [1], [5], 2)
+        self.assertIs(oriented(line, True), line)
+        self.assertEqual(oriented(line, False).values, [-5])
+
+
+class TestAnytimeReport(unittest.TestCase):
+    def test_table(self):
+        report = AnytimeReport(
+            [
+                Timeline("x", "slow", [8], [10], 10),
+                Timeline("x", "fast", [2, 4], [20, 10], 10),
+                Timeline("y", "fast", [1], [5], 10),
+                Timeline("y", "slow", [], [], 10),
+            ]
+        )
+        self.assertEqual(report.references, {"x": 10, "y": 5})
+        rows = report.table([0.0])
+        self.assertEqual(report.table_header([0.0])[2], "primal_integral")
+        fast, slow = rows
+        self.assertEqual(fast[:2], ["fast", 2])
+        self.assertAlmostEqual(fast[2], (3 + 1) / 2)
+        self.assertEqual(fast[3], 1)
+        self.assertAlmostEqual(slow[2], (8 + 10) / 2)
+        self.assertEqual(slow[3], 0.5)
+
+    def test_references(self):
+        report = AnytimeReport([Timeline("x", "a", [2], [20], 10)], {"x": 10})
+        self.assertAlmostEqual(report.primal_integrals()["a"]["x"], 2 + 8 * 0.5)
+
+
+class TestTimelineSources(unittest.TestCase):
+    def test_stream(self):
+        events = [
+            {"event": "bucket", "elapsed": 1.0, "value": 12},
+            {"event": "incumbent", "time": 1.5, "value": 12},
+            {"event": "incumbent", "time": 3.0, "value": 11},
+            {"event": "bucket", "elapsed": 6.0, "value": None},
+            {"event": "finish", "value": 11},
+        ]
+        file = io.StringIO("".join(json.dumps(e) + "\n" for e in events))
+        line = timeline_from_stream(file, "x", "a")
+        self.assertEqual(line, Timeline("x", "a", [1.5, 3.0], [12, 11], 6.0))
+
+    def test_debug(self):
+        rows = [
+            "bucket,iteration,value,time,nodes,kernel_size,bucket_size,status",
+            "0,0,12,1.0,1,1,1,OPTIMAL",
+            "1,0,,2.0,1,1,1,LP_CUTOFF",
+            "2,0,13,1.0,1,1,1,OPTIMAL",
+            "3,0,9,0.5,1,1,1,OPTIMAL",
+        ]
+        line = timeline_from_debug(io.StringIO("\n".join(rows)), "x", "a")
+        self.assertEqual(line, Timeline("x", "a", [1.0, 4.5], [12, 9], 4.5))
+        line = timeline_from_debug(io.StringIO("\n".join(rows)), "x", "a", False)
+        self.assertEqual(line.values, [12, 13])
+
+        with TemporaryDirectory() as tmp_root:
+            os.mkdir(path.join(tmp_root, "conf-a"))
+            file_name = path.join(tmp_root, "conf-a", "inst.csv")
+            with open(file_name, "w") as file:
+                file.write("\n".join(rows))
+            line = timeline_from_file(file_name)
+        self.assertEqual((line.instance, line.config), ("inst", "conf-a"))
+
+    def test_store(self):
+        with TemporaryDirectory() as tmp_root:
+            store = ResultsStore(path.join(tmp_root, "results.db"))
+            run_id = store.start_run("dir/inst.mps", {"A": 1}, "hash", {})
+            store.conn.execute("UPDATE runs SET started = 0 WHERE id = ?", (run_id,))
+            store.incumbents = [(run_id, 2.0, 10, 0, 0), (run_id, 1.0, 12, -1, -1)]
+            store.finish_run(run_id, 10)
+            store.start_run("dir/other.mps", {"A": 1}, "hash", {})
+            (line,) = timelines_from_store(store)
+            store.close()
+        self.assertEqual(line.instance, "inst")
+        self.assertEqual(line.times, [1.0, 2.0])
+        self.assertEqual(line.values, [12, 10])
+        self.assertGreater(line.end, 2.0)
+
+    def test_store_sense(self):
+        with TemporaryDirectory() as tmp_root:
+            store = ResultsStore(path.join(tmp_root, "results.db"))
+            for value, minimize in [(10, True), (12, False)]:
+                run_id = store.start_run("inst.mps", {"A": minimize}, "hash", {})
+                store.incumbents = [(run_id, 1.0, value, 0, 0)]
+                store.finish_run(run_id, value, minimize)
+            lines = list(timelines_from_store(store))
+            store.close()
+        self.assertEqual([line.values for line in lines], [[10], [-12]])
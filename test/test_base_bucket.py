@@ -10,8 +10,10 @@ from secrets import randbelow
 from ks_engine.kernel_algorithms.base_bucket import (
     fixed_size_bucket,
     decresing_size_bucket,
+    adaptive_size_bucket,
 )
 from ks_engine.kernel_algorithms.base_sort import bucket_sort, cheb_sort
+from ks_engine.kernel_algorithms.graph_bucket import ConstraintGraph, graph_bucket
 from ks_engine.solution import Solution
 
 
@@ -123,5 +125,70 @@ class TestVariableSizeBucket(unittest.TestCase):
         self.assertEqual(count, 3)
 
 
+class TestAdaptiveSizeBucket(unittest.TestCase):
+    def test_fixed_time(self):
+        kernel, values = build_kernel_fixed_size()
+        buckets = adaptive_size_bucket(kernel, values, bucket_sort, {}, 10, size=4)
+        sizes = []
+        for bucket in buckets:
+            sizes.append(len(bucket))
+            buckets.update_size(10, "OPTIMAL")
+        self.assertEqual(sizes, [4, 4, 4, 4, 4, 4, 2])
+
+    def test_resize(self):
+        kernel, values = build_kernel_fixed_size()
+        buckets = adaptive_size_bucket(
+            kernel, values, bucket_sort, {}, 10, size=4, max_size=6
+        )
+        sizes = []
+        for bucket in buckets:
+            sizes.append(len(bucket))
+            if len(sizes) < 3:
+                buckets.update_size(0.1, "OPTIMAL")
+            else:
+                buckets.update_size(10, "TIME_LIMIT")
+        self.assertEqual(sizes, [4, 6, 6, 3, 1, 1, 1, 1, 1, 1, 1])
+
+    def test_count(self):
+        kernel, values = build_kernel_fixed_size()
+        buckets = adaptive_size_bucket(kernel, values, bucket_sort, {}, 10, count=2)
+        self.assertEqual(buckets.size, 13)
+
+        other = adaptive_size_bucket(kernel, values, bucket_sort, {}, 10, size=3)
+        buckets.carry_size(other)
+        self.assertEqual(buckets.size, 3)
+
+
+class TestGraphBucket(unittest.TestCase):
+    def build_graph(self):
+        names = "abcdef"
+        kernel = {k: False for k in names}
+        values = Solution(0, zip(names, [6, 5, 4, 3, 2, 1]))
+        matrix = [
+            [1, 0, 1, 0, 0, 0],
+            [0, 1, 0, 1, 0, 0],
+            [0, 0, 1, 0, 1, 0],
+        ]
+        return kernel, values, ConstraintGraph(names, matrix)
+
+    def test_shared_constraints(self):
+        kernel, values, graph = self.build_graph()
+        buckets = graph_bucket(kernel, values, bucket_sort, {}, graph, size=2)
+        self.assertEqual(list(buckets), [["a", "c"], ["b", "d"], ["e", "f"]])
+
+    def test_large_rows(self):
+        kernel, values, graph = self.build_graph()
+        buckets = graph_bucket(
+            kernel, values, bucket_sort, {}, graph, count=2, max_row_size=1
+        )
+        self.assertEqual(list(buckets), [["a", "b", "c"], ["d", "e", "f"]])
+
+    def test_skip_kernel(self):
+        kernel, values, graph = self.build_graph()
+        kernel["c"] = True
+        buckets = graph_bucket(kernel, values, bucket_sort, {}, graph, size=3)
+        self.assertEqual(list(buckets), [["a", "b", "d"], ["e", "f"]])
+
+
 if __name__ == "__main__":
     unittest.main()
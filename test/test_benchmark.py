@@ -0,0 +1,57 @@
+#! /usr/bin/python
+
+import os
+import tempfile
+import unittest
+
+from ks_engine.benchmark import (
+    BENCHMARKS,
+    Regression,
+    build_problem,
+    compare,
+    load_results,
+    machine_info,
+    run_benchmarks,
+    save_results,
+)
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_build_problem(self):
+        kernel, values = build_problem(1000)
+        self.assertEqual(len(kernel), 1000)
+        self.assertEqual(len(values.vars), 1000)
+        self.assertLess(sum(kernel.values()), 200)
+        self.assertEqual(build_problem(1000)[0], kernel)
+
+    def test_run(self):
+        reported = []
+        results = run_benchmarks(
+            sizes=[1000], repeat=1, report=lambda *args: reported.append(args)
+        )
+        self.assertEqual(list(results), list(BENCHMARKS))
+        for times in results.values():
+            self.assertEqual(list(times), ["1000"])
+            self.assertGreaterEqual(times["1000"], 0)
+        self.assertEqual(len(reported), len(BENCHMARKS))
+
+    def test_compare(self):
+        baseline = {"a": {"1000": 1.0, "10000": 0.0001}, "b": {"1000": 1.0}}
+        results = {
+            "a": {"1000": 1.5, "10000": 0.0005, "100000": 3.0},
+            "b": {"1000": 1.1},
+            "c": {"1000": 9.0},
+        }
+        self.assertEqual(
+            compare(results, baseline, 0.2), [Regression("a", 1000, 1.0, 1.5)]
+        )
+        self.assertEqual(compare(results, baseline, 0.6), [])
+
+    def test_save_load(self):
+        results = {"a": {"1000": 0.5}}
+        with tempfile.TemporaryDirectory() as tmp:
+            file_name = os.path.join(tmp, "baseline.json")
+            save_results(file_name, results)
+            loaded, machine = load_results(file_name)
+        self.assertEqual(loaded, results)
+        self.assertEqual(machine, machine_info())
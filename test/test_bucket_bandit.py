@@ -0,0 +1,151 @@
+#! /usr/bin/python
+
+from collections import namedtuple
+import unittest
+
+from ks_engine.kernel_algorithms.base_bucket import (
+    decresing_size_bucket,
+    fixed_size_bucket,
+)
+from ks_engine.kernel_algorithms.base_sort import bucket_sort, cheb_sort
+from ks_engine.config_loader import DEFAULT_CONF, check_config
+from ks_engine.kernel_algorithms.bucket_bandit import (
+    BucketArm,
+    BucketBandit,
+    bucket_bandit_factory,
+    improvement_reward,
+)
+from ks_engine.kernel_algorithms.graph_bucket import ConstraintGraph
+from ks_engine.kernel_search import new_buckets
+from ks_engine.solution import Solution
+
+Methods = namedtuple("Methods", ["bucket_builder", "bucket_sort"])
+Arm = namedtuple("Arm", ["name"])
+A, B, C = Arm("a"), Arm("b"), Arm("c")
+
+CONFIG = {
+    "BUCKET": "decrease",
+    "BUCKET_CONF": {"count": 6},
+    "BUCKET_SORTER": "cheb_bucket_sort",
+    "BUCKET_SORTER_CONF": {},
+}
+
+
+class TestBucketArm(unittest.TestCase):
+    def test_from_config(self):
+        arm = BucketArm.from_config({"BUCKET_SORTER": "base_bucket_sort"}, CONFIG)
+        self.assertIs(arm.builder, decresing_size_bucket)
+        self.assertIs(arm.sorter, bucket_sort)
+        self.assertEqual(arm.builder_conf, {"count": 6})
+        self.assertEqual(arm.name, "decrease/base_bucket_sort")
+
+        conf = {"BUCKET": "fixed", "BUCKET_CONF": {"size": 3}}
+        arm = BucketArm.from_config(conf, CONFIG)
+        self.assertIs(arm.builder, fixed_size_bucket)
+        self.assertEqual(arm.builder_conf, {"size": 3})
+
+    def test_builder_conf_required(self):
+        # the base BUCKET_CONF is not inherited by other builders
+        with self.assertRaisesRegex(ValueError, "requires a BUCKET_CONF"):
+            BucketArm.from_config({"BUCKET": "fixed"}, CONFIG)
+        config = {**CONFIG, "BUCKET_BANDIT": {"ARMS": [{"BUCKET": "fixed"}]}}
+        with self.assertRaisesRegex(ValueError, "requires a BUCKET_CONF"):
+            check_config({**DEFAULT_CONF, **config})
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            BucketArm("missing", "base_bucket_sort", {}, {})
+
+    def test_apply(self):
+        arm = BucketArm("fixed", "base_bucket_sort", {"size": 10}, {})
+        methods = Methods(decresing_size_bucket, cheb_sort)
+        methods, config = arm.apply(methods, CONFIG)
+        self.assertEqual(methods, Methods(fixed_size_bucket, bucket_sort))
+        self.assertEqual(config["BUCKET_CONF"], {"size": 10})
+        self.assertEqual(config["BUCKET"], "decrease")
+        self.assertEqual(CONFIG["BUCKET_CONF"], {"count": 6})
+
+
+class TestBucketBandit(unittest.TestCase):
+    def test_explore_then_exploit(self):
+        bandit = BucketBandit([A, B, C], exploration=0.1)
+        # the first iteration always runs the base arm
+        bandit.update(1.0)
+        self.assertEqual(bandit.select(), B)
+        bandit.update(5.0)
+        self.assertEqual(bandit.select(), C)
+        bandit.update(0.0)
+        for _ in range(5):
+            self.assertEqual(bandit.select(), B)
+            bandit.update(5.0)
+        self.assertEqual(bandit.counts, [1, 6, 1])
+        self.assertEqual(bandit.report(), "a: 1, b: 6, c: 1")
+
+    def test_exploration(self):
+        bandit = BucketBandit([A, B], exploration=1.0)
+        bandit.update(1.0)
+        bandit.select()
+        bandit.update(0.9)
+        picks = []
+        for _ in range(20):
+            picks.append(bandit.select())
+            bandit.update(1.0 if picks[-1] == A else 0.9)
+        self.assertIn(B, picks)
+        self.assertGreater(picks.count(A), picks.count(B))
+
+    def test_factory(self):
+        self.assertIsNone(bucket_bandit_factory(CONFIG))
+        config = {
+            **CONFIG,
+            "BUCKET_BANDIT": {
+                "ARMS": [{"BUCKET": "fixed", "BUCKET_CONF": {"size": 2}}],
+                "EXPLORATION": 0.5,
+            },
+        }
+        bandit = bucket_bandit_factory(config)
+        self.assertEqual(bandit.exploration, 0.5)
+        self.assertEqual(bandit.builders(), [decresing_size_bucket, fixed_size_bucket])
+
+
+class TestArmBuckets(unittest.TestCase):
+    def test_arms_with_graph(self):
+        names = "abcdefgh"
+        kernel = {k: k in "ab" for k in names}
+        values = Solution(0, zip(names, range(8, 0, -1)))
+        matrix = [
+            [1, 0, 1, 0, 1, 0, 0, 0],
+            [0, 1, 0, 1, 0, 1, 0, 0],
+            [0, 0, 0, 0, 1, 0, 1, 1],
+        ]
+        graph = ConstraintGraph(names, matrix)
+        config = {
+            **DEFAULT_CONF,
+            "BUCKET": "decrease",
+            "BUCKET_CONF": {"count": 2},
+            "BUCKET_BANDIT": {
+                "ARMS": [
+                    {"BUCKET": "fixed", "BUCKET_CONF": {"size": 2}},
+                    {"BUCKET": "graph", "BUCKET_CONF": {"size": 3}},
+                ]
+            },
+        }
+        check_config(config)
+        bandit = bucket_bandit_factory(config)
+        base = Methods(decresing_size_bucket, bucket_sort)
+
+        outside = sorted(k for k, v in kernel.items() if not v)
+        for arm in bandit.arms:
+            methods, bucket_config = arm.apply(base, config)
+            buckets = new_buckets(kernel, values, methods, bucket_config, graph)
+            variables = sorted(var for bucket in buckets for var in bucket)
+            self.assertEqual(variables, outside, arm.name)
+
+
+class TestReward(unittest.TestCase):
+    def test_reward(self):
+        self.assertAlmostEqual(improvement_reward(100, 90, 2, True), 0.05)
+        self.assertAlmostEqual(improvement_reward(100, 110, 2, False), 0.05)
+        self.assertEqual(improvement_reward(100, 100, 2, True), 0)
+        self.assertEqual(improvement_reward(None, 90, 2, True), 0)
+        # improvements are relative to at least one unit
+        self.assertAlmostEqual(improvement_reward(0.5, 0.0, 1, True), 0.5)
@@ -119,6 +119,18 @@ class TestConfigLoader(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "Configuration Error: BUCKET"):
             check_config(broken_conf)
 
+    def test_solver_profiles(self):
+        profiles = {"LP": {"Method": 2}, "BUCKET": {"MIPFocus": 1}}
+        check_config({**DEFAULT_CONF, "SOLVER_PROFILES": profiles})
+
+        broken_conf = {**DEFAULT_CONF, "SOLVER_PROFILES": {"BUCKETS": {}}}
+        with self.assertRaisesRegex(ValueError, "Unknown solver phase BUCKETS"):
+            check_config(broken_conf)
+
+        broken_conf = {**DEFAULT_CONF, "SOLVER_PROFILES": {"LP": 2}}
+        with self.assertRaises(ValueError):
+            check_config(broken_conf)
+
 
 if __name__ == "__main__":
     unittest.main()
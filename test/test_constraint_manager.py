@@ -0,0 +1,67 @@
+#! /usr/bin/python
+
+import unittest
+from os import path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+
+from ks_engine.constraint_manager import IISCache, kernel_fingerprint
+
+
+def build_model(name="model", fingerprint=42):
+    return SimpleNamespace(
+        ModelName=name, NumVars=4, NumConstrs=3, Fingerprint=fingerprint
+    )
+
+
+class TestKernelFingerprint(unittest.TestCase):
+    def test_fingerprint(self):
+        model = build_model()
+        kernel_a = {"a": True, "b": False, "c": False, "d": True}
+        kernel_b = {"d": True, "c": False, "b": False, "a": True}
+        kernel_c = {"a": False, "b": False, "c": False, "d": True}
+
+        fp_a = kernel_fingerprint(model, kernel_a)
+        self.assertEqual(fp_a, kernel_fingerprint(model, kernel_b))
+        self.assertNotEqual(fp_a, kernel_fingerprint(model, kernel_c))
+        self.assertNotEqual(fp_a, kernel_fingerprint(build_model("other"), kernel_a))
+        # same name and size, different coefficients
+        self.assertNotEqual(
+            fp_a, kernel_fingerprint(build_model(fingerprint=7), kernel_a)
+        )
+
+
+class TestIISCache(unittest.TestCase):
+    def test_memory_cache(self):
+        cache = IISCache()
+        self.assertIsNone(cache.get("key"))
+        cache.add("key", [True, False, True])
+        self.assertEqual(cache.get("key"), [True, False, True])
+
+    def test_max_size(self):
+        cache = IISCache(max_size=2)
+        cache.add("a", [True])
+        cache.add("b", [False])
+        cache.get("a")
+        cache.add("c", [True])
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), [True])
+        self.assertEqual(len(cache.store), 2)
+
+    def test_file_cache(self):
+        with TemporaryDirectory() as tmp_root:
+            file = path.join(tmp_root, "iis.pkl")
+            cache = IISCache(file)
+            cache.add("key", [False, True])
+
+            cache = IISCache(file)
+            self.assertEqual(cache.get("key"), [False, True])
+
+            cache = IISCache(file, max_size=1)
+            cache.add("other", [True, True])
+            cache = IISCache(file)
+            self.assertIsNone(cache.get("key"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -59,7 +59,11 @@ class BaseTest(unittest.TestCase):
         index = DebugIndex(0, 1)
         store.add_data(data, index)
 
-        expected = "bucket,iteration,value,time,nodes,kernel_size,bucket_size\n0,0,1,1,1,1,1\n1,0,1,1,1,1,1"
+        data = DebugData(None, 1, 0, 1, 1, "LP_INFEASIBLE")
+        index = DebugIndex(0, 2)
+        store.add_data(data, index)
+
+        expected = "bucket,iteration,value,time,nodes,kernel_size,bucket_size,status\n0,0,1,1,1,1,1,\n1,0,1,1,1,1,1,\n2,0,,1,0,1,1,LP_INFEASIBLE"
 
         return store, expected
 
@@ -0,0 +1,147 @@
+#! /usr/bin/python
+
+import threading
+import unittest
+
+from ks_engine.distributed import (
+    Coordinator,
+    Worker,
+    decode_mask,
+    decode_solution,
+    encode_mask,
+    encode_solution,
+)
+from ks_engine.solution import Solution
+
+NAMES = [f"x{i}" for i in range(20)]
+
+
+def fake_solver(task):
+    bucket = task["bucket"]
+    solution = {"value": len(bucket), "vars": {str(i): 1 for i in bucket}}
+    return {"status": "OPTIMAL", "solution": solution, "time": 0.1, "nodes": 1}
+
+
+def lying_solver(task):
+    result = fake_solver(task)
+    result["solution"]["value"] = -100
+    return result
+
+
+def broken_solver(task):
+    raise ConnectionAbortedError("worker lost")
+
+
+def start_worker(address, solver, names=NAMES):
+    worker = Worker(address, names, solver)
+
+    def run():
+        try:
+            worker.run()
+        except ConnectionAbortedError:
+            pass
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def submit_buckets(coordinator, count):
+    kernel = {name: i < 5 for i, name in enumerate(NAMES)}
+    ids = {}
+    for i in range(count):
+        bucket = NAMES[5 + i : 6 + 2 * i]
+        ids[coordinator.submit(kernel, bucket, None, None)] = bucket
+    return ids
+
+
+class TestEncoding(unittest.TestCase):
+    def test_mask(self):
+        mask = [i % 3 == 0 for i in range(21)]
+        self.assertEqual(list(decode_mask(encode_mask(mask), 21)), mask)
+
+    def test_solution(self):
+        index_of = {name: i for i, name in enumerate(NAMES)}
+        sol = Solution(3, ((name, i % 2) for i, name in enumerate(NAMES)))
+        data = encode_solution(sol, index_of)
+        self.assertEqual(len(data["vars"]), 10)
+
+        # keys become strings once sent as JSON
+        data["vars"] = {str(k): v for k, v in data["vars"].items()}
+        decoded = decode_solution(data, NAMES)
+        self.assertEqual(decoded.value, 3)
+        self.assertEqual(decoded.vars, sol.vars)
+
+
+class TestCoordinator(unittest.TestCase):
+    def test_workers(self):
+        coordinator = Coordinator(("127.0.0.1", 0), NAMES)
+        threads = [start_worker(coordinator.address, fake_solver) for _ in range(3)]
+
+        ids = submit_buckets(coordinator, 6)
+        for _ in range(len(ids)):
+            result = coordinator.next_result()
+            bucket = ids.pop(result["id"])
+            sol = coordinator.decode_solution(result)
+            self.assertEqual(sol.value, len(bucket))
+            for name in bucket:
+                self.assertEqual(sol.get_value(name), 1)
+        self.assertFalse(ids)
+
+        coordinator.close()
+        for thread in threads:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+    def test_worker_loss(self):
+        coordinator = Coordinator(("127.0.0.1", 0), NAMES)
+        broken = start_worker(coordinator.address, broken_solver)
+        ids = submit_buckets(coordinator, 4)
+        broken.join(5)
+
+        start_worker(coordinator.address, fake_solver)
+        results = {coordinator.next_result()["id"] for _ in ids}
+        self.assertEqual(results, set(ids))
+        coordinator.close()
+
+    def test_task_retries(self):
+        coordinator = Coordinator(("127.0.0.1", 0), NAMES, retries=1)
+        (task_id,) = submit_buckets(coordinator, 1)
+        for _ in range(2):
+            start_worker(coordinator.address, broken_solver).join(5)
+
+        result = coordinator.next_result()
+        self.assertEqual(result["id"], task_id)
+        self.assertEqual(result["status"], "WORKER_FAILED")
+        self.assertIsNone(coordinator.decode_solution(result))
+        self.assertTrue(coordinator.tasks.empty())
+        coordinator.close()
+
+    def test_objective_check(self):
+        objective = ({name: 1 for name in NAMES}, 0)
+        coordinator = Coordinator(("127.0.0.1", 0), NAMES, objective=objective)
+        start_worker(coordinator.address, fake_solver)
+        submit_buckets(coordinator, 1)
+        result = coordinator.next_result()
+        self.assertEqual(coordinator.decode_solution(result).value, 1)
+        coordinator.close()
+
+        coordinator = Coordinator(("127.0.0.1", 0), NAMES, objective=objective)
+        start_worker(coordinator.address, lying_solver)
+        submit_buckets(coordinator, 1)
+        result = coordinator.next_result()
+        self.assertEqual(result["solution"]["value"], -100)
+        self.assertIsNone(coordinator.decode_solution(result))
+        coordinator.close()
+
+    def test_reject_worker(self):
+        coordinator = Coordinator(("127.0.0.1", 0), NAMES)
+        thread = start_worker(coordinator.address, fake_solver, NAMES[:-1])
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(coordinator.worker_count(), 0)
+        coordinator.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+#! /usr/bin/python
+
+import unittest
+
+from ks_engine.early_stop import GRB_INFINITY, StopPolicy, stop_policy_factory
+from ks_engine.model import combine_callbacks
+from ks_engine.solution import Solution
+
+
+class TestStopPolicy(unittest.TestCase):
+    def test_stall_time(self):
+        policy = StopPolicy(stall_time=5)
+        self.assertIsNone(policy.check(GRB_INFINITY, -GRB_INFINITY, 3, 10))
+        self.assertEqual(policy.check(GRB_INFINITY, -GRB_INFINITY, 5, 10), "STALL_TIME")
+
+        policy = StopPolicy(stall_time=5)
+        self.assertIsNone(policy.check(10, 0, 4, 10))
+        self.assertIsNone(policy.check(9, 0, 8, 10))
+        self.assertIsNone(policy.check(9, 0, 12, 10))
+        self.assertEqual(policy.check(9, 0, 13, 10), "STALL_TIME")
+
+    def test_stall_nodes(self):
+        policy = StopPolicy(stall_nodes=100)
+        self.assertIsNone(policy.check(10, 0, 1, 50))
+        self.assertIsNone(policy.check(10, 0, 1, 149))
+        self.assertEqual(policy.check(10, 0, 1, 150), "STALL_NODES")
+
+    def test_bound(self):
+        policy = StopPolicy(100, True, bound_margin=0.01)
+        self.assertIsNone(policy.check(GRB_INFINITY, -GRB_INFINITY, 0, 0))
+        self.assertIsNone(policy.check(GRB_INFINITY, 98, 0, 0))
+        self.assertEqual(policy.check(GRB_INFINITY, 99.5, 0, 0), "BOUND_STOP")
+
+        policy = StopPolicy(100, False, bound_margin=0)
+        self.assertIsNone(policy.check(-GRB_INFINITY, 101, 0, 0))
+        self.assertEqual(policy.check(-GRB_INFINITY, 100, 0, 0), "BOUND_STOP")
+
+    def test_target(self):
+        policy = StopPolicy(-200, True, target=0.05)
+        self.assertIsNone(policy.check(-205, -300, 0, 0))
+        self.assertEqual(policy.check(-210, -300, 0, 0), "TARGET_REACHED")
+
+    def test_factory(self):
+        self.assertIsNone(stop_policy_factory({}, None, True, True))
+
+        conf = {"EARLY-STOP": {"STALL_TIME": 2, "BOUND_MARGIN": 0}}
+        policy = stop_policy_factory(conf, Solution(5, []), True, True)
+        self.assertEqual(policy.reference, 5)
+        self.assertEqual(policy.bound_margin, 0)
+        policy = stop_policy_factory(conf, Solution(5, []), False, True)
+        self.assertIsNone(policy.bound_margin)
+
+    def test_combine_callbacks(self):
+        calls = []
+        first = lambda model, where: calls.append(("a", where))
+        second = lambda model, where: calls.append(("b", where))
+        self.assertIsNone(combine_callbacks(None, None))
+        self.assertIs(combine_callbacks(first, None), first)
+        combine_callbacks(first, second)(None, 3)
+        self.assertEqual(calls, [("a", 3), ("b", 3)])
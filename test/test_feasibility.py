@@ -0,0 +1,140 @@
+#! /usr/bin/python
+
+import unittest
+from os import path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ks_engine.feasibility import (
+    FeasibilityChecker,
+    list_solution_files,
+    read_maximize,
+    read_mps,
+    row_bounds,
+)
+
+MPS_DATA = """NAME          TEST
+ROWS
+ N  COST
+ L  LIM1
+ G  LIM2
+ E  MYEQN
+COLUMNS
+    MARKER                 'MARKER'                 'INTORG'
+    X1        COST         1.0   LIM1         1.0
+    X1        LIM2         1.0
+    MARKER                 'MARKER'                 'INTEND'
+    X2        COST         2.0   LIM1         1.0
+    X2        MYEQN       -1.0
+    X3        COST        -1.0   MYEQN        1.0
+RHS
+    RHS       COST        -3.0
+    RHS       LIM1         4.0   LIM2         1.0
+    RHS       MYEQN        7.0
+RANGES
+    RNG       LIM1         2.5
+BOUNDS
+ UP BND       X1           4.0
+ MI BND       X2
+ UP BND       X3          10.0
+ENDATA
+"""
+
+
+class TestFeasibility(unittest.TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.mps_file = path.join(self.tmp.name, "test.mps")
+        with open(self.mps_file, "w") as file:
+            file.write(MPS_DATA)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_sol(self, name, values):
+        file_name = path.join(self.tmp.name, name)
+        with open(file_name, "w") as file:
+            print("# Objective value = 0", file=file)
+            for k, v in values.items():
+                print(k, v, file=file)
+        return file_name
+
+    def test_read_mps(self):
+        mip = read_mps(self.mps_file)
+        self.assertEqual(mip.var_names, ["X1", "X2", "X3"])
+        self.assertEqual(mip.obj_constant, 3.0)
+        self.assertEqual(list(mip.integer), [True, False, False])
+        self.assertEqual(list(mip.lower), [0, -np.inf, 0])
+        self.assertEqual(list(mip.upper), [4, np.inf, 10])
+        self.assertEqual(list(mip.row_lower), [1.5, 1, 7])
+        self.assertEqual(list(mip.row_upper), [4, np.inf, 7])
+        self.assertEqual(
+            mip.matrix.toarray().tolist(), [[1, 1, 0], [1, 0, 0], [0, -1, 1]]
+        )
+
+    def test_read_maximize(self):
+        self.assertFalse(read_maximize(self.mps_file))
+        self.assertFalse(read_mps(self.mps_file).maximize)
+        for sense in ["OBJSENSE MAX\n", "OBJSENSE\n    MAXIMIZE\n"]:
+            file_name = path.join(self.tmp.name, "max.mps")
+            with open(file_name, "w") as file:
+                file.write(MPS_DATA.replace("ROWS\n", sense + "ROWS\n"))
+            self.assertTrue(read_maximize(file_name))
+            self.assertTrue(read_mps(file_name).maximize)
+
+    def test_row_bounds(self):
+        self.assertEqual(row_bounds("E", 2, None), (2, 2))
+        self.assertEqual(row_bounds("E", 2, -1), (1, 2))
+        self.assertEqual(row_bounds("E", 2, 1), (2, 3))
+        self.assertEqual(row_bounds("G", 2, -1), (2, 3))
+        self.assertEqual(row_bounds("L", 2, None), (-np.inf, 2))
+
+    def test_check(self):
+        checker = FeasibilityChecker.from_file(self.mps_file)
+        result = checker.check({"X1": 2, "X2": 0, "X3": 7})
+        self.assertTrue(result.feasible)
+        self.assertEqual(result.objective, 2 - 7 + 3)
+
+        result = checker.check({"X1": 2.5, "X2": 0, "X3": 7})
+        self.assertFalse(result.feasible)
+        self.assertAlmostEqual(result.max_integrality_violation, 0.5)
+        self.assertEqual(result.max_row_violation, 0)
+
+        result = checker.check({"X1": 5, "X2": 0, "X3": 7})
+        self.assertFalse(result.feasible)
+        self.assertEqual(result.max_bound_violation, 1)
+        self.assertEqual(result.max_row_violation, 1)
+
+        with self.assertRaises(ValueError):
+            checker.check({"Y": 1})
+
+    def test_check_files(self):
+        checker = FeasibilityChecker.from_file(self.mps_file)
+        good = self.write_sol("a.sol", {"X1": 1, "X2": 1, "X3": 8})
+        bad = self.write_sol("b.sol", {"X1": 1, "X2": 1, "X3": 7})
+        results = checker.check_files([good, bad])
+        self.assertEqual([r.feasible for r in results], [True, False])
+        self.assertEqual(results[1].max_row_violation, 1)
+        self.assertIsNone(results[0].error)
+        self.assertEqual(list_solution_files(self.tmp.name), [good, bad])
+        self.assertEqual(list_solution_files(good), [good])
+
+    def test_check_files_error(self):
+        checker = FeasibilityChecker.from_file(self.mps_file)
+        unknown = self.write_sol("a.sol", {"X1": 1, "Y": 1})
+        good = self.write_sol("b.sol", {"X1": 1, "X2": 1, "X3": 8})
+        results = checker.check_files([unknown, good])
+        self.assertFalse(results[0].feasible)
+        self.assertIn("Y", results[0].error)
+        self.assertTrue(results[1].feasible)
+        self.assertEqual(results[1].objective, 1 + 2 - 8 + 3)
+
+    def test_binary_bound(self):
+        file_name = path.join(self.tmp.name, "bv.mps")
+        bounds = " BV BND       X1           1\n BV X3\n"
+        with open(file_name, "w") as file:
+            file.write(MPS_DATA.replace(" UP BND       X1           4.0\n", bounds))
+        mip = read_mps(file_name)
+        self.assertEqual(list(mip.integer), [True, False, True])
+        self.assertEqual(list(mip.upper), [1, np.inf, 10])
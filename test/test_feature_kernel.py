@@ -0,0 +1,80 @@
+#! /usr/bin/python
+
+import unittest
+from unittest import mock
+
+from ks_engine.feature_kernel import (
+    BisectionSizeSearch,
+    FEASIBLE,
+    INFEASIBLE,
+    TIME_OUT,
+    generate_bisection_solutions,
+)
+
+
+class TestBisectionSizeSearch(unittest.TestCase):
+    def test_first_size(self):
+        search = BisectionSizeSearch(10, 1000, 0.01)
+        self.assertEqual(search.next_size(), 10)
+
+    def test_bisection(self):
+        search = BisectionSizeSearch(10, 1000, 0.01)
+        search.update(search.next_size(), INFEASIBLE)
+        self.assertEqual(search.next_size(), 505)
+        search.update(505, FEASIBLE)
+        self.assertEqual(search.next_size(), 257)
+        search.update(257, INFEASIBLE)
+        self.assertEqual(search.next_size(), 381)
+
+    def test_converge(self):
+        boundary = 321
+        search = BisectionSizeSearch(10, 1000, 0.01)
+        for _ in range(20):
+            size = search.next_size()
+            stat = FEASIBLE if size >= boundary else INFEASIBLE
+            search.update(size, stat)
+
+        self.assertTrue(search.converged())
+        self.assertLessEqual(abs(search.boundary() - boundary), search.tolerance)
+
+        for _ in range(50):
+            size = search.next_size()
+            self.assertLessEqual(abs(size - boundary), 2 * search.tolerance)
+
+    def test_size_bounds(self):
+        search = BisectionSizeSearch(5000, 100, 0.01)
+        self.assertEqual(search.next_size(), 100)
+
+
+class TestBisectionTimeOut(unittest.TestCase):
+    def run_time_out(self, min_time, max_time):
+        calls = []
+
+        def solve_sub_model(model, config, selected):
+            calls.append((1000 - len(selected), config.get("TIME_LIMIT")))
+            return None, TIME_OUT
+
+        config = {"FEATURE_KERNEL": {}}
+        var_names = {f"x{i}": False for i in range(1000)}
+        with mock.patch(
+            "ks_engine.feature_kernel.solve_sub_model", side_effect=solve_sub_model
+        ):
+            solutions = generate_bisection_solutions(
+                None, config, var_names, 5, 10, min_time, max_time
+            )
+        self.assertEqual(solutions, {})
+        return calls
+
+    def test_time_out_at_cap(self):
+        calls = self.run_time_out(1, 2)
+        self.assertEqual([t for _, t in calls], [1, 2, 2, 2, 2])
+        # once the time limit is at its cap the bracket moves up
+        self.assertEqual([s for s, _ in calls], [10, 500, 750, 875, 937])
+
+    def test_time_out_without_limit(self):
+        calls = self.run_time_out(None, None)
+        self.assertEqual([s for s, _ in calls], [10, 505, 752, 876, 938])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+#! /usr/bin/python
+
+import math
+import unittest
+
+import numpy as np
+from scipy import sparse
+
+from ks_engine.feasibility import MIPData
+from ks_engine.first_order_lp import approximate_lp_solution, solve_lp
+
+
+def build_lp(maximize=False):
+    # min -x - y + z/2  s.t.  x + 2y <= 4,  3x + y <= 6,  0 <= x, y <= 10
+    # optimum x = 1.6, y = 1.2
+    sign = 1 if maximize else -1
+    return MIPData(
+        var_names=["x", "y", "z"],
+        objective=np.array([sign, sign, -0.5 * sign]),
+        obj_constant=1.0,
+        maximize=maximize,
+        matrix=sparse.csr_matrix([[1, 2, 0], [3, 1, 0]]),
+        row_lower=np.array([-math.inf, -math.inf]),
+        row_upper=np.array([4.0, 6.0]),
+        lower=np.zeros(3),
+        upper=np.full(3, 10.0),
+        integer=np.array([True, True, True]),
+    )
+
+
+class TestFirstOrderLP(unittest.TestCase):
+    def test_minimize(self):
+        result = solve_lp(build_lp(), tolerance=1e-8)
+        self.assertAlmostEqual(result.objective, -1.8, places=5)
+        self.assertAlmostEqual(result.dual_bound, -1.8, places=5)
+        np.testing.assert_allclose(result.primal, [1.6, 1.2, 0], atol=1e-5)
+        self.assertLessEqual(result.error, 1e-8)
+
+    def test_maximize(self):
+        result = solve_lp(build_lp(True), tolerance=1e-8)
+        self.assertAlmostEqual(result.objective, 3.8, places=5)
+        self.assertAlmostEqual(result.dual_bound, 3.8, places=5)
+
+    def test_iteration_limit(self):
+        result = solve_lp(build_lp(), tolerance=1e-8, iterations=10)
+        self.assertEqual(result.iterations, 10)
+
+    def test_kernel_values(self):
+        base, values, start = approximate_lp_solution(
+            build_lp(), {"TOLERANCE": 1e-8}
+        )
+        self.assertEqual(base, {"x": True, "y": True, "z": False})
+        self.assertAlmostEqual(values.value, -1.8, places=5)
+        self.assertAlmostEqual(values.get_value("x"), 1.6, places=5)
+        # z is out of the base: its value is the reduced cost
+        self.assertAlmostEqual(values.get_value("z"), 0.5, places=5)
+        self.assertAlmostEqual(start.value, -1.8, places=5)
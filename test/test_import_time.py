@@ -0,0 +1,29 @@
+#! /usr/bin/python
+
+import subprocess
+import sys
+import unittest
+
+HEAVY_MODULES = ["numpy", "gurobipy", "sklearn", "scipy", "importlib.metadata"]
+
+IMPORT_SCRIPT = f"""
+import sys
+import ks_engine
+loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+print(",".join(loaded))
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    def test_no_heavy_imports(self):
+        out = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(out.stdout.strip(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
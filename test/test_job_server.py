@@ -0,0 +1,122 @@
+#! /usr/bin/python
+
+import asyncio
+import threading
+import time
+import unittest
+
+from ks_engine.job_server import JobServer, job_config, start_server, submit
+from ks_engine.solution import Solution
+
+
+def fake_runner(job, emit):
+    for value in [10, 7]:
+        emit({"event": "incumbent", "value": value})
+    if job.instance == "slow":
+        while not job.control.cancelled():
+            time.sleep(0.01)
+        return None
+    if job.instance == "broken":
+        raise ValueError("broken instance")
+    return Solution(7, [("x", 1)])
+
+
+def submit_in_thread(address, request, events, started=None):
+    def run():
+        for event in submit(address, request):
+            events.append((event["event"], time.time()))
+            if started and event["event"] == "started":
+                started.set()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestJobServer(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.job_server = JobServer(fake_runner, workers=1, queue_size=4)
+        self.server = self.loop.run_until_complete(start_server(self.job_server))
+        self.address = self.server.sockets[0].getsockname()[:2]
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.server.close()
+        self.job_server.close()
+        self.loop.close()
+
+    def test_stream(self):
+        events = list(submit(self.address, {"instance": "a", "solution": True}))
+        names = [e["event"] for e in events]
+        self.assertEqual(
+            names, ["queued", "started", "incumbent", "incumbent", "finish"]
+        )
+        self.assertEqual([e["value"] for e in events[2:]], [10, 7, 7])
+        self.assertEqual(events[-1]["solution"], {"x": 1})
+        self.assertFalse(events[-1]["cancelled"])
+
+    def test_deadline(self):
+        events = list(submit(self.address, {"instance": "slow", "deadline": 0.1}))
+        self.assertEqual(events[-1]["event"], "finish")
+        self.assertIsNone(events[-1]["value"])
+        self.assertTrue(events[-1]["cancelled"])
+
+    def test_errors(self):
+        events = list(submit(self.address, {"instance": "broken"}))
+        self.assertEqual(events[-1], {"event": "error", "message": "broken instance"})
+
+        events = list(submit(self.address, {"config": "missing instance"}))
+        self.assertEqual(events[-1]["event"], "error")
+
+    def test_single_worker(self):
+        slow, fast = [], []
+        started = threading.Event()
+        thread = submit_in_thread(
+            self.address, {"instance": "slow", "deadline": 0.3}, slow, started
+        )
+        self.assertTrue(started.wait(5))
+        fast_thread = submit_in_thread(self.address, {"instance": "a"}, fast)
+        thread.join(5)
+        fast_thread.join(5)
+
+        slow_events = dict(slow)
+        fast_events = dict(fast)
+        self.assertEqual(fast[-1][0], "finish")
+        # the second job waits in the queue until the worker is free
+        self.assertLess(fast_events["queued"], slow_events["finish"])
+        self.assertGreaterEqual(fast_events["started"], slow_events["finish"])
+
+    def test_queue_full(self):
+        self.job_server.queue_size = 1
+        events = []
+        started = threading.Event()
+        thread = submit_in_thread(
+            self.address, {"instance": "slow", "deadline": 0.3}, events, started
+        )
+        self.assertTrue(started.wait(5))
+        rejected = list(submit(self.address, {"instance": "a"}))
+        self.assertEqual(rejected, [{"event": "error", "message": "queue full"}])
+        thread.join(5)
+        self.assertEqual(events[-1][0], "finish")
+
+    def test_close(self):
+        job_server = JobServer(fake_runner, workers=1)
+        blocker = threading.Event()
+        running = job_server.executor.submit(blocker.wait, 5)
+        queued = job_server.executor.submit(time.sleep, 0)
+        job_server.futures.update([running, queued])
+        job_server.close()
+        self.assertTrue(queued.cancelled())
+        blocker.set()
+        self.assertTrue(running.result())
+
+    def test_job_config(self):
+        config = job_config({"ITERATIONS": 3})
+        self.assertEqual(config["ITERATIONS"], 3)
+        self.assertEqual(config["BUCKET"], "fixed")
+        with self.assertRaises(ValueError):
+            job_config({"ITERATIONS": "three"})
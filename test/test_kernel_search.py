@@ -5,7 +5,15 @@
 import unittest
 from string import ascii_letters, ascii_lowercase, ascii_uppercase
 
-from ks_engine.kernel_search import select_vars, update_kernel
+from ks_engine.kernel_search import (
+    select_vars,
+    update_kernel,
+    SubProblemCache,
+    sub_problem_key,
+    build_sub_problem_result,
+    restore_sub_problem_result,
+    run_with_global_time_limit,
+)
 from ks_engine import model
 from ks_engine.solution import Solution
 
@@ -53,5 +61,95 @@ class TestBucketSelection(unittest.TestCase):
         return kernel, first_bucket
 
 
+class TestSubProblemCache(unittest.TestCase):
+    def test_lru(self):
+        cache = SubProblemCache(2)
+        cache.add("a", 1)
+        cache.add("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.add("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(cache.misses, 1)
+
+    def test_key(self):
+        kernel = {"a": True, "b": False, "c": True}
+        sol = Solution(12, [])
+        key = sub_problem_key(kernel, ["b"], True, sol)
+
+        self.assertEqual(key, sub_problem_key(dict(kernel), ["b"], True, sol))
+        self.assertNotEqual(key, sub_problem_key(kernel, ["a"], True, sol))
+        self.assertNotEqual(key, sub_problem_key(kernel, ["b"], False, sol))
+        self.assertNotEqual(key, sub_problem_key(kernel, ["b"], True, None))
+        kernel["b"] = True
+        self.assertNotEqual(key, sub_problem_key(kernel, ["b"], True, sol))
+
+    def test_result(self):
+        kernel = {"a": True, "b": True, "c": False}
+        sol = Solution(5, [("a", 2), ("b", 0), ("c", 0)])
+        result = build_sub_problem_result("OPTIMAL", sol)
+        self.assertEqual(result.variables, {"a": 2})
+
+        prev = Solution(8, [("a", 0), ("b", 1), ("c", 0)])
+        restored = restore_sub_problem_result(result, kernel, prev)
+        self.assertIs(restored, prev)
+        self.assertEqual(restored.value, 5)
+        self.assertEqual(restored.vars, {"a": 2, "b": 0, "c": 0})
+
+        result = build_sub_problem_result("CUTOFF", None)
+        self.assertIsNone(result.value)
+
+
+class FakeGurobiModel:
+    def __init__(self):
+        self.params = {}
+
+    def copy(self):
+        return self
+
+    def setParam(self, name, value):
+        self.params[name] = value
+
+
+class FakeSolverModel:
+    def __init__(self, phase_time_limit=None):
+        self.phase_time_limit = phase_time_limit
+        self.time_limit = None
+
+    def set_time_limit(self, time_limit):
+        self.time_limit = time_limit
+
+    def run(self):
+        return True
+
+
+class TestGlobalTimeLimit(unittest.TestCase):
+    def test_phase_time_limit(self):
+        config = {"PRELOAD": False, "SOLVER_PROFILES": {"BUCKET": {"TimeLimit": 5}}}
+        solver = model.Model(FakeGurobiModel(), config, phase="BUCKET")
+        self.assertEqual(solver.phase_time_limit, 5)
+        self.assertEqual(solver.model.params, {"TimeLimit": 5})
+        solver = model.Model(FakeGurobiModel(), config, phase="KERNEL")
+        self.assertIsNone(solver.phase_time_limit)
+
+    def test_remaining_time(self):
+        # TIME_LIMIT does not cap the solves: they get the remaining time
+        solver = FakeSolverModel()
+        stat, remaining = run_with_global_time_limit(solver, 100)
+        self.assertTrue(stat)
+        self.assertEqual(solver.time_limit, 100)
+        self.assertLessEqual(remaining, 100)
+
+        solver = FakeSolverModel(5)
+        run_with_global_time_limit(solver, 100)
+        self.assertEqual(solver.time_limit, 5)
+        solver = FakeSolverModel(500)
+        run_with_global_time_limit(solver, 100)
+        self.assertEqual(solver.time_limit, 100)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,75 @@
+#! /usr/bin/python
+
+import unittest
+from os import path
+from tempfile import TemporaryDirectory
+from urllib.request import urlopen
+
+from ks_engine.metrics import MetricsServer, RunMetrics, TextfileWriter
+from ks_engine.solution import DebugData, DebugIndex, DebugInfo
+
+
+def parse_metrics(text):
+    output = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        name, value = line.rsplit(" ", 1)
+        output[name] = float(value)
+    return output
+
+
+def build_metrics():
+    metrics = RunMetrics({"GLOBAL_TIME_LIMIT": 100}, lp_bound=8)
+    logger = DebugInfo([metrics])
+    logger.add_data(DebugData(12, 1.5, 3, 40, 5, "OPTIMAL"), DebugIndex(0, 0))
+    logger.add_data(DebugData(None, 0.5, 0, 40, 5, "LP_CUTOFF"), DebugIndex(0, 1))
+    logger.add_data(DebugData(10, 2, 9, 45, 5, "OPTIMAL"), DebugIndex(0, 2))
+    logger.add_incumbent(10, DebugIndex(0, 2))
+    return metrics
+
+
+class TestRunMetrics(unittest.TestCase):
+    def test_render(self):
+        text = build_metrics().render()
+        self.assertTrue(text.endswith("# EOF\n"))
+        values = parse_metrics(text)
+        self.assertEqual(values["ks_incumbent"], 10)
+        self.assertAlmostEqual(values["ks_gap_ratio"], 0.2)
+        self.assertEqual(values["ks_time_left_seconds"], 100)
+        self.assertEqual(values["ks_kernel_size"], 45)
+        self.assertEqual(values['ks_buckets_total{status="OPTIMAL"}'], 2)
+        self.assertEqual(values['ks_buckets_total{status="LP_CUTOFF"}'], 1)
+        self.assertEqual(values["ks_solver_seconds_total"], 4)
+
+    def test_no_incumbent(self):
+        metrics = RunMetrics({"GLOBAL_TIME_LIMIT": -1})
+        values = parse_metrics(metrics.render())
+        self.assertNotIn("ks_incumbent", values)
+        self.assertNotIn("ks_time_left_seconds", values)
+
+    def test_server(self):
+        metrics = build_metrics()
+        server = MetricsServer(metrics)
+        metrics.listeners.append(server)
+        host, port = server.address
+        with urlopen(f"http://{host}:{port}/metrics") as response:
+            self.assertIn("openmetrics-text", response.headers["Content-Type"])
+            values = parse_metrics(response.read().decode())
+        self.assertEqual(values["ks_incumbent"], 10)
+        metrics.finish(9)
+
+    def test_textfile(self):
+        metrics = build_metrics()
+        with TemporaryDirectory() as tmp_root:
+            file = path.join(tmp_root, "ks.prom")
+            metrics.listeners.append(TextfileWriter(metrics, file, 3600))
+            metrics.notify()
+            metrics.finish(9)
+            with open(file) as data:
+                values = parse_metrics(data.read())
+            self.assertEqual(values["ks_incumbent"], 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
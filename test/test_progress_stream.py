@@ -0,0 +1,72 @@
+#! /usr/bin/python
+
+import io
+import json
+import unittest
+from os import path
+from tempfile import TemporaryDirectory
+
+from ks_engine.progress_stream import Downsampler, ProgressStream, read_events
+from ks_engine.solution import DebugData, DebugIndex, DebugInfo
+
+
+class TestProgressStream(unittest.TestCase):
+    def test_stream(self):
+        with TemporaryDirectory() as tmp_root:
+            file_name = path.join(tmp_root, "progress.ndjson")
+            stream = ProgressStream(file_name)
+            logger = DebugInfo([stream])
+            logger.add_data(DebugData(5, 1, 2, 3, 4, "OPTIMAL"), DebugIndex(0, 0))
+            logger.add_incumbent(5, DebugIndex(0, 0))
+            logger.add_data(DebugData(None, 1, 0, 3, 4, "LP_CUTOFF"), DebugIndex(0, 1))
+            stream.finish(5)
+
+            with open(file_name) as file:
+                lines = [json.loads(line) for line in file]
+
+        self.assertEqual(
+            [line["event"] for line in lines],
+            ["bucket", "incumbent", "bucket", "finish"],
+        )
+        self.assertEqual(lines[0]["value"], 5)
+        self.assertEqual(lines[0]["status"], "OPTIMAL")
+        self.assertEqual(lines[1]["bucket"], 0)
+        self.assertIsNone(lines[2]["value"])
+
+    def test_read_events(self):
+        data = io.StringIO(
+            'Iteration: 0\n{"event": "bucket", "value": 3}\nOPTIMAL\n'
+            '{"event": "finish", "value": 3}\n'
+        )
+        batches = list(read_events(data, follow=True, interval=0))
+        self.assertEqual(len(batches), 1)
+        self.assertEqual([e["event"] for e in batches[0]], ["bucket", "finish"])
+
+    def test_partial_line(self):
+        data = io.StringIO('{"event": "bucket", "value": 3}\n{"event": "fin')
+        events = [e for batch in read_events(data) for e in batch]
+        self.assertEqual(len(events), 1)
+
+
+class TestDownsampler(unittest.TestCase):
+    def test_bounded(self):
+        sampler = Downsampler(100)
+        for i in range(100000):
+            sampler.add(i)
+        index, values = sampler.points()
+        self.assertLessEqual(len(values), 100)
+        self.assertGreater(len(values), 50)
+        self.assertEqual(index, values)
+        self.assertEqual(index[0], 0)
+        steps = {b - a for a, b in zip(index, index[1:])}
+        self.assertEqual(len(steps), 1)
+
+    def test_small(self):
+        sampler = Downsampler(100)
+        for i in range(10):
+            sampler.add(i)
+        self.assertEqual(sampler.points(), (list(range(10)), list(range(10))))
+
+
+if __name__ == "__main__":
+    unittest.main()
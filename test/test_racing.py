@@ -0,0 +1,105 @@
+#! /usr/bin/python
+
+import multiprocessing as mp
+import unittest
+
+from ks_engine.kernel_search import is_better, is_proven_optimal, publish_incumbent
+from ks_engine.racing import IncumbentStore, check_racers
+from ks_engine.solution import Solution
+
+
+def offer_values(store, values):
+    for value in values:
+        store.offer(value, {"x": value}, True)
+
+
+class TestIncumbentStore(unittest.TestCase):
+    def test_offer(self):
+        with mp.Manager() as manager:
+            store = IncumbentStore(manager)
+            self.assertIsNone(store.best())
+            self.assertTrue(store.offer(10, {"x": 1}, True))
+            self.assertFalse(store.offer(12, {"x": 2}, True))
+            self.assertTrue(store.offer(8, {"x": 3}, True))
+
+            best = store.best()
+            self.assertEqual(best.value, 8)
+            self.assertEqual(best.vars, {"x": 3})
+
+    def test_shared(self):
+        with mp.Manager() as manager:
+            store = IncumbentStore(manager)
+            procs = [
+                mp.Process(target=offer_values, args=(store, range(i, 20, 3)))
+                for i in range(3)
+            ]
+            for proc in procs:
+                proc.start()
+            for proc in procs:
+                proc.join()
+
+            self.assertEqual(store.get_value(), 0)
+            self.assertEqual(store.best().vars, {"x": 0})
+
+    def test_stop(self):
+        with mp.Manager() as manager:
+            store = IncumbentStore(manager)
+            self.assertFalse(store.stopped())
+            store.stop()
+            self.assertTrue(store.stopped())
+
+    def test_target(self):
+        with mp.Manager() as manager:
+            store = IncumbentStore(manager, 5)
+            store.offer(7, {"x": 1}, True)
+            self.assertFalse(store.stopped())
+            store.offer(5, {"x": 2}, True)
+            self.assertTrue(store.stopped())
+
+
+class FakeModel:
+    def getAttr(self, name):
+        return 1
+
+
+class FakeInstance:
+    def __init__(self, store, lp_bound):
+        self.incumbent_store = store
+        self.preload_model = FakeModel()
+        self.lp_bound = lp_bound
+
+
+class TestPublishIncumbent(unittest.TestCase):
+    def test_lp_bound(self):
+        solution = Solution(10, [("x", 1)])
+        with mp.Manager() as manager:
+            # no valid bound when the LP was not solved to optimality
+            store = IncumbentStore(manager)
+            publish_incumbent(FakeInstance(store, None), solution)
+            self.assertEqual(store.get_value(), 10)
+            self.assertFalse(store.stopped())
+
+            store = IncumbentStore(manager)
+            publish_incumbent(FakeInstance(store, 10), solution)
+            self.assertTrue(store.stopped())
+
+
+class TestRacingHelpers(unittest.TestCase):
+    def test_is_better(self):
+        self.assertTrue(is_better(1, 2, True))
+        self.assertFalse(is_better(2, 2, True))
+        self.assertTrue(is_better(3, 2, False))
+
+    def test_proven_optimal(self):
+        self.assertFalse(is_proven_optimal(10, None))
+        self.assertTrue(is_proven_optimal(10, 10 - 1e-8))
+        self.assertFalse(is_proven_optimal(10, 9))
+
+    def test_check_racers(self):
+        check_racers([({"PRESOLVE": True}, None), ({"PRESOLVE": True}, None)])
+        with self.assertRaisesRegex(ValueError, "PRESOLVE"):
+            check_racers([({"PRESOLVE": True}, None), ({"PRESOLVE": False}, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
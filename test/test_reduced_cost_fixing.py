@@ -0,0 +1,147 @@
+#! /usr/bin/python
+
+from collections import deque
+import unittest
+
+from ks_engine.kernel_search import (
+    KernelSearchInstance,
+    proven_lp_bound,
+    solve_buckets_distributed,
+)
+from ks_engine.reduced_cost_fixing import ReducedCostFixing
+from ks_engine.solution import Solution
+
+
+class FakeModel:
+    def getAttr(self, name):
+        return 1
+
+
+class FakeScore:
+    def get_probability(self):
+        return 0
+
+    def success_update_score(self, kernel, bucket):
+        pass
+
+    def failure_update_score(self, kernel, bucket):
+        pass
+
+
+class FakeCoordinator:
+    """
+    Return the results, given by bucket, in submission order.
+    """
+
+    def __init__(self, results):
+        self.results = results
+        self.submitted = deque()
+        self.count = 0
+
+    def capacity(self):
+        return 2
+
+    def submit(self, kernel, bucket, cutoff, start, time_limit=None):
+        self.count += 1
+        self.submitted.append((self.count, tuple(bucket)))
+        return self.count
+
+    def next_result(self):
+        task_id, bucket = self.submitted.popleft()
+        solution = self.results[bucket]
+        return {
+            "id": task_id,
+            "status": "OPTIMAL",
+            "time": 1,
+            "nodes": 1,
+            "solution": solution,
+        }
+
+    def decode_solution(self, result):
+        return result["solution"]
+
+
+class TestReducedCostFixing(unittest.TestCase):
+    def test_minimize(self):
+        fixing = ReducedCostFixing({"a": 5, "b": 2, "c": 0.5, "d": -3}, 10, True, 8)
+        self.assertEqual(fixing.update(20), [])
+        self.assertEqual(fixing.update(14), ["a"])
+        self.assertEqual(sorted(fixing.update(11)), ["b"])
+        # a worse incumbent fixes nothing
+        self.assertEqual(fixing.update(15), [])
+        self.assertEqual(fixing.fixed, {"a", "b"})
+
+    def test_maximize(self):
+        fixing = ReducedCostFixing({"a": -5, "b": 2}, 10, False, 2)
+        self.assertEqual(fixing.update(6), ["a"])
+        self.assertEqual(fixing.update(9.9), [])
+
+    def test_filter(self):
+        fixing = ReducedCostFixing({"a": 5, "b": 4}, 0, True, 4)
+        kernel = {"a": False, "b": False, "c": False, "d": True}
+        self.assertIs(fixing.free_kernel(kernel), kernel)
+        fixing.update(3)
+
+        self.assertEqual(fixing.filter_bucket(["a", "c"]), ["c"])
+        self.assertEqual(fixing.filter_bucket(["a", "b"]), [])
+        self.assertEqual(fixing.free_kernel(kernel), {"c": False, "d": True})
+        self.assertEqual(fixing.removed_vars, 3)
+        self.assertEqual(fixing.skipped_buckets, 1)
+        self.assertIn("2 variables fixed (50.0%)", fixing.report())
+
+    def test_unfixed(self):
+        fixing = ReducedCostFixing({"a": 5}, 0, True, 2)
+        fixing.update(3)
+        self.assertEqual(fixing.unfixed(["a", "b"]), ["b"])
+        self.assertEqual(fixing.removed_vars, 0)
+
+
+class FakeLP:
+    def __init__(self, optimal):
+        self.optimal = optimal
+        self.model = Solution(10, [])
+        self.model.objVal = 10
+
+    def is_optimal(self):
+        return self.optimal
+
+
+class TestLPBound(unittest.TestCase):
+    def test_proven_bound(self):
+        self.assertEqual(proven_lp_bound(FakeLP(True)), 10)
+        # a time limited LP objective is not a bound
+        self.assertIsNone(proven_lp_bound(FakeLP(False)))
+
+
+class TestDistributedFixing(unittest.TestCase):
+    def test_fixed_after_submission(self):
+        names = "abcde"
+        kernel = {k: k == "a" for k in names}
+        # the first result allows fixing 'c', sent with the second bucket
+        results = {
+            ("b",): Solution(3, [(k, 0) for k in names]),
+            ("c", "d"): Solution(2, [(k, 0) for k in names]),
+            ("e",): None,
+        }
+        coordinator = FakeCoordinator(results)
+        fixing = ReducedCostFixing({"c": 5}, 0, True, len(names))
+        config = {"GLOBAL_TIME_LIMIT": -1, "TIME_LIMIT": -1}
+        instance = KernelSearchInstance(
+            FakeModel(),
+            None,
+            kernel,
+            [["b"], ["c", "d"], ["e"]],
+            Solution(100, []),
+            None,
+            config,
+            FakeScore(),
+            None,
+            FakeScore(),
+            coordinator=coordinator,
+            fixing=fixing,
+        )
+        list(solve_buckets_distributed(instance, 0))
+        self.assertEqual(fixing.fixed, {"c"})
+        self.assertEqual(
+            kernel, {"a": True, "b": True, "c": False, "d": True, "e": False}
+        )
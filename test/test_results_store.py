@@ -0,0 +1,124 @@
+#! /usr/bin/python
+
+import sqlite3
+import unittest
+from os import path
+from tempfile import TemporaryDirectory
+
+from ks_engine.results_store import (
+    ResultsStore,
+    RunRecorder,
+    config_hash,
+    run_recorder_factory,
+)
+from ks_engine.solution import DebugData, DebugIndex, DebugInfo
+
+
+def add_run(store, instance, config, best, minimize=True):
+    run_id = store.start_run(instance, config, instance + "-hash", {})
+    recorder = RunRecorder(store, run_id)
+    logger = DebugInfo([recorder])
+    for i in range(5):
+        logger.add_data(DebugData(best + i, 1, 2, 3, 4, "OPTIMAL"), DebugIndex(0, i))
+    logger.add_incumbent(best, DebugIndex(0, 4))
+    store.finish_run(run_id, best, minimize)
+    return run_id
+
+
+class TestResultsStore(unittest.TestCase):
+    def test_store(self):
+        with TemporaryDirectory() as tmp_root:
+            file = path.join(tmp_root, "results.db")
+            store = ResultsStore(file, batch_size=3)
+            conf_a = {"BUCKET": "fixed"}
+            conf_b = {"BUCKET": "decrease"}
+            add_run(store, "inst-a", conf_a, 10)
+            add_run(store, "inst-a", conf_a, 12)
+            run_id = add_run(store, "inst-a", conf_b, 8)
+            add_run(store, "inst-b", conf_b, 3)
+            store.close()
+
+            store = ResultsStore(file)
+            rows = store.conn.execute(
+                "SELECT COUNT(*) FROM buckets WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            self.assertEqual(rows[0], 5)
+            rows = store.conn.execute(
+                "SELECT value, iteration, bucket FROM incumbents WHERE run_id = ?",
+                (run_id,),
+            ).fetchall()
+            self.assertEqual(rows, [(8, 0, 4)])
+
+            compare = store.compare("inst-a")
+            self.assertEqual(len(compare), 2)
+            self.assertEqual(compare[0][1], config_hash(conf_b))
+            self.assertEqual(compare[1][2:5], (2, 10, 11))
+
+            self.assertEqual(store.get_config(config_hash(conf_a)[:8]), conf_a)
+            self.assertEqual(len(store.runs()), 4)
+            store.close()
+
+    def test_compare_maximize(self):
+        with TemporaryDirectory() as tmp_root:
+            store = ResultsStore(path.join(tmp_root, "results.db"))
+            conf_a = {"BUCKET": "fixed"}
+            conf_b = {"BUCKET": "decrease"}
+            add_run(store, "inst", conf_a, 10, False)
+            add_run(store, "inst", conf_a, 6, False)
+            add_run(store, "inst", conf_b, 9, False)
+            first, second = store.compare()
+            store.close()
+        self.assertEqual(first[1:5], (config_hash(conf_b), 1, 9, 9))
+        self.assertEqual(second[1:5], (config_hash(conf_a), 2, 10, 8))
+
+    def test_upgrade_schema(self):
+        with TemporaryDirectory() as tmp_root:
+            file = path.join(tmp_root, "results.db")
+            conn = sqlite3.connect(file)
+            conn.execute(
+                "CREATE TABLE runs (id INTEGER PRIMARY KEY, instance TEXT, instance_hash TEXT, config TEXT, config_hash TEXT, versions TEXT, started REAL, finished REAL, best_value REAL)"
+            )
+            conn.execute(
+                "INSERT INTO runs VALUES (1, 'inst', 'h', '{}', 'c', '{}', 0, 1, 5)"
+            )
+            conn.commit()
+            conn.close()
+
+            store = ResultsStore(file)
+            add_run(store, "inst", {"A": 1}, 3)
+            compare = store.compare()
+            store.close()
+        self.assertEqual([row[3] for row in compare], [3, 5])
+
+    def test_recorder_start(self):
+        config = {"GLOBAL_TIME_LIMIT": 60}
+        with TemporaryDirectory() as tmp_root:
+            config["RESULTS_DB"] = path.join(tmp_root, "results.db")
+            instance = path.join(tmp_root, "inst.mps")
+            with open(instance, "w") as file:
+                file.write("NAME inst\n")
+            recorder = run_recorder_factory(config, instance)
+            # later changes, as from initialize, are not recorded
+            config["GLOBAL_TIME_LIMIT"] = 30
+            logger = DebugInfo([recorder], recorder.started)
+            logger.add_incumbent(5, DebugIndex(0, 0))
+            recorder.set_minimize(False)
+            recorder.finish(5)
+
+            store = ResultsStore(config["RESULTS_DB"])
+            (run,) = store.runs()
+            stored = store.conn.execute("SELECT config, minimize FROM runs").fetchone()
+            store.close()
+        self.assertEqual(run[3], recorder.started)
+        self.assertEqual(logger.begin, recorder.started)
+        self.assertIn('"GLOBAL_TIME_LIMIT": 60', stored[0])
+        self.assertEqual(stored[1], 0)
+
+    def test_config_hash(self):
+        self.assertEqual(
+            config_hash({"a": 1, "b": {"c": 2}}), config_hash({"b": {"c": 2}, "a": 1})
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
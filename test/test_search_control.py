@@ -0,0 +1,48 @@
+#! /usr/bin/python
+
+import time
+import unittest
+
+from ks_engine.search_control import SearchControl
+
+
+class FakeModel:
+    def __init__(self):
+        self.terminated = 0
+
+    def terminate(self):
+        self.terminated += 1
+
+
+class TestSearchControl(unittest.TestCase):
+    def test_cancel(self):
+        control = SearchControl()
+        model = FakeModel()
+        with control.running(model):
+            self.assertFalse(control.cancelled())
+            control.cancel()
+        self.assertTrue(control.cancelled())
+        self.assertEqual(model.terminated, 1)
+
+        # no model is running anymore
+        control.cancel()
+        self.assertEqual(model.terminated, 1)
+
+    def test_cancelled_before_run(self):
+        control = SearchControl()
+        control.cancel()
+        model = FakeModel()
+        with control.running(model):
+            pass
+        self.assertEqual(model.terminated, 1)
+
+    def test_deadline(self):
+        control = SearchControl(deadline=60)
+        control.set_deadline(0.05)
+        time.sleep(0.2)
+        self.assertTrue(control.cancelled())
+
+        control = SearchControl(deadline=0.05)
+        control.close()
+        time.sleep(0.2)
+        self.assertFalse(control.cancelled())
@@ -4,10 +4,22 @@
 
 
 import unittest
+from unittest import mock
 
 from ks_engine.kernel_algorithms.algorithm_selection import Selector
 
 
+class FakeEntryPoint:
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+        self.loaded = 0
+
+    def load(self):
+        self.loaded += 1
+        return self.value
+
+
 class TestSelector(unittest.TestCase):
     def test_selector(self):
         sel = Selector({"a": 1, "b": 2, "c": 3}, 4)
@@ -22,6 +34,28 @@ class TestSelector(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "algorithm a is already installed"):
             sel.add_algorithm("a", 34)
 
+    def test_entry_points(self):
+        entry_points = [FakeEntryPoint("x", 10), FakeEntryPoint("y", 20)]
+        sel = Selector({"a": 1}, 1, "test.group")
+        with mock.patch(
+            "ks_engine.kernel_algorithms.algorithm_selection.find_entry_points",
+            return_value=entry_points,
+        ) as find:
+            self.assertEqual(sel.get_algorithm("a"), 1)
+            find.assert_not_called()
+
+            self.assertEqual(sel.get_algorithm("y"), 20)
+            self.assertEqual(sel.get_algorithm("y"), 20)
+            self.assertIsNone(sel.get_algorithm("z"))
+            find.assert_called_with("test.group")
+
+        self.assertEqual(entry_points[0].loaded, 0)
+        self.assertEqual(entry_points[1].loaded, 1)
+
+    def test_no_entry_points(self):
+        sel = Selector({"a": 1}, 1)
+        self.assertIsNone(sel.get_algorithm("b"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+#! /usr/bin/python
+
+import math
+import os
+import tempfile
+import unittest
+
+from ks_engine.solution import DebugData, DebugIndex
+from ks_engine.solver_trace import (
+    GRB_INFINITY,
+    SeriesRecorder,
+    SolverTrace,
+    load_trace,
+    solver_trace_factory,
+)
+
+
+def debug_data(value, time, nodes):
+    return DebugData(value, time, nodes, 10, 2, "OPTIMAL")
+
+
+class TestSolverTrace(unittest.TestCase):
+    def test_recorder(self):
+        recorder = SeriesRecorder(interval=2)
+        recorder.add(0.5, GRB_INFINITY, -GRB_INFINITY, 0)
+        self.assertEqual(recorder.next_sample, 2.5)
+        recorder.add(3, 10, 2, 100)
+        series = recorder.series()
+        self.assertEqual(series.shape, (2, 4))
+        self.assertTrue(math.isnan(series[0, 1]))
+        self.assertTrue(math.isnan(series[0, 2]))
+        self.assertEqual(list(series[1]), [3, 10, 2, 100])
+
+    def test_summary(self):
+        trace = SolverTrace("trace.npz")
+        recorder = trace.recorder()
+        recorder.add(0, GRB_INFINITY, 0, 0)
+        recorder.add(1, 12, 5, 10)
+        recorder.add(2, 8, 6, 50)
+        recorder.add(5, 8, 7, 300)
+        trace.add(DebugIndex(0, 1), recorder, debug_data(8, 20, 1000), 7.5)
+
+        recorder = trace.recorder()
+        trace.add(DebugIndex(0, 2), recorder, debug_data(None, 4, 10))
+
+        first, second = trace.summary()
+        self.assertEqual(first.index, DebugIndex(0, 1))
+        self.assertEqual((first.time, first.best_time), (20, 2))
+        self.assertEqual((first.samples, first.value), (5, 8))
+        self.assertEqual((second.time, second.best_time, second.samples), (4, 4, 1))
+        self.assertTrue(math.isnan(second.value))
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            file_name = os.path.join(tmp, "trace.npz")
+            trace = SolverTrace(file_name)
+            recorder = trace.recorder()
+            recorder.add(1, 3, 2, 10)
+            trace.add(DebugIndex(2, 3), recorder, debug_data(3, 4, 20), 2.5)
+            trace.save()
+
+            loaded = load_trace(file_name)
+        self.assertEqual(list(loaded), [DebugIndex(2, 3)])
+        self.assertEqual(
+            loaded[DebugIndex(2, 3)].tolist(), [[1, 3, 2, 10], [4, 3, 2.5, 20]]
+        )
+
+    def test_factory(self):
+        self.assertIsNone(solver_trace_factory({}))
+        trace = solver_trace_factory({"SOLVER_TRACE": True})
+        self.assertEqual(trace.file_name, "solver-trace.npz")
+        trace = solver_trace_factory({"SOLVER_TRACE": {"FILE": "t.npz", "INTERVAL": 5}})
+        self.assertEqual((trace.file_name, trace.interval), ("t.npz", 5))
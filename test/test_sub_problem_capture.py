@@ -0,0 +1,96 @@
+#! /usr/bin/python
+
+import os
+import tempfile
+import unittest
+
+from ks_engine.config_loader import DEFAULT_CONF
+from ks_engine.distributed import decode_mask, decode_solution, names_fingerprint
+from ks_engine.solution import DebugData, DebugIndex, Solution
+from ks_engine.sub_problem_capture import (
+    SubProblemCapture,
+    list_captures,
+    load_capture,
+    parse_param,
+    replay_task,
+    sub_problem_capture_factory,
+)
+
+NAMES = ["a", "b", "c", "d"]
+
+
+def debug_data(time):
+    return DebugData(10, time, 5, 2, 1, "TIME_LIMIT")
+
+
+class TestSubProblemCapture(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, "captures")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build_capture(self, min_time=None, selected=()):
+        return SubProblemCapture(
+            self.directory, "inst.mps", NAMES, DEFAULT_CONF, min_time, selected
+        )
+
+    def test_selection(self):
+        capture = self.build_capture()
+        self.assertTrue(capture.is_selected(DebugIndex(0, 0), debug_data(0.1)))
+
+        capture = self.build_capture(min_time=60, selected=[[1, 2]])
+        self.assertFalse(capture.is_selected(DebugIndex(0, 0), debug_data(10)))
+        self.assertTrue(capture.is_selected(DebugIndex(0, 0), debug_data(60)))
+        self.assertTrue(capture.is_selected(DebugIndex(1, 2), debug_data(1)))
+
+    def test_save_load(self):
+        capture = self.build_capture()
+        kernel = {"a": True, "b": False, "c": True, "d": True}
+        start = Solution(10, [("a", 1), ("b", 0), ("c", 0), ("d", 2)])
+        file_name = capture.save(
+            DebugIndex(1, 2), kernel, ["c", "d"], 10, start, 30, debug_data(45)
+        )
+
+        (found,) = list_captures(self.directory)
+        self.assertEqual(found, file_name)
+        data = load_capture(file_name)
+        self.assertEqual(data["instance"], os.path.abspath("inst.mps"))
+        self.assertEqual(data["names"], names_fingerprint(NAMES))
+        self.assertEqual(list(decode_mask(data["kernel"], 4)), list(kernel.values()))
+        self.assertEqual(data["bucket"], [2, 3])
+        self.assertEqual(data["cutoff"], 10)
+        self.assertEqual(data["time_limit"], 30)
+        self.assertEqual(decode_solution(data["start"], NAMES).vars, start.vars)
+        self.assertEqual(data["captured"]["time"], 45)
+        self.assertEqual(data["config"]["PRESOLVE"], False)
+        self.assertNotIn("SOLVER_PROFILES", data["config"])
+
+    def test_bucket_profile(self):
+        profiles = {"LP": {"Method": 2}, "BUCKET": {"MIPFocus": 1}}
+        config = {**DEFAULT_CONF, "SOLVER_PROFILES": profiles}
+        capture = SubProblemCapture(self.directory, "inst.mps", NAMES, config)
+        self.assertEqual(capture.config["SOLVER_PROFILES"], {"BUCKET": {"MIPFocus": 1}})
+
+    def test_replay_task(self):
+        capture = {"start": {"value": 1, "vars": {}}, "cutoff": 1, "time_limit": 5}
+        self.assertEqual(replay_task(capture), capture)
+        task = replay_task(capture, 10, start=False, cutoff=False)
+        self.assertEqual(task, {"start": None, "cutoff": None, "time_limit": 10})
+        self.assertEqual(capture["time_limit"], 5)
+
+    def test_parse_param(self):
+        self.assertEqual(parse_param("Threads=4"), ("Threads", 4))
+        self.assertEqual(parse_param("MIPGap=0.01"), ("MIPGap", 0.01))
+        self.assertEqual(parse_param("NodefileDir=/tmp"), ("NodefileDir", "/tmp"))
+        with self.assertRaises(ValueError):
+            parse_param("Threads")
+
+    def test_factory(self):
+        self.assertIsNone(sub_problem_capture_factory({}, "inst.mps", {}))
+        config = {**DEFAULT_CONF, "CAPTURE": {"DIR": self.directory, "MIN_TIME": 5}}
+        capture = sub_problem_capture_factory(config, "inst.mps", dict.fromkeys(NAMES))
+        self.assertEqual(capture.names, NAMES)
+        self.assertEqual(capture.min_time, 5)
+        self.assertTrue(os.path.isdir(self.directory))
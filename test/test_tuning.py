@@ -0,0 +1,85 @@
+#! /usr/bin/python
+
+import math
+import unittest
+
+from ks_engine.config_loader import DEFAULT_CONF
+from ks_engine.tuning import (
+    build_configs,
+    set_parameter,
+    successive_halving,
+    quality_score,
+    time_to_target_score,
+)
+
+
+class TestBuildConfigs(unittest.TestCase):
+    def test_set_parameter(self):
+        conf = {"BUCKET_CONF": {"size": 10}}
+        set_parameter(conf, "BUCKET_CONF.count", 4)
+        set_parameter(conf, "KERNEL_CONF.percentage", 0.5)
+        set_parameter(conf, "TIME_LIMIT", 5)
+        self.assertEqual(
+            conf,
+            {
+                "BUCKET_CONF": {"size": 10, "count": 4},
+                "KERNEL_CONF": {"percentage": 0.5},
+                "TIME_LIMIT": 5,
+            },
+        )
+
+    def test_grid(self):
+        space = {"BUCKET": ["fixed", "decrease"], "BUCKET_CONF.count": [2, 4, 6]}
+        configs = build_configs(DEFAULT_CONF, space)
+        self.assertEqual(len(configs), 6)
+        for params, conf in configs:
+            self.assertEqual(conf["BUCKET"], params["BUCKET"])
+            self.assertEqual(conf["BUCKET_CONF"]["count"], params["BUCKET_CONF.count"])
+        self.assertEqual(DEFAULT_CONF["BUCKET_CONF"], {"size": 10})
+
+    def test_sample(self):
+        space = {"BUCKET_CONF.count": list(range(10)), "TIME_LIMIT": [1, 2]}
+        configs = build_configs(DEFAULT_CONF, space, 5, seed=1)
+        self.assertEqual(len(configs), 5)
+
+    def test_wrong_config(self):
+        with self.assertRaisesRegex(ValueError, "Configuration Error: BUCKET"):
+            build_configs(DEFAULT_CONF, {"BUCKET": [1]})
+
+
+class TestSuccessiveHalving(unittest.TestCase):
+    def test_halving(self):
+        calls = []
+
+        def evaluate(config, budget):
+            calls.append((config, budget))
+            return (config,)
+
+        configs = [5, 3, 8, 1, 7, 2, 6, 0, 4]
+        ranking = successive_halving(configs, evaluate, 1, 9, 3)
+
+        self.assertEqual(len(ranking), len(configs))
+        self.assertEqual(configs[ranking[0][0]], 0)
+        self.assertEqual(ranking[0][2], 3)
+        budgets = [budget for _, budget in calls]
+        self.assertEqual(budgets, [1] * 9 + [3] * 3)
+        # configurations dropped later are ranked first
+        self.assertEqual([configs[i] for i, _, _ in ranking[:3]], [0, 1, 2])
+
+    def test_max_budget(self):
+        def evaluate(config, budget):
+            return (config,)
+
+        ranking = successive_halving(list(range(9)), evaluate, 1, 2, 3)
+        self.assertEqual([i for i, _, _ in ranking[:3]], [0, 1, 2])
+        self.assertEqual([b for _, _, b in ranking], [2] * 3 + [1] * 6)
+
+    def test_scores(self):
+        self.assertEqual(quality_score(None, True), (math.inf,))
+        self.assertLess(quality_score(10, False), quality_score(5, False))
+        self.assertEqual(time_to_target_score(10, 3, 12, True), (3, 10))
+        self.assertEqual(time_to_target_score(13, 3, 12, True), (math.inf, 13))
+
+
+if __name__ == "__main__":
+    unittest.main()